@@ -12,7 +12,8 @@ def parse_args():
     """Parse command line arguments for the cleaner script.
 
     Returns:
-        Namespace object containing datafile_type and verbose arguments.
+        Namespace object containing datafile_type, jobs, chunksize, force and verbose
+        arguments.
     """
     parser = argparse.ArgumentParser(
         description="Clean and anti-symmetrize raw AMRO data from a QD USA PPMS ACT Option."
@@ -24,6 +25,24 @@ def parse_args():
         choices=[".dat", ".csv"],
         help="File extension of raw data files (default: .dat)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to clean files in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Stream each raw file this many rows at a time to bound memory use "
+        "(default: read whole files)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-clean every raw file, even those unchanged since they were last cleaned",
+    )
     parser.add_argument(
         "--verbose", action="store_true", help="Print detailed processing info"
     )
@@ -38,13 +57,22 @@ def main():
     """
     args = parse_args()
 
-    cleaner = AMROCleaner(datafile_type=args.datafile_type, verbose=args.verbose)
+    cleaner = AMROCleaner(
+        datafile_type=args.datafile_type,
+        verbose=args.verbose,
+        chunksize=args.chunksize,
+    )
 
     print("Cleaning raw data files...")
-    cleaner.clean_data_from_folder()
+    cleaner.clean_data_from_folder(workers=args.jobs, force=args.force)
 
     exp_labels = cleaner.get_experiment_labels()
     print(f"\nProcessed {len(exp_labels)} experiments: {exp_labels}")
+    failed_files = cleaner.get_failed_files()
+    if len(failed_files) > 0:
+        print(f"Failed to clean {len(failed_files)} files:")
+        for fn, error in failed_files.items():
+            print(f"  {fn}: {error}")
     print("Cleaned files saved to processed data folder.")
 
 
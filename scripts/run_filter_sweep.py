@@ -0,0 +1,101 @@
+import argparse
+import itertools
+from amro import AMROFitter, AMROLoader
+
+
+def parse_args():
+    """Parse command line arguments for the fit filter sweep.
+
+    Returns:
+        Namespace object containing the filter grid and fitting arguments.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--project-name", required=True, help="Project file name")
+    parser.add_argument(
+        "--min-amp-ratios",
+        nargs="+",
+        type=float,
+        default=[0.075],
+        help="Minimum amplitude ratios to sweep (default: 0.075)",
+    )
+    parser.add_argument(
+        "--max-freqs",
+        nargs="+",
+        type=int,
+        default=[8],
+        help="Maximum frequencies to sweep (default: 8)",
+    )
+    parser.add_argument(
+        "--force-symmetry",
+        nargs="+",
+        choices=["on", "off"],
+        default=["on"],
+        help="Whether to always include 2-fold and 4-fold terms (default: on)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to fit oscillations (default: 1)",
+    )
+    parser.add_argument(
+        "--solver",
+        default="lmfit",
+        choices=["lmfit", "least_squares", "linear"],
+        help="Fitting backend (default: lmfit)",
+    )
+    parser.add_argument(
+        "--warm-start",
+        default=None,
+        choices=["temperature", "field"],
+        help="Fit oscillations in order along temperature or field sweeps, starting "
+        "each fit from its neighbour's parameters (default: off)",
+    )
+    parser.add_argument(
+        "--fit-cache",
+        action="store_true",
+        help="Reuse stored fits of oscillations whose data and model are unchanged",
+    )
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args()
+
+
+def get_filter_grid(args):
+    """Build the filter grid from the parsed arguments.
+
+    Args:
+        args: Namespace returned by parse_args().
+
+    Returns:
+        List of (min_amp_ratio, max_freq, force_four_and_two_sym) tuples covering
+        every combination of the swept values.
+    """
+    force_symmetry = [mode == "on" for mode in args.force_symmetry]
+    return list(itertools.product(args.min_amp_ratios, args.max_freqs, force_symmetry))
+
+
+def main():
+    """Fit a project under every combination of fit filter settings.
+
+    Loads the project, which must already have Fourier results, fits each distinct
+    model once and writes one long-format table of the results.
+    """
+    args = parse_args()
+
+    loader = AMROLoader(args.project_name, verbose=args.verbose)
+    project_data = loader.load_amro()
+
+    fitter = AMROFitter(
+        project_data,
+        verbose=args.verbose,
+        n_jobs=args.jobs,
+        solver=args.solver,
+        warm_start=args.warm_start,
+        fit_cache=args.fit_cache,
+    )
+    sweep_df = fitter.fit_filter_sweep(get_filter_grid(args))
+    print(f"{len(sweep_df)} fit results tabulated.")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,42 @@ def parse_args():
         "--no-force-symmetry", action="store_false", dest="force_symmetry"
     )
     parser.add_argument("--save-name", default=None)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to fit oscillations (default: 1)",
+    )
+    parser.add_argument(
+        "--solver",
+        default="lmfit",
+        choices=["lmfit", "least_squares", "linear"],
+        help="Fitting backend (default: lmfit)",
+    )
+    parser.add_argument(
+        "--warm-start",
+        default=None,
+        choices=["temperature", "field"],
+        help="Fit oscillations in order along temperature or field sweeps, starting "
+        "each fit from its neighbour's parameters (default: off)",
+    )
+    parser.add_argument(
+        "--fit-cache",
+        action="store_true",
+        help="Reuse stored fits of oscillations whose data and model are unchanged",
+    )
+    parser.add_argument(
+        "--refit",
+        action="store_true",
+        help="Refit oscillations that already have fit results",
+    )
+    parser.add_argument(
+        "--fourier-method",
+        default="fft",
+        choices=["fft", "nudft"],
+        help="Fourier transform: FFT, or non-uniform DFT at the measured angles "
+        "(default: fft)",
+    )
     parser.add_argument("--verbose", action="store_true")
     parser.add_argument("--plot", action="store_true")
     return parser.parse_args()
@@ -28,7 +64,7 @@ def check_geometry_defaults(project_data, verbose=True):
     """Warn if any experiment has default geometry values."""
     warnings_issued = []
     for exp_label in project_data.get_experiment_labels():
-        exp = project_data.experiments_dict[exp_label]
+        exp = project_data.get_experiment(exp_label)
         if exp.wire_sep == 1 or exp.cross_section == 1:
             msg = (
                 f"WARNING: Experiment '{exp_label}' has default geometry values "
@@ -58,7 +94,9 @@ def main():
     if args.verbose:
         print(project_data.get_summary_statistics())
     if not args.fit_only:
-        fourier = Fourier(project_data, verbose=args.verbose)
+        fourier = Fourier(
+            project_data, verbose=args.verbose, method=args.fourier_method
+        )
         fourier.fourier_transform_experiments()
         project_data.save_fourier_results_to_csv()
         if args.verbose:
@@ -70,10 +108,14 @@ def main():
             max_freq=args.max_freq,
             force_four_and_two_sym=args.force_symmetry,
             verbose=args.verbose,
+            n_jobs=args.jobs,
+            solver=args.solver,
+            warm_start=args.warm_start,
+            fit_cache=args.fit_cache,
+            if_save_file_exists_overwrite=args.refit,
         )
         experiments = list(project_data.get_experiment_labels())
-        for exp_label in experiments:
-            fitter.fit_act_experiment(exp_label)
+        fitter.fit_experiments(experiments)
     print(project_data.get_summary_statistics())
 
 
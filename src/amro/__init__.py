@@ -10,9 +10,11 @@ from .models.fitter import AMROFitter
 from .data.data_structures import (
     OscillationKey,
     FitResult,
+    CompactFitResult,
     ExperimentalData,
     FourierResult,
     Experiment,
+    PackedOscillations,
 )
 
 __all__ = [
@@ -22,7 +24,9 @@ __all__ = [
     "AMROFitter",
     "OscillationKey",
     "FitResult",
+    "CompactFitResult",
     "ExperimentalData",
     "FourierResult",
     "Experiment",
+    "PackedOscillations",
 ]
@@ -38,6 +38,9 @@ __all__ = [
     "HEADER_MEAN",
     "HEADER_FIT_RED_CHISQ",
     "HEADER_FIT_CHISQ",
+    "HEADER_FIT_MIN_AMP_RATIO",
+    "HEADER_FIT_MAX_FREQ",
+    "HEADER_FIT_FORCE_SYM",
     "HEADER_PHASE_RAW",
     "HEADER_RES_DEL_0DEG_NORM_PCT",
     "HEADER_RES_UOHM",
@@ -57,6 +60,12 @@ __all__ = [
     "HEADER_TEMP_RAW",
     "HEADER_MAGNET_RAW_OE_ABS",
     "CLEANER_SAVE_FN_SUFFIX",
+    "CLEANER_MANIFEST_FN",
+    "PROJECT_STORE_DIR_SUFFIX",
+    "PROJECT_STORE_INDEX_FN",
+    "FIT_CACHE_DIR_NAME",
+    "SOURCE_FILES_FN_SUFFIX",
+    "FIT_SWEEP_FN_SUFFIX",
     "HEADER_EXPERIMENT_PREFIX",
     "HEADER_CROSS_SECTION",
     "CLEANER_HEADER_LENGTH",
@@ -70,8 +79,10 @@ __all__ = [
     "CLEANER_WIRE_SEP_COORD",
     "CLEANER_T_MIN_RESOLUTION",
     "CLEANER_DROP_COLS",
+    "CLEANER_RAW_COL_DTYPES",
     "CLEANER_ANG_CHANGE_THRESH",
     "CLEANER_TEMP_STABLE_THRESH",
     "CLEANER_MAG_FIELD_STABLE_THRESH",
     "CLEANER_OUTLIER_RES_STD",
+    "SINE_BASIS_CACHE_SIZE",
 ]
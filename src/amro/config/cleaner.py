@@ -12,6 +12,15 @@ CLEANER_OPTION_LABEL = "ACTRANSPORT"
 CLEANER_T_MIN_RESOLUTION = 1  # round digit places
 
 CLEANER_COL_RENAME_DICT = {"Res. ch2 (ohm-cm)": "Res. (ohm-cm)"}
+
+# Raw data columns parsed by the cleaner (named before CLEANER_COL_RENAME_DICT is applied).
+# Every other column of the data file is skipped while reading.
+CLEANER_RAW_COL_DTYPES = {
+    "Temperature (K)": "float64",
+    "Magnetic Field (Oe)": "float64",
+    "Sample Position (deg)": "float64",
+    "Res. ch2 (ohm-cm)": "float64",
+}
 CLEANER_DROP_COLS = [
     "Comment",
     "Time Stamp (sec)",
@@ -27,6 +27,9 @@ HEADER_PHASE_RAW = "phase_raw"
 #  Fitter DF header Labels
 HEADER_FIT_CHISQ = "chi_squared"
 HEADER_FIT_RED_CHISQ = "red_chi_squared"
+HEADER_FIT_MIN_AMP_RATIO = "min_amp_ratio"
+HEADER_FIT_MAX_FREQ = "max_freq"
+HEADER_FIT_FORCE_SYM = "force_four_and_two_sym"
 HEADER_PARAM_AMP_PREFIX = "amp"
 HEADER_PARAM_FREQ_PREFIX = "freq"
 HEADER_PARAM_PHASE_PREFIX = "phase"
@@ -6,6 +6,8 @@ from .headers import (
     HEADER_RES_OHM,
     HEADER_ANGLE_DEG,
     HEADER_TEMP_RAW,
+    HEADER_WIRE_SEP,
+    HEADER_CROSS_SECTION,
 )
 
 H_PALETTE = {0.5: "tab:red", 3: "tab:green", 7: "tab:orange", 9: "tab:blue"}
@@ -17,9 +19,16 @@ CLEANER_TEMP_STABLE_THRESH = 0.05  # K
 CLEANER_MAG_FIELD_STABLE_THRESH = 0.01  # T
 CLEANER_OUTLIER_RES_STD = 5  # many standard deviations
 CLEANER_SAVE_FN_SUFFIX = "_antisymmetrized.csv"
+CLEANER_MANIFEST_FN = "cleaner_manifest.json"
 
 COMBINED_AMRO_FN_SUFFIX = "_amro_combined.csv"
+# Sidecar of a combined AMRO CSV recording the processed files it was built from
+SOURCE_FILES_FN_SUFFIX = "_sources.json"
 FOURIER_FN_SUFFIX = "_fourier_results.csv"
+PROJECT_STORE_DIR_SUFFIX = "_store"
+PROJECT_STORE_INDEX_FN = "index.json"
+FIT_CACHE_DIR_NAME = "fit_cache"
+FIT_SWEEP_FN_SUFFIX = "_fit_sweep.csv"
 
 # The loader functionality reads only these from the cleaned AMRO data
 LOADER_DESIRED_COLS = [
@@ -30,4 +39,9 @@ LOADER_DESIRED_COLS = [
     HEADER_TEMP,
     HEADER_MAGNET,
     HEADER_GEO,
+    HEADER_WIRE_SEP,
+    HEADER_CROSS_SECTION,
 ]
+
+# Number of (angle grid, frequencies) pairs whose sine and cosine tables are cached
+SINE_BASIS_CACHE_SIZE = 128
@@ -6,9 +6,11 @@ from .data_structures import (
     ProjectData,
     OscillationKey,
     FitResult,
+    CompactFitResult,
     ExperimentalData,
     FourierResult,
     Experiment,
+    PackedOscillations,
 )
 from .cleaner import AMROCleaner
 
@@ -18,8 +20,10 @@ __all__ = [
     "AMROCleaner",
     "ProjectData",
     "Experiment",
+    "PackedOscillations",
     "ExperimentalData",
     "FitResult",
+    "CompactFitResult",
     "FourierResult",
     "OscillationKey",
 ]
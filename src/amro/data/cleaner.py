@@ -22,7 +22,9 @@ Experimental Assumptions:
     - The step resolution of the magnetic field values matches  RAW_DATA_OE_MIN_RESOLUTION
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from io import TextIOWrapper
+import json
 
 from .data_structures import OscillationKey
 from ..config import (
@@ -49,8 +51,10 @@ from ..config import (
     CLEANER_T_MIN_RESOLUTION,
     HEADER_RES_OHM,
     CLEANER_DROP_COLS,
+    CLEANER_RAW_COL_DTYPES,
     HEADER_WIRE_SEP,
     CLEANER_SAVE_FN_SUFFIX,
+    CLEANER_MANIFEST_FN,
     CLEANER_ANG_CHANGE_THRESH,
     CLEANER_TEMP_STABLE_THRESH,
     CLEANER_MAG_FIELD_STABLE_THRESH,
@@ -60,6 +64,7 @@ import pandas as pd
 from pathlib import Path
 import numpy as np
 from ..utils import conversions as c
+from ..utils import utils as u
 from warnings import warn
 
 # Suppresses annoying warning when np.sign() is called
@@ -70,20 +75,28 @@ class AMROCleaner:
     """Cleans and preprocesses raw AMRO data from QD USA PPMS ACT Option files."""
 
     def __init__(
-        self, datafile_type: str = ".dat", verbose: bool = False  # project_name: str,
+        self,
+        datafile_type: str = ".dat",
+        verbose: bool = False,  # project_name: str,
+        chunksize: int | None = None,
     ):
         """Initialize the AMROCleaner.
 
         Args:
             datafile_type: File extension of raw data files ('.dat' or '.csv').
             verbose: If True, print detailed processing information.
+            chunksize: If given, stream each raw file this many rows at a time,
+                cleaning and saving every oscillation once its rows are complete.
+                If None, each raw file is read into memory whole.
         """
         self.load_path = RAW_DATA_PATH
         self.save_path = PROCESSED_DATA_PATH
         # self.project_name = project_name
         self.verbose = verbose
         self.datafile_type = datafile_type
+        self.chunksize = chunksize
         self.experiment_labels = []
+        self.failed_files = {}
 
     def get_experiment_labels(self) -> list[str]:
         """Return list of experiment labels that were processed.
@@ -93,85 +106,432 @@ class AMROCleaner:
         """
         return self.experiment_labels
 
-    def clean_data_from_folder(self) -> None:
+    def clean_data_from_folder(
+        self, workers: int | None = 1, force: bool = False
+    ) -> None:
         """Process all raw data files in the RAW_DATA_PATH folder.
 
         Reads each valid AMRO data file, extracts metadata from headers,
         filters for oscillation data, removes outliers, anti-symmetrizes
         measurements, and saves cleaned data to PROCESSED_DATA_PATH.
+
+        Files are independent of one another, so they can be spread across a
+        process pool. Experiment labels are collected in filename order
+        regardless of which worker finishes first, and a file that fails to
+        clean is reported in failed_files without aborting the rest of the batch.
+
+        A manifest in PROCESSED_DATA_PATH records the content hash, size and
+        modification time of every cleaned file, along with the cleaner settings
+        it was cleaned under. Files whose cleaned output is still valid are skipped.
+
+        Args:
+            workers: Number of worker processes. 1 cleans the files serially in
+                this process, None uses one worker per CPU.
+            force: If True, re-clean every file regardless of the manifest.
         """
         # Checks RAW_DATA_PATH for .csv and .dat files
-        filepaths = list(self.load_path.glob("*" + self.datafile_type))
+        filepaths = sorted(self.load_path.glob("*" + self.datafile_type))
+        valid_filepaths = []
         for filepath in filepaths:
             if HEADER_EXPERIMENT_PREFIX in filepath.name:
-                osc_count = 0
-
-                print(f"Reading {filepath.name}")
-                exp_label_fn = self._get_experiment_label_from_fn(filepath.name)
-
-                # For each file, reads and parses the header info
-                # fp = self.load_path / filepath
-                with open(filepath) as file:
-                    header = self._extract_header(file)
-                exp_label_head, geom, wire_sep, cross_section = (
-                    self._parse_and_verify_header(header)
-                )
-                exp_label = self._compare_labels(exp_label_fn, exp_label_head)
-                self.experiment_labels.append(exp_label)
-
-                # then reads the data into one large df
-                data = self._load_file(filepath)
-                data = self._get_columns_for_calcs(data)
-                data = self._filter_for_oscillation_data(data)
-                data = self._clean_outliers(data)
-
-                # Identifies the unique H and T pairings
-                osc_labels = self._generate_oscillation_keys(data, exp_label)
-
-                # for each unique H and T pairing, it anti-symmetrizes
-                cleaned_oscs = []
-                for osc_key in osc_labels:
-                    q = f"{HEADER_MAGNET}=={osc_key.magnetic_field} & {HEADER_TEMP}=={osc_key.temperature}"
-                    subset_df = data.query(q)
-                    if subset_df.shape[0] > 1:
-                        if self.verbose:
-                            print(f"Reading in {osc_key}...")
-                        clean_osc = self._anti_symmetrize_oscillation(subset_df)
-                        if clean_osc is not None:
-                            cleaned_oscs.append(clean_osc)
-                            osc_count += 1
-                        else:
-                            if self.verbose:
-                                print(f"Could not clean {osc_key}, skipping...")
-                            continue
-                    else:
-                        print(f"Subset too small: {osc_key}")
-                        continue
-                if len(cleaned_oscs) == 0:
-                    print("Could not find any oscillations!")
-                    return
-                else:
-                    cleaned_df = pd.concat(cleaned_oscs)
-
-                    cleaned_df[HEADER_EXP_LABEL] = exp_label
-                    cleaned_df[HEADER_GEO] = geom
-                    cleaned_df[HEADER_CROSS_SECTION] = cross_section
-                    cleaned_df[HEADER_WIRE_SEP] = wire_sep
-
-                    cleaned_df = cleaned_df.drop(
-                        columns=[HEADER_MAGNET_RAW_OE, HEADER_MAGNET_RAW_OE_ABS]
-                    )
-                    fn = exp_label + CLEANER_SAVE_FN_SUFFIX
-                    cleaned_df.to_csv(PROCESSED_DATA_PATH / fn, sep=",", index=False)
-                    print(f"Found {osc_count} oscillations. Saved as {fn}")
-
+                valid_filepaths.append(filepath)
             else:
                 print(
                     f"HEADER_EXPERIMENT_PREFIX not found in filename, skipping: {filepath.name}"
                 )
 
+        manifest = self._load_manifest()
+        cleaner_config = self._get_cleaner_config()
+
+        exp_labels = {}
+        signatures = {}
+        to_clean = []
+        for filepath in valid_filepaths:
+            entry = manifest.get(filepath.name)
+            signatures[filepath] = u.get_file_signature(filepath, entry)
+            if not force and self._is_cleaned_file_current(
+                entry, signatures[filepath], cleaner_config
+            ):
+                print(f"Skipping {filepath.name}, unchanged since last cleaned.")
+                entry.update(signatures[filepath])
+                exp_labels[filepath] = entry["experiment_label"]
+            else:
+                to_clean.append(filepath)
+
+        exp_labels.update(self._clean_files(to_clean, workers))
+
+        for filepath in to_clean:
+            exp_label = exp_labels.get(filepath)
+            if exp_label is None:
+                manifest.pop(filepath.name, None)
+            else:
+                manifest[filepath.name] = {
+                    **signatures[filepath],
+                    "experiment_label": exp_label,
+                    "output": exp_label + CLEANER_SAVE_FN_SUFFIX,
+                    "config": cleaner_config,
+                }
+        self._save_manifest(manifest)
+
+        for filepath in valid_filepaths:
+            if exp_labels.get(filepath) is not None:
+                self.experiment_labels.append(exp_labels[filepath])
+
         return
 
+    def _clean_files(
+        self, filepaths: list[Path], workers: int | None
+    ) -> dict[Path, str | None]:
+        """Clean several raw data files, serially or across a process pool.
+
+        Args:
+            filepaths: Paths of the raw data files to clean.
+            workers: Number of worker processes. 1 cleans the files serially.
+
+        Returns:
+            Dictionary mapping each successfully processed path to its experiment label.
+        """
+        exp_labels = {}
+        if workers == 1 or len(filepaths) <= 1:
+            for filepath in filepaths:
+                try:
+                    exp_labels[filepath] = self._clean_file(filepath)
+                except Exception as e:
+                    self._report_failed_file(filepath, e)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._clean_file, filepath)
+                    for filepath in filepaths
+                ]
+                for filepath, future in zip(filepaths, futures):
+                    try:
+                        exp_labels[filepath] = future.result()
+                    except Exception as e:
+                        self._report_failed_file(filepath, e)
+        return exp_labels
+
+    def _get_cleaner_config(self) -> dict:
+        """Return the cleaner settings that affect the cleaned output.
+
+        Returns:
+            Dictionary of the CLEANER_* thresholds and resolutions.
+        """
+        return {
+            "CLEANER_T_MIN_RESOLUTION": CLEANER_T_MIN_RESOLUTION,
+            "CLEANER_ANG_CHANGE_THRESH": CLEANER_ANG_CHANGE_THRESH,
+            "CLEANER_TEMP_STABLE_THRESH": CLEANER_TEMP_STABLE_THRESH,
+            "CLEANER_MAG_FIELD_STABLE_THRESH": CLEANER_MAG_FIELD_STABLE_THRESH,
+            "CLEANER_OUTLIER_RES_STD": CLEANER_OUTLIER_RES_STD,
+        }
+
+    def _is_cleaned_file_current(
+        self, entry: dict | None, signature: dict, cleaner_config: dict
+    ) -> bool:
+        """Check whether a raw file's cleaned output is still valid.
+
+        Args:
+            entry: The file's manifest entry, if it has one.
+            signature: Current signature from utils.get_file_signature().
+            cleaner_config: Current settings from _get_cleaner_config().
+
+        Returns:
+            True if the content and cleaner settings are unchanged and the output exists.
+        """
+        if entry is None:
+            return False
+        return (
+            entry.get("sha256") == signature["sha256"]
+            and entry.get("config") == cleaner_config
+            and (self.save_path / entry["output"]).is_file()
+        )
+
+    def _load_manifest(self) -> dict:
+        """Load the cleaning manifest from the save folder.
+
+        Returns:
+            Dictionary mapping raw filenames to their manifest entries.
+        """
+        fp = self.save_path / CLEANER_MANIFEST_FN
+        if not fp.is_file():
+            return {}
+        with open(fp) as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: dict) -> None:
+        """Save the cleaning manifest to the save folder.
+
+        Args:
+            manifest: Dictionary mapping raw filenames to their manifest entries.
+        """
+        with open(self.save_path / CLEANER_MANIFEST_FN, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        return
+
+    def get_failed_files(self) -> dict[str, str]:
+        """Return the raw files that could not be cleaned.
+
+        Returns:
+            Dictionary mapping filename to the error message raised while cleaning it.
+        """
+        return self.failed_files
+
+    def _report_failed_file(self, filepath: Path, error: Exception) -> None:
+        """Record and print an error raised while cleaning a single file.
+
+        Args:
+            filepath: Path of the raw data file that failed.
+            error: Exception raised while cleaning the file.
+        """
+        self.failed_files[filepath.name] = f"{type(error).__name__}: {error}"
+        print(f"Could not clean {filepath.name}: {self.failed_files[filepath.name]}")
+        return
+
+    def _clean_file(self, filepath: Path) -> str | None:
+        """Clean a single raw data file and save the anti-symmetrized result.
+
+        Runs in a worker process when clean_data_from_folder() is called with
+        more than one worker, so it returns the experiment label rather than
+        appending it to experiment_labels.
+
+        Args:
+            filepath: Path to the raw data file.
+
+        Returns:
+            Experiment label of the cleaned file, or None if no oscillations were found.
+        """
+        print(f"Reading {filepath.name}")
+        exp_label_fn = self._get_experiment_label_from_fn(filepath.name)
+        if self.chunksize is not None:
+            return self._clean_file_in_chunks(filepath, exp_label_fn)
+
+        # For each file, reads the header info and the data into one large df
+        header, data = self._read_ppms_file(filepath)
+        exp_label_head, geom, wire_sep, cross_section = self._parse_and_verify_header(
+            header
+        )
+        exp_label = self._compare_labels(exp_label_fn, exp_label_head)
+
+        data = self._get_columns_for_calcs(data)
+        cleaned_df, osc_labels = self._clean_oscillations(data, exp_label)
+        if cleaned_df is None:
+            print("Could not find any oscillations!")
+            return None
+        osc_count = self._count_cleaned_oscillations(cleaned_df, osc_labels)
+
+        cleaned_df = self._add_experiment_columns(
+            cleaned_df, exp_label, geom, wire_sep, cross_section
+        )
+        fn = exp_label + CLEANER_SAVE_FN_SUFFIX
+        cleaned_df.to_csv(self.save_path / fn, sep=",", index=False)
+        print(f"Found {osc_count} oscillations. Saved as {fn}")
+        return exp_label
+
+    def _clean_file_in_chunks(
+        self, filepath: Path, exp_label_fn: str | None
+    ) -> str | None:
+        """Clean a raw data file while streaming it, one chunk of rows at a time.
+
+        Rows are grouped by T/H pairing as they are read. An oscillation is complete
+        once a whole chunk has passed without any of its rows, at which point it is
+        cleaned and anti-symmetrized like in _clean_file() and appended to the output.
+        Only the current chunk and the incomplete oscillations are held in memory.
+        The output is written to a partial file that replaces the saved file once the
+        whole raw file has been cleaned.
+
+        Assumes the rows of an oscillation are contiguous in the raw file. If a T/H
+        pairing that was already saved appears again, its later rows are skipped.
+
+        Args:
+            filepath: Path to the raw data file.
+            exp_label_fn: Experiment label extracted from the filename.
+
+        Returns:
+            Experiment label of the cleaned file, or None if no oscillations were found.
+        """
+        pending = {}  # T/H pairing -> row chunks of an incomplete oscillation
+        last_chunk = {}  # T/H pairing -> index of the last chunk with its rows
+        saved_keys = set()
+        osc_count = 0
+
+        with open(filepath) as file:
+            header = self._extract_header(file)
+            exp_label_head, geom, wire_sep, cross_section = (
+                self._parse_and_verify_header(header)
+            )
+            exp_label = self._compare_labels(exp_label_fn, exp_label_head)
+            fn = exp_label + CLEANER_SAVE_FN_SUFFIX
+            partial_fp = self.save_path / (fn + ".partial")
+            partial_fp.unlink(missing_ok=True)
+            experiment_info = (exp_label, geom, wire_sep, cross_section)
+
+            reader = pd.read_csv(
+                file,
+                sep=",",
+                usecols=list(CLEANER_RAW_COL_DTYPES.keys()),
+                dtype=CLEANER_RAW_COL_DTYPES,
+                chunksize=self.chunksize,
+            )
+            try:
+                for i, chunk in enumerate(reader):
+                    chunk = self._get_columns_for_calcs(chunk)
+                    for key, rows in chunk.groupby(
+                        [HEADER_TEMP, HEADER_MAGNET], sort=False
+                    ):
+                        pending.setdefault(key, []).append(rows)
+                        last_chunk[key] = i
+                    complete = [key for key in pending if last_chunk[key] < i]
+                    osc_count += self._save_complete_oscillations(
+                        pending, complete, experiment_info, saved_keys, partial_fp
+                    )
+                osc_count += self._save_complete_oscillations(
+                    pending, list(pending), experiment_info, saved_keys, partial_fp
+                )
+            except Exception:
+                partial_fp.unlink(missing_ok=True)
+                raise
+
+        if osc_count == 0:
+            print("Could not find any oscillations!")
+            partial_fp.unlink(missing_ok=True)
+            return None
+        partial_fp.replace(self.save_path / fn)
+        print(f"Found {osc_count} oscillations. Saved as {fn}")
+        return exp_label
+
+    def _save_complete_oscillations(
+        self,
+        pending: dict[tuple, list[pd.DataFrame]],
+        keys: list[tuple],
+        experiment_info: tuple,
+        saved_keys: set,
+        fp: Path,
+    ) -> int:
+        """Clean completed oscillations and append them to a partially written file.
+
+        Args:
+            pending: T/H pairing to the row chunks of each incomplete oscillation.
+                The oscillations in keys are removed from it.
+            keys: T/H pairings of the completed oscillations.
+            experiment_info: Tuple of (experiment_label, geometry, wire_sep,
+                cross_section).
+            saved_keys: T/H pairings already written to fp. Updated in place.
+            fp: Path of the partially written cleaned file.
+
+        Returns:
+            Number of oscillations written.
+        """
+        if len(keys) == 0:
+            return 0
+        data = pd.concat([rows for key in keys for rows in pending.pop(key)])
+        cleaned_df, osc_labels = self._clean_oscillations(data, experiment_info[0])
+        if cleaned_df is None:
+            return 0
+
+        repeated = [
+            key
+            for key in osc_labels
+            if (key.temperature, key.magnetic_field) in saved_keys
+        ]
+        if len(repeated) > 0:
+            for osc_key in repeated:
+                print(f"Skipping rows of already saved oscillation: {osc_key}")
+            is_repeated = self._get_group_mask(
+                cleaned_df,
+                pd.DataFrame(
+                    [(key.temperature, key.magnetic_field) for key in repeated],
+                    columns=[HEADER_TEMP, HEADER_MAGNET],
+                ),
+            )
+            cleaned_df = cleaned_df[~is_repeated]
+            osc_labels = [key for key in osc_labels if key not in repeated]
+
+        osc_count = self._count_cleaned_oscillations(cleaned_df, osc_labels)
+        saved_keys.update(
+            zip(cleaned_df[HEADER_TEMP].values, cleaned_df[HEADER_MAGNET].values)
+        )
+        cleaned_df = self._add_experiment_columns(cleaned_df, *experiment_info)
+        cleaned_df.to_csv(fp, sep=",", index=False, mode="a", header=not fp.is_file())
+        return osc_count
+
+    def _clean_oscillations(
+        self, data: pd.DataFrame, exp_label: str
+    ) -> tuple[pd.DataFrame | None, list[OscillationKey]]:
+        """Filter, remove outliers from and anti-symmetrize every oscillation in data.
+
+        Args:
+            data: DataFrame from _get_columns_for_calcs().
+            exp_label: Experiment label string.
+
+        Returns:
+            Tuple of (cleaned_df, osc_labels), where cleaned_df holds the
+            anti-symmetrized oscillations in order of first appearance, or None if
+            none could be cleaned, and osc_labels are the OscillationKeys found.
+        """
+        data = self._filter_for_oscillation_data(data)
+        data = self._clean_outliers(data)
+
+        # Identifies the unique H and T pairings
+        osc_labels = self._generate_oscillation_keys(data, exp_label)
+        data = self._drop_small_oscillations(data, osc_labels)
+
+        # Anti-symmetrizes every H and T pairing in a single grouped pass
+        cleaned_df = self._anti_symmetrize_oscillations(data)
+        if cleaned_df is None:
+            return None, osc_labels
+        cleaned_df = self._order_by_oscillation_keys(cleaned_df, osc_labels)
+        return cleaned_df, osc_labels
+
+    def _count_cleaned_oscillations(
+        self, cleaned_df: pd.DataFrame, osc_labels: list[OscillationKey]
+    ) -> int:
+        """Count the oscillations that made it through cleaning.
+
+        Args:
+            cleaned_df: Anti-symmetrized DataFrame.
+            osc_labels: OscillationKey objects found before anti-symmetrization.
+
+        Returns:
+            Number of oscillations in osc_labels present in cleaned_df.
+        """
+        osc_count = 0
+        cleaned_keys = set(
+            zip(cleaned_df[HEADER_TEMP].values, cleaned_df[HEADER_MAGNET].values)
+        )
+        for osc_key in osc_labels:
+            if (osc_key.temperature, osc_key.magnetic_field) in cleaned_keys:
+                osc_count += 1
+            elif self.verbose:
+                print(f"Could not clean {osc_key}, skipping...")
+        return osc_count
+
+    def _add_experiment_columns(
+        self,
+        cleaned_df: pd.DataFrame,
+        exp_label: str,
+        geom: str,
+        wire_sep: float,
+        cross_section: float,
+    ) -> pd.DataFrame:
+        """Add the experiment metadata columns and drop the raw field columns.
+
+        Args:
+            cleaned_df: Anti-symmetrized DataFrame.
+            exp_label: Experiment label string.
+            geom: Measurement geometry from the header.
+            wire_sep: Wire separation from the header.
+            cross_section: Cross section from the header.
+
+        Returns:
+            DataFrame in the format saved to PROCESSED_DATA_PATH.
+        """
+        cleaned_df[HEADER_EXP_LABEL] = exp_label
+        cleaned_df[HEADER_GEO] = geom
+        cleaned_df[HEADER_CROSS_SECTION] = cross_section
+        cleaned_df[HEADER_WIRE_SEP] = wire_sep
+
+        return cleaned_df.drop(columns=[HEADER_MAGNET_RAW_OE, HEADER_MAGNET_RAW_OE_ABS])
+
     def _clean_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove resistivity outliers from the data.
 
@@ -302,44 +662,115 @@ class AMROCleaner:
 
         return osc_labels
 
-    def _anti_symmetrize_oscillation(self, raw_df: pd.DataFrame) -> pd.DataFrame:
-        """Anti-symmetrize an oscillation by averaging +H and -H measurements.
+    def _drop_small_oscillations(
+        self, data: pd.DataFrame, osc_labels: list[OscillationKey]
+    ) -> pd.DataFrame:
+        """Remove oscillations with too few measurements to anti-symmetrize.
+
+        Args:
+            data: DataFrame containing every oscillation in a file.
+            osc_labels: OscillationKey objects for each unique T/H combination.
+
+        Returns:
+            DataFrame without the oscillations that have a single measurement.
+        """
+        osc_sizes = data.groupby([HEADER_TEMP, HEADER_MAGNET]).size()
+        small_oscs = osc_sizes[osc_sizes <= 1]
+        if len(small_oscs) == 0:
+            return data
+
+        small_index = small_oscs.index
+        for osc_key in osc_labels:
+            if (osc_key.temperature, osc_key.magnetic_field) in small_index:
+                print(f"Subset too small: {osc_key}")
+
+        is_small = self._get_group_mask(data, small_index.to_frame(index=False))
+        return data[~is_small]
+
+    def _order_by_oscillation_keys(
+        self, df: pd.DataFrame, osc_labels: list[OscillationKey]
+    ) -> pd.DataFrame:
+        """Order oscillations as they first appear in the raw file.
+
+        Rows within an oscillation keep their (sorted by angle) order.
+
+        Args:
+            df: Anti-symmetrized DataFrame, sorted by T, H and angle.
+            osc_labels: OscillationKey objects in order of first appearance.
+
+        Returns:
+            DataFrame with oscillations in the same order as osc_labels.
+        """
+        osc_order = pd.MultiIndex.from_tuples(
+            [(key.temperature, key.magnetic_field) for key in osc_labels],
+            names=[HEADER_TEMP, HEADER_MAGNET],
+        )
+        rank = osc_order.get_indexer(
+            pd.MultiIndex.from_frame(df[[HEADER_TEMP, HEADER_MAGNET]])
+        )
+        df = df.iloc[np.argsort(rank, kind="stable")]
+        return df.reset_index(drop=True)
+
+    def _get_group_mask(self, df: pd.DataFrame, groups_df: pd.DataFrame) -> np.ndarray:
+        """Flag the rows of df that belong to one of the groups in groups_df.
+
+        Args:
+            df: DataFrame to flag.
+            groups_df: DataFrame whose columns are the grouping columns, one row per group.
+
+        Returns:
+            Boolean array, True where the row's group is in groups_df.
+        """
+        cols = list(groups_df.columns)
+        groups = pd.MultiIndex.from_frame(groups_df)
+        return pd.MultiIndex.from_frame(df[cols]).isin(groups)
+
+    def _anti_symmetrize_oscillations(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+        """Anti-symmetrize oscillations by averaging +H and -H measurements.
 
         For each sample angle, averages the resistivity measured at positive
         and negative magnetic field to remove Hall Effect contributions.
 
+        Every oscillation in raw_df is handled in one groupby([T, H, angle])
+        pass: missing and extra measurements are found from the per-angle counts
+        of each oscillation, and the verification is done on per-oscillation
+        aggregates.
+
         Args:
             raw_df: DataFrame containing raw oscillation data with +/- field measurements.
 
         Returns:
-            DataFrame with anti-symmetrized resistivity values, or None if verification fails.
+            DataFrame with anti-symmetrized resistivity values for the oscillations
+            that pass verification, or None if none of them do.
         """
-        # For each angle, verify there are two resistivities and the +/- mag field values match
-        grouped_df = raw_df.groupby(
-            [HEADER_TEMP, HEADER_MAGNET, HEADER_ANGLE_DEG], as_index=False
-        )
+        angle_cols = [HEADER_TEMP, HEADER_MAGNET, HEADER_ANGLE_DEG]
+        osc_cols = [HEADER_TEMP, HEADER_MAGNET]
 
         # There should be only 2 measurements per angle, per T, per H
-        counted_df = grouped_df.count()
-        avg_count = np.mean(counted_df[HEADER_RES_OHM].values)
-        if avg_count < 2:
-            raw_df = self._handle_missing_measurements(raw_df, counted_df)
-
-        elif avg_count > 2:
-            raw_df = self._handle_extra_measurements(raw_df, counted_df)
-            # Re-count after handling extras
-            grouped_df = raw_df.groupby(
-                [HEADER_TEMP, HEADER_MAGNET, HEADER_ANGLE_DEG], as_index=False
+        counted_df = raw_df.groupby(angle_cols, as_index=False)[HEADER_RES_OHM].count()
+        avg_count = counted_df.groupby(osc_cols)[HEADER_RES_OHM].transform("mean")
+        missing_df = counted_df[avg_count < 2]
+
+        extra_df = counted_df[avg_count > 2]
+        if len(extra_df) > 0:
+            raw_df = self._handle_extra_measurements(raw_df, extra_df)
+
+            # Re-count the oscillations that had extras
+            recounted_df = raw_df.groupby(angle_cols, as_index=False)[
+                HEADER_RES_OHM
+            ].count()
+            recounted_df = recounted_df[
+                self._get_group_mask(recounted_df, extra_df[osc_cols].drop_duplicates())
+            ]
+            avg_recount = recounted_df.groupby(osc_cols)[HEADER_RES_OHM].transform(
+                "mean"
             )
-            counted_df = grouped_df.count()
-            avg_count = np.mean(counted_df[HEADER_RES_OHM].values)
-            if avg_count < 2:
-                raw_df = self._handle_missing_measurements(raw_df, counted_df)
+            missing_df = pd.concat([missing_df, recounted_df[avg_recount < 2]])
 
-        grouped_df = raw_df.groupby(
-            [HEADER_TEMP, HEADER_MAGNET, HEADER_ANGLE_DEG], as_index=False
-        )
-        averaged_df = grouped_df.mean()
+        if len(missing_df) > 0:
+            raw_df = self._handle_missing_measurements(raw_df, missing_df)
+
+        averaged_df = raw_df.groupby(angle_cols, as_index=False).mean()
 
         averaged_df = self._verify_averaged_df(averaged_df, raw_df)
 
@@ -352,7 +783,7 @@ class AMROCleaner:
 
         Args:
             df: DataFrame containing oscillation measurements.
-            counted_df: DataFrame with count of measurements per angle.
+            counted_df: DataFrame with count of measurements per T, H and angle.
 
         Returns:
             DataFrame with incomplete measurement angles removed.
@@ -360,15 +791,17 @@ class AMROCleaner:
         if self.verbose:
             print("Handling missing measurements...")
 
-        missing_angles = counted_df[counted_df[HEADER_RES_OHM] < 2][
-            HEADER_ANGLE_DEG
-        ].values
+        missing_df = counted_df[counted_df[HEADER_RES_OHM] < 2][
+            [HEADER_TEMP, HEADER_MAGNET, HEADER_ANGLE_DEG]
+        ]
 
         if self.verbose:
-            print(f"Angles with missing measurements: {missing_angles}")
+            print(
+                f"Angles with missing measurements: {missing_df[HEADER_ANGLE_DEG].values}"
+            )
 
         # Remove those rows
-        df = df[~df[HEADER_ANGLE_DEG].isin(missing_angles)]
+        df = df[~self._get_group_mask(df, missing_df)]
         return df
 
     def _handle_extra_measurements(
@@ -377,11 +810,12 @@ class AMROCleaner:
         """Remove duplicate measurements at angles with more than 2 data points.
 
         Keeps only the first measurement for each unique combination of
-        temperature, magnetic field, angle, and field polarity.
+        temperature, magnetic field, angle, and field polarity. Only the
+        oscillations present in counted_df are modified.
 
         Args:
             df: DataFrame containing oscillation measurements.
-            counted_df: DataFrame with count of measurements per angle.
+            counted_df: DataFrame with count of measurements per T, H and angle.
 
         Returns:
             DataFrame with extra measurements removed.
@@ -398,26 +832,43 @@ class AMROCleaner:
             print(f"Angles with extra measurements: {extra_angles}")
         # Could implement more adaptive code, but for now the user should be inputting
         # better data
-        df["Field Polarity"] = np.sign(df[HEADER_MAGNET_RAW_OE].values)
-
-        df = df.drop_duplicates(
-            subset=[HEADER_TEMP, HEADER_MAGNET, HEADER_ANGLE_DEG, "Field Polarity"],
-            keep="first",
+        in_extra_osc = self._get_group_mask(
+            df, counted_df[[HEADER_TEMP, HEADER_MAGNET]].drop_duplicates()
+        )
+        field_polarity = pd.Series(
+            np.sign(df[HEADER_MAGNET_RAW_OE].values), index=df.index
+        )
+        is_duplicate = (
+            df[[HEADER_TEMP, HEADER_MAGNET, HEADER_ANGLE_DEG]]
+            .assign(polarity=field_polarity)
+            .duplicated(keep="first")
         )
-        df = df.drop(columns=["Field Polarity"])
+        df = df[~(in_extra_osc & is_duplicate.values)]
         return df
 
-    def _load_file(self, fp: Path) -> pd.DataFrame:
-        """Load raw data file into a DataFrame, skipping header rows.
+    def _read_ppms_file(self, fp: Path) -> tuple[list[list], pd.DataFrame]:
+        """Read the header and measurement data of a raw data file in a single pass.
+
+        The header is read line by line, then the same file handle is passed on
+        to the CSV parser. Only the columns in CLEANER_RAW_COL_DTYPES are parsed,
+        with explicit dtypes, so the unused ACT Option columns are never converted.
 
         Args:
             fp: Path to the raw data file.
 
         Returns:
-            DataFrame containing the raw measurement data.
+            Tuple of (header, data), where header is the output of _extract_header()
+            and data is a DataFrame containing the raw measurement data.
         """
-        data = pd.read_table(fp, skiprows=CLEANER_HEADER_LENGTH, delimiter=",")
-        return data
+        with open(fp) as file:
+            header = self._extract_header(file)
+            data = pd.read_csv(
+                file,
+                sep=",",
+                usecols=list(CLEANER_RAW_COL_DTYPES.keys()),
+                dtype=CLEANER_RAW_COL_DTYPES,
+            )
+        return header, data
 
     def _get_columns_for_calcs(self, df: pd.DataFrame) -> pd.DataFrame:
         """Prepare DataFrame columns for anti-symmetrization calculations.
@@ -426,13 +877,13 @@ class AMROCleaner:
         for temperature and magnetic field values.
 
         Args:
-            df: Raw DataFrame from _load_file().
+            df: Raw DataFrame from _read_ppms_file().
 
         Returns:
             DataFrame with standardized column names and derived columns.
         """
         df = df.rename(columns=CLEANER_COL_RENAME_DICT)
-        df = df.drop(columns=CLEANER_DROP_COLS)
+        df = df.drop(columns=CLEANER_DROP_COLS, errors="ignore")
 
         df[HEADER_TEMP] = df[HEADER_TEMP_RAW].round(1)
 
@@ -447,38 +898,50 @@ class AMROCleaner:
     ) -> pd.DataFrame | None:
         """Verify that anti-symmetrization was performed correctly.
 
-        Checks that row counts, mean values, and angle ranges match expected
-        values after averaging.
+        Checks, per oscillation, that row counts, mean values, and angle ranges
+        match expected values after averaging. T and H match by construction,
+        since they are the grouping keys.
 
         Args:
             averaged_df: DataFrame after anti-symmetrization.
             raw_df: Original DataFrame before anti-symmetrization.
 
         Returns:
-            The averaged_df if verification passes, None otherwise.
+            The rows of averaged_df whose oscillation passes verification, or
+            None if no oscillation passes.
         """
-        try:
-            # averaged_df has half the number of rows of raw_df
-            assert averaged_df.shape[0] * 2 == raw_df.shape[0]
+        osc_cols = [HEADER_TEMP, HEADER_MAGNET]
+        aggregates = dict(
+            n_rows=(HEADER_RES_OHM, "size"),
+            field_mean=(HEADER_MAGNET_RAW_OE, "mean"),
+            angle_max=(HEADER_ANGLE_DEG, "max"),
+            angle_min=(HEADER_ANGLE_DEG, "min"),
+            res_mean=(HEADER_RES_OHM, "mean"),
+        )
+        raw_stats = raw_df.groupby(osc_cols).agg(**aggregates)
+        averaged_stats = (
+            averaged_df.groupby(osc_cols).agg(**aggregates).reindex(raw_stats.index)
+        )
 
+        is_valid = (
+            # averaged_df has half the number of rows of raw_df
+            (averaged_stats["n_rows"] * 2 == raw_stats["n_rows"])
             # average H matches up to 0.1 Oe
-            assert np.round(averaged_df[HEADER_MAGNET_RAW_OE].mean(), 1) == (
-                np.round(raw_df[HEADER_MAGNET_RAW_OE].mean(), 1)
+            & (
+                averaged_stats["field_mean"].round(1)
+                == raw_stats["field_mean"].round(1)
             )
-
-            assert averaged_df[HEADER_TEMP].mean() == raw_df[HEADER_TEMP].mean()
-            assert averaged_df[HEADER_MAGNET].mean() == raw_df[HEADER_MAGNET].mean()
-
             # Min and max angles match
-            assert averaged_df[HEADER_ANGLE_DEG].max() == raw_df[HEADER_ANGLE_DEG].max()
-            assert averaged_df[HEADER_ANGLE_DEG].min() == raw_df[HEADER_ANGLE_DEG].min()
-
+            & (averaged_stats["angle_max"] == raw_stats["angle_max"])
+            & (averaged_stats["angle_min"] == raw_stats["angle_min"])
             # Mean resistivities match up to nohm-cm
-            assert np.round(averaged_df[HEADER_RES_OHM].mean(), 9) == np.round(
-                raw_df[HEADER_RES_OHM].mean(), 9
-            )
-        except AssertionError:
-            averaged_df = None
+            & (averaged_stats["res_mean"].round(9) == raw_stats["res_mean"].round(9))
+        )
+
+        valid_oscs = is_valid[is_valid].index.to_frame(index=False)
+        averaged_df = averaged_df[self._get_group_mask(averaged_df, valid_oscs)]
+        if len(averaged_df) == 0:
+            return None
         return averaged_df
 
     def _get_experiment_label_from_fn(self, filename) -> None | str:
@@ -1,7 +1,9 @@
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, field
+from functools import cached_property
 import numpy as np
 import pandas as pd
 import lmfit as lm
+import json
 import pickle
 from pathlib import Path
 from ..config import (
@@ -10,6 +12,8 @@ from ..config import (
     HEADER_TEMP,
     HEADER_MAGNET,
     HEADER_GEO,
+    HEADER_WIRE_SEP,
+    HEADER_CROSS_SECTION,
     HEADER_ANGLE_RAD,
     HEADER_ANGLE_DEG,
     HEADER_RES_OHM,
@@ -34,7 +38,11 @@ from ..config import (
     HEADER_RES_DEL_0DEG_UOHM,
     HEADER_RES_DEL_0DEG_NORM,
     COMBINED_AMRO_FN_SUFFIX,
+    SOURCE_FILES_FN_SUFFIX,
+    LOADER_DESIRED_COLS,
     FOURIER_FN_SUFFIX,
+    PROJECT_STORE_DIR_SUFFIX,
+    PROJECT_STORE_INDEX_FN,
 )
 from ..utils import conversions as c
 from ..utils import utils as u
@@ -232,61 +240,343 @@ class FitResult:
         return self.experiment_key.get_magnetic_field()
 
 
-@dataclass
-class ExperimentalData:
-    """Stores a single AMR oscillation's experimental data, i.e. resistivity and sample angle."""
+class CompactFitResult:
+    """Stores a single AMR Oscillation's best fit results without lmfit objects.
 
-    experiment_key: OscillationKey
-    angles_degs: list | np.ndarray
-    res_ohms: list | np.ndarray
+    Holds only the parameter and error vectors, covariance, chi-squared values, flags
+    and the lmfit residuals. Model curves, lmfit Parameters and the fit report are
+    recomputed on demand, so pickling a project of these is much smaller and faster
+    than pickling FitResult objects. Missing standard errors are stored as NaN and
+    read back as 0, matching FitResult.
+    """
 
-    # Values for calculations
-    angles_rads: np.ndarray = field(init=False)
+    __slots__ = (
+        "experiment_key",
+        "angles_rads",
+        "symmetries",
+        "amplitudes",
+        "phases",
+        "mean",
+        "_amplitudes_errs",
+        "_phases_errs",
+        "_mean_err",
+        "chi_squared",
+        "red_chi_squared",
+        "covar_matrix",
+        "model_residuals_ohms",
+        "fit_succeeded",
+        "required_refit",
+    )
+
+    def __init__(
+        self,
+        experiment_key: OscillationKey,
+        angles_rads: np.ndarray,
+        symmetries: np.ndarray,
+        amplitudes: np.ndarray,
+        amplitudes_errs: np.ndarray,
+        phases: np.ndarray,
+        phases_errs: np.ndarray,
+        mean: float,
+        mean_err: float,
+        chi_squared: float,
+        red_chi_squared: float,
+        covar_matrix: np.ndarray | None,
+        model_residuals_ohms: np.ndarray,
+        fit_succeeded: bool,
+        required_refit: bool,
+    ) -> None:
+        """Initialize the CompactFitResult.
 
-    # res_{mean}
-    mean_res_ohms: float = field(init=False)
-    mean_res_uohms: float = field(init=False)
+        Args:
+            experiment_key: Key of the fitted oscillation.
+            angles_rads: Angles in radians the model is evaluated at.
+            symmetries: Fitted frequencies.
+            amplitudes: Fitted amplitude ratios, one per frequency.
+            amplitudes_errs: Amplitude standard errors, NaN where not estimated.
+            phases: Fitted phases in radians, one per frequency.
+            phases_errs: Phase standard errors, NaN where not estimated.
+            mean: Fitted mean resistivity.
+            mean_err: Mean standard error, NaN if not estimated.
+            chi_squared: Chi-squared of the fit.
+            red_chi_squared: Reduced chi-squared of the fit.
+            covar_matrix: Covariance matrix of the fit, or None.
+            model_residuals_ohms: Residuals from the lmfit result.
+            fit_succeeded: Whether the minimizer reported success.
+            required_refit: Whether the fit required relaxed bounds.
+        """
+        self.experiment_key = experiment_key
+        self.angles_rads = angles_rads
+        self.symmetries = np.asarray(symmetries, dtype=int)
+        self.amplitudes = np.asarray(amplitudes, dtype=float)
+        self._amplitudes_errs = np.asarray(amplitudes_errs, dtype=float)
+        self.phases = np.asarray(phases, dtype=float)
+        self._phases_errs = np.asarray(phases_errs, dtype=float)
+        self.mean = float(mean)
+        self._mean_err = float(mean_err)
+        self.chi_squared = chi_squared
+        self.red_chi_squared = red_chi_squared
+        self.covar_matrix = covar_matrix
+        self.model_residuals_ohms = model_residuals_ohms
+        self.fit_succeeded = fit_succeeded
+        self.required_refit = required_refit
+        return
 
-    # res_{\theta=0}
-    deg0_res_ohms: float = field(init=False)
-    deg0_res_uohms: float = field(init=False)
+    def __str__(self) -> str:
+        """Return string representation of the fit result."""
+        return f"Fit_Result_Object_{self.experiment_key}"
 
-    # Values for plotting
-    # val = (res-res_{mean})
-    delta_res_mean_ohms: np.ndarray = field(init=False)
-    delta_res_mean_uohms: np.ndarray = field(init=False)
+    def __getstate__(self) -> dict:
+        """Return the slot values for pickling."""
+        return {name: getattr(self, name) for name in self.__slots__}
 
-    # val = (res-res_{\theta=0})
-    delta_res_0deg_ohms: np.ndarray = field(init=False)
-    delta_res_0deg_uohms: np.ndarray = field(init=False)
+    def __setstate__(self, state: dict) -> None:
+        """Restore the slot values when unpickling."""
+        for name, value in state.items():
+            setattr(self, name, value)
+        return
 
-    # val = (res-res_{constant})/res_{constant}
-    delta_res_mean_norm: np.ndarray = field(init=False)
-    delta_res_0deg_norm: np.ndarray = field(init=False)
+    @classmethod
+    def from_fit_result(
+        cls, fit_result: FitResult, angles_rads: np.ndarray
+    ) -> "CompactFitResult":
+        """Build a CompactFitResult from a FitResult.
 
-    # val = (res-res_{constant})/res_{constant}*100
-    delta_res_mean_norm_pct: np.ndarray = field(init=False)
-    delta_res_0deg_norm_pct: np.ndarray = field(init=False)
+        Args:
+            fit_result: FitResult to convert.
+            angles_rads: Angles in radians of the fitted oscillation's data.
+
+        Returns:
+            CompactFitResult holding the same fit.
+        """
+        params = fit_result.lmfit_params
+        return cls(
+            experiment_key=fit_result.experiment_key,
+            angles_rads=angles_rads,
+            symmetries=fit_result.symmetries,
+            amplitudes=fit_result.amplitudes,
+            amplitudes_errs=[
+                Experiment._get_param_stderr(
+                    params[HEADER_PARAM_AMP_PREFIX + str(freq)]
+                )
+                for freq in fit_result.symmetries
+            ],
+            phases=fit_result.phases,
+            phases_errs=[
+                Experiment._get_param_stderr(
+                    params[HEADER_PARAM_PHASE_PREFIX + str(freq)]
+                )
+                for freq in fit_result.symmetries
+            ],
+            mean=fit_result.mean,
+            mean_err=Experiment._get_param_stderr(params[HEADER_PARAM_MEAN_PREFIX]),
+            chi_squared=fit_result.chi_squared,
+            red_chi_squared=fit_result.red_chi_squared,
+            covar_matrix=fit_result.covar_matrix,
+            model_residuals_ohms=fit_result.model_residuals_ohms,
+            fit_succeeded=fit_result.fit_succeeded,
+            required_refit=fit_result.required_refit,
+        )
+
+    def to_fit_result(self) -> FitResult:
+        """Rebuild a full FitResult, including an lmfit MinimizerResult.
+
+        Returns:
+            FitResult holding the same fit.
+        """
+        lmfit_result = lm.minimizer.MinimizerResult(
+            params=self.lmfit_params,
+            chisqr=self.chi_squared,
+            redchi=self.red_chi_squared,
+            covar=self.covar_matrix,
+            success=self.fit_succeeded,
+            residual=self.model_residuals_ohms,
+        )
+        return FitResult(
+            experiment_key=self.experiment_key,
+            lmfit_result=lmfit_result,
+            fit_succeeded=self.fit_succeeded,
+            model_res_ohms=self.model_res_ohms,
+            required_refit=self.required_refit,
+        )
+
+    @property
+    def amplitudes_errs(self) -> np.ndarray:
+        """Amplitude standard errors, 0 where not estimated."""
+        return np.nan_to_num(self._amplitudes_errs, nan=0.0)
+
+    @property
+    def phases_errs(self) -> np.ndarray:
+        """Phase standard errors, 0 where not estimated."""
+        return np.nan_to_num(self._phases_errs, nan=0.0)
+
+    @property
+    def mean_err(self) -> float:
+        """Mean standard error, 0 if not estimated."""
+        return 0.0 if np.isnan(self._mean_err) else self._mean_err
+
+    @property
+    def model_res_ohms(self) -> np.ndarray:
+        """Model resistivities at the fitted angles, in ohms."""
+        return u.sine_builder(
+            self.angles_rads, self.amplitudes, self.symmetries, self.phases, self.mean
+        )
+
+    @property
+    def model_res_uohms(self) -> np.ndarray:
+        """Model resistivities at the fitted angles, in micro-ohms."""
+        return c.convert_ohms_to_uohms(self.model_res_ohms)
+
+    @property
+    def model_residuals_uohms(self) -> np.ndarray:
+        """Residuals from the lmfit result, converted as in FitResult."""
+        return c.convert_ohms_to_uohms(self.model_residuals_ohms)
+
+    @property
+    def lmfit_params(self) -> lm.Parameters:
+        """lmfit Parameters rebuilt from the stored vectors."""
+        params = lm.Parameters()
+        params.add(HEADER_PARAM_MEAN_PREFIX, value=self.mean)
+        params[HEADER_PARAM_MEAN_PREFIX].stderr = Experiment._get_stored_stderr(
+            self._mean_err
+        )
+        for freq, amp, amp_err, phase, phase_err in zip(
+            self.symmetries.tolist(),
+            self.amplitudes.tolist(),
+            self._amplitudes_errs.tolist(),
+            self.phases.tolist(),
+            self._phases_errs.tolist(),
+        ):
+            params.add(HEADER_PARAM_FREQ_PREFIX + str(freq), value=freq, vary=False)
+            params.add(HEADER_PARAM_AMP_PREFIX + str(freq), value=amp)
+            params.add(HEADER_PARAM_PHASE_PREFIX + str(freq), value=phase)
+            params[HEADER_PARAM_AMP_PREFIX + str(freq)].stderr = (
+                Experiment._get_stored_stderr(amp_err)
+            )
+            params[HEADER_PARAM_PHASE_PREFIX + str(freq)].stderr = (
+                Experiment._get_stored_stderr(phase_err)
+            )
+        return params
+
+    @property
+    def fit_report(self) -> str:
+        """Text report of the fitted parameters, as produced by lm.fit_report."""
+        return lm.fit_report(self.lmfit_params)
+
+    @property
+    def fitted_params_dict(self) -> dict:
+        """Dictionary of fitted parameters with their errors, as in FitResult."""
+        params_dict = {HEADER_MEAN: (self.mean, self.mean_err)}
+        amps_errs, phases_errs = self.amplitudes_errs, self.phases_errs
+        for i, freq in enumerate(self.symmetries):
+            params_dict[freq] = (
+                (self.amplitudes[i], amps_errs[i]),
+                (self.phases[i], phases_errs[i]),
+            )
+        return params_dict
+
+    def compare_act(self, other_act: str) -> bool:
+        """Check if experiment label matches the given value."""
+        return self.experiment_key.compare_exp_label(other_act)
+
+    def compare_temperature(self, other_temperature: float) -> bool:
+        """Check if temperature matches the given value."""
+        return self.experiment_key.compare_temperature(other_temperature)
+
+    def compare_magnetic_field(self, other_magnetic_field: float) -> bool:
+        """Check if magnetic field matches the given value."""
+        return self.experiment_key.compare_magnetic_field(other_magnetic_field)
+
+    def get_fitted_params(self) -> tuple:
+        """Return fitted parameters as numpy arrays without errors."""
+        return self.amplitudes, self.symmetries, self.phases, self.mean
+
+    def get_fitted_params_with_errs(self) -> tuple:
+        """Return fitted parameters as numpy arrays with error estimates."""
+        return (
+            self.amplitudes,
+            self.amplitudes_errs,
+            self.symmetries,
+            self.phases,
+            self.phases_errs,
+            self.mean,
+            self.mean_err,
+        )
+
+    def get_experiment_label(self) -> str:
+        """Return the experiment label from the key."""
+        return self.experiment_key.get_experiment_label()
+
+    def get_temperature(self) -> float:
+        """Return the temperature from the key."""
+        return self.experiment_key.get_temperature()
+
+    def get_magnetic_field(self) -> float:
+        """Return the magnetic field from the key."""
+        return self.experiment_key.get_magnetic_field()
+
+
+@dataclass
+class ExperimentalData:
+    """Stores a single AMR oscillation's experimental data, i.e. resistivity and sample angle."""
+
+    experiment_key: OscillationKey
+    angles_degs: list | np.ndarray
+    res_ohms: list | np.ndarray
+
+    # Derived values are cached properties, computed on first access. Reassigning
+    # angles_degs or res_ohms clears them.
+    _DERIVED_VALUES = (
+        "angles_rads",
+        "mean_res_ohms",
+        "mean_res_uohms",
+        "deg0_res_ohms",
+        "deg0_res_uohms",
+        "res_uohms",
+        "delta_res_mean_ohms",
+        "delta_res_mean_uohms",
+        "delta_res_0deg_ohms",
+        "delta_res_0deg_uohms",
+        "delta_res_mean_norm",
+        "delta_res_0deg_norm",
+        "delta_res_mean_norm_pct",
+        "delta_res_0deg_norm_pct",
+    )
 
     def __str__(self) -> str:
         """Return string representation of the data object."""
         return f"AMRO_Data_Object_{self.experiment_key}"
 
     def __post_init__(self) -> None:
-        """Initialize derived values and perform unit conversions."""
+        """Validate inputs and store them as arrays."""
         self._validate_inputs()
 
         self.angles_degs = np.asarray(self.angles_degs)
         self.res_ohms = np.asarray(self.res_ohms)
 
-        self.mean_res_ohms = np.mean(self.res_ohms, dtype=float)
-        self._get_angle_zero_res()
+    def __setattr__(self, name: str, value) -> None:
+        """Set an attribute, clearing derived values when the data changes."""
+        super().__setattr__(name, value)
+        if name in ("angles_degs", "res_ohms"):
+            self.invalidate_derived_values()
 
-        self.angles_rads = c.convert_degs_to_rads(self.angles_degs)
+    def __getstate__(self) -> dict:
+        """Return the state for pickling, without cached derived values."""
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in self._DERIVED_VALUES
+        }
 
-        self._calc_delta_res()
-        self._calc_res_uohm_values()
-        self._calc_normed_res()
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state."""
+        self.__dict__.update(state)
+
+    def invalidate_derived_values(self) -> None:
+        """Clear cached derived values so they are recomputed on next access."""
+        for name in self._DERIVED_VALUES:
+            self.__dict__.pop(name, None)
+        return
 
     def compare_act(self, other_act: str) -> bool:
         """Check if experiment label matches the given value."""
@@ -300,44 +590,111 @@ class ExperimentalData:
         """Check if magnetic field matches the given value."""
         return self.experiment_key.compare_magnetic_field(other_magnetic_field)
 
-    def _calc_normed_res(self) -> None:
-        """Calculate normalized resistivity values as fractions and percentages."""
-        self.delta_res_mean_norm = self.delta_res_mean_ohms / self.mean_res_ohms
-        self.delta_res_0deg_norm = self.delta_res_0deg_ohms / self.deg0_res_ohms
-
-        self.delta_res_mean_norm_pct = self.delta_res_mean_norm * 100
-        self.delta_res_0deg_norm_pct = self.delta_res_0deg_norm * 100
-
-    def _calc_delta_res(self) -> None:
-        """Calculates various values using different units for clearer plotting."""
-
-        self.delta_res_mean_ohms = self.res_ohms - self.mean_res_ohms
-        self.delta_res_0deg_ohms = self.res_ohms - self.deg0_res_ohms
-        return
-
     def _validate_inputs(self) -> None:
         """Validate that angle and resistivity values are non-negative."""
-        if min(self.angles_degs) < 0:
+        if np.min(self.angles_degs) < 0:
             raise ValueError("Angles must be non-negative")
-        elif min(self.res_ohms) < 0:
+        elif np.min(self.res_ohms) < 0:
             raise ValueError("Resistivity must be non-negative")
 
-    def _calc_res_uohm_values(self) -> None:
-        """Call this last at initialization. Iterates over the class object's attributes."""
-        for attribute in fields(self):
-            if attribute.name.endswith("_ohms"):
-                vals = getattr(self, attribute.name)
-                new_name = attribute.name.replace("_ohms", "_uohms")
-                new_vals = c.convert_ohms_to_uohms(vals)
-                setattr(self, new_name, new_vals)
+    # Values for calculations
+    @cached_property
+    def angles_rads(self) -> np.ndarray:
+        """Angles in radians."""
+        return c.convert_degs_to_rads(self.angles_degs)
 
-        return
+    # res_{mean}
+    @cached_property
+    def mean_res_ohms(self) -> float:
+        """Mean resistivity in ohms."""
+        return np.mean(self.res_ohms, dtype=float)
 
-    def _get_angle_zero_res(self) -> None:
-        """Get the resistivity measurement at the very start of the oscillation, i.e. when the sample angle equals 0."""
-        id_min = np.argmin(self.angles_degs)
-        self.deg0_res_ohms = self.res_ohms[id_min]
-        return
+    @cached_property
+    def mean_res_uohms(self) -> float:
+        """Mean resistivity in micro-ohms."""
+        return c.convert_ohms_to_uohms(self.mean_res_ohms)
+
+    # res_{\theta=0}
+    @cached_property
+    def deg0_res_ohms(self) -> float:
+        """Resistivity at the very start of the oscillation, i.e. when the sample angle equals 0."""
+        return self.res_ohms[np.argmin(self.angles_degs)]
+
+    @cached_property
+    def deg0_res_uohms(self) -> float:
+        """Resistivity at the smallest angle in micro-ohms."""
+        return c.convert_ohms_to_uohms(self.deg0_res_ohms)
+
+    @cached_property
+    def res_uohms(self) -> np.ndarray:
+        """Resistivity in micro-ohms."""
+        return c.convert_ohms_to_uohms(self.res_ohms)
+
+    # Values for plotting
+    # val = (res-res_{mean})
+    @cached_property
+    def delta_res_mean_ohms(self) -> np.ndarray:
+        """Resistivity change from the mean in ohms."""
+        return self.res_ohms - self.mean_res_ohms
+
+    @cached_property
+    def delta_res_mean_uohms(self) -> np.ndarray:
+        """Resistivity change from the mean in micro-ohms."""
+        return c.convert_ohms_to_uohms(self.delta_res_mean_ohms)
+
+    # val = (res-res_{\theta=0})
+    @cached_property
+    def delta_res_0deg_ohms(self) -> np.ndarray:
+        """Resistivity change from the 0 degree value in ohms."""
+        return self.res_ohms - self.deg0_res_ohms
+
+    @cached_property
+    def delta_res_0deg_uohms(self) -> np.ndarray:
+        """Resistivity change from the 0 degree value in micro-ohms."""
+        return c.convert_ohms_to_uohms(self.delta_res_0deg_ohms)
+
+    # val = (res-res_{constant})/res_{constant}
+    @cached_property
+    def delta_res_mean_norm(self) -> np.ndarray:
+        """Resistivity change from the mean as a fraction of the mean."""
+        return self.delta_res_mean_ohms / self.mean_res_ohms
+
+    @cached_property
+    def delta_res_0deg_norm(self) -> np.ndarray:
+        """Resistivity change from the 0 degree value as a fraction of it."""
+        return self.delta_res_0deg_ohms / self.deg0_res_ohms
+
+    # val = (res-res_{constant})/res_{constant}*100
+    @cached_property
+    def delta_res_mean_norm_pct(self) -> np.ndarray:
+        """Resistivity change from the mean as a percentage of the mean."""
+        return self.delta_res_mean_norm * 100
+
+    @cached_property
+    def delta_res_0deg_norm_pct(self) -> np.ndarray:
+        """Resistivity change from the 0 degree value as a percentage of it."""
+        return self.delta_res_0deg_norm * 100
+
+    def get_data_columns(self) -> dict[str, np.ndarray]:
+        """Return the per-angle data and derived values, keyed by column header.
+
+        Returns:
+            Dictionary of column header to array, one value per angle measurement.
+        """
+        return {
+            HEADER_ANGLE_DEG: self.angles_degs,
+            HEADER_ANGLE_RAD: self.angles_rads,
+            HEADER_RES_OHM: self.res_ohms,
+            HEADER_RES_UOHM: self.res_uohms,
+            HEADER_RES_DEL_MEAN_OHM: self.delta_res_mean_ohms,
+            HEADER_RES_DEL_MEAN_UOHM: self.delta_res_mean_uohms,
+            HEADER_RES_DEF_MEAN_NORM: self.delta_res_mean_norm,
+            HEADER_RES_DEL_MEAN_NORM_PCT: self.delta_res_mean_norm_pct,
+            HEADER_RES_DEL_0DEG_OHM: self.delta_res_0deg_ohms,
+            HEADER_RES_DEL_0DEG_UOHM: self.delta_res_0deg_uohms,
+            HEADER_RES_DEL_0DEG_NORM: self.delta_res_0deg_norm,
+            HEADER_RES_DEL_0DEG_NORM_PCT: self.delta_res_0deg_norm_pct,
+        }
 
     def get_experiment_label(self) -> str:
         """Return the experiment label from the key."""
@@ -386,16 +743,19 @@ class FourierResult:
             self.phases + 2 * np.pi,
             self.phases,
         )
-        for i, f in enumerate(self.xf):
-
-            if f > 0:
-                self.fourier_results_dict[f] = (
-                    self.amplitudes[i],
-                    self.amplitudes_ratio[i],
-                    self.phases_pos[i],
-                )
-            else:
-                raise ValueError(f"Invalid symmetry! {f} in {self.key}")
+        invalid = self.xf[self.xf <= 0]
+        if len(invalid) > 0:
+            raise ValueError(f"Invalid symmetry! {invalid[0]} in {self.key}")
+        self.fourier_results_dict.update(
+            zip(
+                self.xf.tolist(),
+                zip(
+                    self.amplitudes.tolist(),
+                    self.amplitudes_ratio.tolist(),
+                    self.phases_pos.tolist(),
+                ),
+            )
+        )
 
     def get_fit_guess(self, freq: int) -> tuple[float, float]:
         """Get amplitude ratio and phase for a given frequency as fit initial guess.
@@ -462,7 +822,7 @@ class AMROscillation:
     key: OscillationKey
     osc_data: ExperimentalData
 
-    fit_result: FitResult | None = None
+    fit_result: FitResult | CompactFitResult | None = None
     fourier_result: FourierResult | None = None
 
     def __str__(self) -> str:
@@ -492,14 +852,109 @@ class AMROscillation:
             lmfit_result: MinimizerResult from lmfit optimization.
             refitted: Whether the fit required relaxed bounds.
         """
+        self.fit_result = self.build_fit_result(lmfit_result, refitted)
+        return
+
+    def build_fit_result(
+        self,
+        lmfit_result: lm.minimizer.MinimizerResult,
+        refitted: bool,
+    ) -> FitResult:
+        """Build a FitResult for this oscillation without attaching it.
+
+        Args:
+            lmfit_result: MinimizerResult from lmfit optimization.
+            refitted: Whether the fit required relaxed bounds.
+
+        Returns:
+            FitResult holding the fit and its model resistivities.
+        """
         model_vals = self._calc_model_resistivities(lmfit_result.params)
-        self.fit_result = FitResult(
+        return FitResult(
             lmfit_result=lmfit_result,
             experiment_key=self.key,
             model_res_ohms=model_vals,
             required_refit=refitted,
             fit_succeeded=lmfit_result.success,
         )
+
+    def add_compact_fit_result(
+        self,
+        symmetries: np.ndarray,
+        amplitudes: np.ndarray,
+        amplitudes_errs: np.ndarray,
+        phases: np.ndarray,
+        phases_errs: np.ndarray,
+        mean: float,
+        mean_err: float,
+        chi_squared: float,
+        red_chi_squared: float,
+        fit_succeeded: bool,
+        refitted: bool,
+        covar_matrix: np.ndarray | None = None,
+    ) -> None:
+        """Add a fit result from parameter vectors, without lmfit objects.
+
+        The residuals are recomputed as the fitter reports them, on data normalized
+        by its maximum absolute value.
+
+        Args:
+            symmetries: Fitted frequencies.
+            amplitudes: Fitted amplitude ratios, one per frequency.
+            amplitudes_errs: Amplitude standard errors.
+            phases: Fitted phases in radians, one per frequency.
+            phases_errs: Phase standard errors.
+            mean: Fitted mean resistivity.
+            mean_err: Mean standard error.
+            chi_squared: Chi-squared of the fit.
+            red_chi_squared: Reduced chi-squared of the fit.
+            fit_succeeded: Whether the minimizer reported success.
+            refitted: Whether the fit required relaxed bounds.
+            covar_matrix: Covariance matrix of the fit, if known.
+        """
+        rads = self.osc_data.angles_rads
+        model = u.sine_builder(
+            rads,
+            np.asarray(amplitudes, dtype=float),
+            np.asarray(symmetries, dtype=float),
+            np.asarray(phases, dtype=float),
+            mean,
+        )
+        y_scale = np.abs(self.osc_data.res_ohms).max()
+        if y_scale < 1e-10:
+            y_scale = 1.0
+
+        self.fit_result = CompactFitResult(
+            experiment_key=self.key,
+            angles_rads=rads,
+            symmetries=symmetries,
+            amplitudes=amplitudes,
+            amplitudes_errs=amplitudes_errs,
+            phases=phases,
+            phases_errs=phases_errs,
+            mean=mean,
+            mean_err=mean_err,
+            chi_squared=chi_squared,
+            red_chi_squared=red_chi_squared,
+            covar_matrix=covar_matrix,
+            model_residuals_ohms=(model - self.osc_data.res_ohms) / y_scale,
+            fit_succeeded=fit_succeeded,
+            required_refit=refitted,
+        )
+        return
+
+    def compact_fit_result(self) -> None:
+        """Replace the fit result with an equivalent CompactFitResult."""
+        if isinstance(self.fit_result, FitResult):
+            self.fit_result = CompactFitResult.from_fit_result(
+                self.fit_result, self.osc_data.angles_rads
+            )
+        return
+
+    def expand_fit_result(self) -> None:
+        """Replace a CompactFitResult with an equivalent full FitResult."""
+        if isinstance(self.fit_result, CompactFitResult):
+            self.fit_result = self.fit_result.to_fit_result()
         return
 
     def add_fourier_result(self, xf: np.ndarray, yf: np.ndarray) -> None:
@@ -558,28 +1013,15 @@ class AMROscillation:
         Returns:
             DataFrame with one row per angle measurement, including all derived values.
         """
-        data = self.osc_data
-        rows = []
-        for i in range(len(data.angles_degs)):
-            row = {
-                HEADER_EXP_LABEL: self.key.experiment_label,
-                HEADER_TEMP: self.key.temperature,
-                HEADER_MAGNET: self.key.magnetic_field,
-                HEADER_ANGLE_DEG: data.angles_degs[i],
-                HEADER_ANGLE_RAD: data.angles_rads[i],
-                HEADER_RES_OHM: data.res_ohms[i],
-                HEADER_RES_UOHM: c.convert_ohms_to_uohms(data.res_ohms[i]),
-                HEADER_RES_DEL_MEAN_OHM: data.delta_res_mean_ohms[i],
-                HEADER_RES_DEL_MEAN_UOHM: data.delta_res_mean_uohms[i],
-                HEADER_RES_DEF_MEAN_NORM: data.delta_res_mean_norm[i],
-                HEADER_RES_DEL_MEAN_NORM_PCT: data.delta_res_mean_norm_pct[i],
-                HEADER_RES_DEL_0DEG_OHM: data.delta_res_0deg_ohms[i],
-                HEADER_RES_DEL_0DEG_UOHM: data.delta_res_0deg_uohms[i],
-                HEADER_RES_DEL_0DEG_NORM: data.delta_res_0deg_norm[i],
-                HEADER_RES_DEL_0DEG_NORM_PCT: data.delta_res_0deg_norm_pct[i],
-            }
-            rows.append(row)
-        return pd.DataFrame(rows)
+        data_columns = self.osc_data.get_data_columns()
+        n_rows = len(self.osc_data.angles_degs)
+        columns = {
+            HEADER_EXP_LABEL: np.repeat(self.key.experiment_label, n_rows),
+            HEADER_TEMP: np.repeat(self.key.temperature, n_rows),
+            HEADER_MAGNET: np.repeat(self.key.magnetic_field, n_rows),
+            **data_columns,
+        }
+        return pd.DataFrame(columns)
 
     def clear_fourier_result(self) -> None:
         """Remove the Fourier result from this oscillation."""
@@ -592,6 +1034,230 @@ class AMROscillation:
         return
 
 
+@dataclass
+class PackedOscillations:
+    """Stores the data of many oscillations in flat, contiguous arrays.
+
+    Oscillation i covers angles_degs[offsets[i]:offsets[i + 1]] and the same slice
+    of res_ohms, and is identified by temperatures[i] and magnetic_fields[i].
+    ExperimentalData objects built from it hold views into the flat arrays, and the
+    arrays can be saved as .npy files and memory-mapped back.
+    """
+
+    temperatures: np.ndarray
+    magnetic_fields: np.ndarray
+    offsets: np.ndarray
+    angles_degs: np.ndarray
+    res_ohms: np.ndarray
+
+    ARRAY_NAMES = (
+        "temperatures",
+        "magnetic_fields",
+        "offsets",
+        "angles_degs",
+        "res_ohms",
+    )
+
+    def __len__(self) -> int:
+        """Return the number of oscillations."""
+        return len(self.temperatures)
+
+    @classmethod
+    def from_oscillations(cls, oscillations: list) -> "PackedOscillations":
+        """Pack the experimental data of several oscillations into flat arrays.
+
+        Args:
+            oscillations: AMROscillation objects, in the order they are packed.
+
+        Returns:
+            PackedOscillations holding a copy of the oscillations' data.
+        """
+        n_points = [len(osc.osc_data.angles_degs) for osc in oscillations]
+        return cls(
+            temperatures=np.asarray(
+                [osc.key.temperature for osc in oscillations], dtype=float
+            ),
+            magnetic_fields=np.asarray(
+                [osc.key.magnetic_field for osc in oscillations], dtype=float
+            ),
+            offsets=Experiment._get_offsets(n_points),
+            angles_degs=Experiment._concat(
+                [osc.osc_data.angles_degs for osc in oscillations], float
+            ),
+            res_ohms=Experiment._concat(
+                [osc.osc_data.res_ohms for osc in oscillations], float
+            ),
+        )
+
+    def get_data_views(self, i: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return views of oscillation i's angles and resistivities.
+
+        Args:
+            i: Position of the oscillation.
+
+        Returns:
+            Tuple of (angles_degs, res_ohms) views into the flat arrays.
+        """
+        data_slice = slice(self.offsets[i], self.offsets[i + 1])
+        return self.angles_degs[data_slice], self.res_ohms[data_slice]
+
+    def save(self, path: Path) -> None:
+        """Save the flat arrays as .npy files in a directory.
+
+        Args:
+            path: Directory to write to. Created if missing.
+        """
+        path.mkdir(parents=True, exist_ok=True)
+        for name in self.ARRAY_NAMES:
+            np.save(path / (name + ".npy"), getattr(self, name))
+        return
+
+    @classmethod
+    def load(cls, path: Path, mmap_mode: str | None = "r") -> "PackedOscillations":
+        """Load flat arrays written by save().
+
+        Args:
+            path: Directory holding the .npy files.
+            mmap_mode: Memory-map mode passed to np.load, or None to read the arrays
+                into memory.
+
+        Returns:
+            PackedOscillations backed by the loaded or memory-mapped arrays.
+        """
+        return cls(
+            **{
+                name: np.load(path / (name + ".npy"), mmap_mode=mmap_mode)
+                for name in cls.ARRAY_NAMES
+            }
+        )
+
+
+@dataclass
+class OscillationIndex:
+    """Sorted temperature and magnetic field indexes over a list of oscillations.
+
+    Positions refer to the oscillations list, which follows the order of the
+    experiment's oscillations_dict. Each query is a binary search on the sorted
+    values, followed by a vectorized intersection of the matching positions.
+    """
+
+    oscillations: list
+
+    temperatures: np.ndarray = field(init=False)
+    magnetic_fields: np.ndarray = field(init=False)
+    t_order: np.ndarray = field(init=False)
+    h_order: np.ndarray = field(init=False)
+    sorted_temperatures: np.ndarray = field(init=False)
+    sorted_magnetic_fields: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Sort the oscillations by temperature and by magnetic field."""
+        self.temperatures = np.asarray(
+            [osc.key.temperature for osc in self.oscillations], dtype=float
+        )
+        self.magnetic_fields = np.asarray(
+            [osc.key.magnetic_field for osc in self.oscillations], dtype=float
+        )
+        self.t_order = np.argsort(self.temperatures, kind="stable")
+        self.h_order = np.argsort(self.magnetic_fields, kind="stable")
+        self.sorted_temperatures = self.temperatures[self.t_order]
+        self.sorted_magnetic_fields = self.magnetic_fields[self.h_order]
+
+    def select(
+        self,
+        t: float | list | None = None,
+        h: float | list | None = None,
+        t_range: tuple | None = None,
+        h_range: tuple | None = None,
+        t_tol: float = 0,
+        h_tol: float = 0,
+    ) -> list:
+        """Return the oscillations matching every given condition.
+
+        Args:
+            t: Temperature value(s) to match within t_tol.
+            h: Magnetic field value(s) to match within h_tol.
+            t_range: Inclusive (min, max) temperature range.
+            h_range: Inclusive (min, max) magnetic field range.
+            t_tol: Tolerance for matching t values.
+            h_tol: Tolerance for matching h values.
+
+        Returns:
+            List of matching AMROscillation objects, in oscillations order.
+        """
+        mask = np.ones(len(self.oscillations), dtype=bool)
+        for values, value_range, tol, sorted_values, order in (
+            (t, t_range, t_tol, self.sorted_temperatures, self.t_order),
+            (h, h_range, h_tol, self.sorted_magnetic_fields, self.h_order),
+        ):
+            if values is not None:
+                values = np.atleast_1d(values).astype(float).flatten()
+                mask &= self._get_match_mask(
+                    sorted_values, order, values - tol, values + tol
+                )
+            if value_range is not None:
+                mask &= self._get_match_mask(
+                    sorted_values,
+                    order,
+                    np.atleast_1d(value_range[0]),
+                    np.atleast_1d(value_range[1]),
+                )
+        return [self.oscillations[i] for i in np.flatnonzero(mask)]
+
+    def nearest(
+        self, t: float, h: float, t_tol: float = np.inf, h_tol: float = np.inf
+    ) -> AMROscillation | None:
+        """Return the oscillation closest to (t, h) within the given tolerances.
+
+        Candidates within both tolerances are ranked by temperature distance, then
+        by magnetic field distance.
+
+        Args:
+            t: Target temperature.
+            h: Target magnetic field.
+            t_tol: Maximum temperature distance.
+            h_tol: Maximum magnetic field distance.
+
+        Returns:
+            Closest AMROscillation, or None if none lies within the tolerances.
+        """
+        t_mask = self._get_match_mask(
+            self.sorted_temperatures,
+            self.t_order,
+            np.atleast_1d(t - t_tol),
+            np.atleast_1d(t + t_tol),
+        )
+        h_mask = self._get_match_mask(
+            self.sorted_magnetic_fields,
+            self.h_order,
+            np.atleast_1d(h - h_tol),
+            np.atleast_1d(h + h_tol),
+        )
+        candidates = np.flatnonzero(t_mask & h_mask)
+        if len(candidates) == 0:
+            return None
+
+        t_dist = np.abs(self.temperatures[candidates] - t)
+        h_dist = np.abs(self.magnetic_fields[candidates] - h)
+        best = candidates[np.lexsort((h_dist, t_dist))[0]]
+        return self.oscillations[best]
+
+    @staticmethod
+    def _get_match_mask(
+        sorted_values: np.ndarray,
+        order: np.ndarray,
+        lows: np.ndarray,
+        highs: np.ndarray,
+    ) -> np.ndarray:
+        """Return a mask of positions whose value lies in any [low, high] interval."""
+        starts = np.searchsorted(sorted_values, lows, side="left")
+        stops = np.searchsorted(sorted_values, highs, side="right")
+        mask = np.zeros(len(order), dtype=bool)
+        for start, stop in zip(starts, stops):
+            mask[order[start:stop]] = True
+        return mask
+
+
 @dataclass
 class Experiment:
     """Handles dataclasses for all oscillations for a given experimental set up."""
@@ -605,6 +1271,32 @@ class Experiment:
     oscillations_count: int = 0
     material: str = None
 
+    # Flat data backing the oscillations, in oscillations_dict order. Cleared when
+    # oscillations are added or replaced.
+    packed_oscillations: PackedOscillations | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    # Temperature/field index for queries, rebuilt after oscillations change
+    _oscillation_index: OscillationIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __getstate__(self) -> dict:
+        """Return the state for pickling, without the packed arrays.
+
+        The oscillations pickle their own copies of the data, so the packed arrays
+        would otherwise be stored twice.
+        """
+        state = self.__dict__.copy()
+        state["packed_oscillations"] = None
+        state["_oscillation_index"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state."""
+        self.__dict__.update(state)
+
     def add_oscillation(self, oscillation: AMROscillation) -> None:
         """Add an oscillation to this experiment.
 
@@ -615,6 +1307,8 @@ class Experiment:
         if new_key not in self.oscillations_dict.keys():
             self.oscillations_dict[new_key] = oscillation
             self.oscillations_count += 1
+            self.packed_oscillations = None
+            self._oscillation_index = None
         else:
             print(f"Key {new_key} already exists! Use replace_oscillation() instead.")
         return
@@ -627,8 +1321,81 @@ class Experiment:
         """
         new_key = oscillation.key
         self.oscillations_dict[new_key] = oscillation
+        self.packed_oscillations = None
+        self._oscillation_index = None
         return
 
+    def pack_oscillations(self) -> PackedOscillations:
+        """Move the oscillations' data into one set of flat, contiguous arrays.
+
+        Each oscillation's angles_degs and res_ohms are replaced by views into the
+        packed arrays, so per-oscillation arrays are freed and the data of the whole
+        experiment sits in one block of memory.
+
+        Returns:
+            PackedOscillations now backing this experiment's oscillations.
+        """
+        oscillations = list(self.oscillations_dict.values())
+        packed = PackedOscillations.from_oscillations(oscillations)
+        for i, osc in enumerate(oscillations):
+            osc.osc_data.angles_degs, osc.osc_data.res_ohms = packed.get_data_views(i)
+        self.packed_oscillations = packed
+        return packed
+
+    @classmethod
+    def from_packed_oscillations(
+        cls,
+        experiment_label: str,
+        geometry: str,
+        wire_sep: float,
+        cross_section: float,
+        packed: PackedOscillations,
+        material: str = None,
+    ) -> "Experiment":
+        """Build an Experiment whose oscillations are views into packed arrays.
+
+        Nothing is copied, so memory-mapped packed arrays stay on disk until read.
+
+        Args:
+            experiment_label: Label of the experiment.
+            geometry: Measurement geometry.
+            wire_sep: Wire separation.
+            cross_section: Sample cross section.
+            packed: PackedOscillations holding the experimental data.
+            material: Sample material.
+
+        Returns:
+            Experiment with one AMROscillation per packed oscillation.
+        """
+        exp = cls(
+            experiment_label=experiment_label,
+            geometry=geometry,
+            wire_sep=wire_sep,
+            cross_section=cross_section,
+            material=material,
+        )
+        for i, (t, h) in enumerate(
+            zip(packed.temperatures.tolist(), packed.magnetic_fields.tolist())
+        ):
+            key = OscillationKey(
+                experiment_label=experiment_label,
+                temperature=t,
+                magnetic_field=h,
+            )
+            angles_degs, res_ohms = packed.get_data_views(i)
+            exp.add_oscillation(
+                AMROscillation(
+                    key=key,
+                    osc_data=ExperimentalData(
+                        experiment_key=key,
+                        angles_degs=angles_degs,
+                        res_ohms=res_ohms,
+                    ),
+                )
+            )
+        exp.packed_oscillations = packed
+        return exp
+
     def get_oscillation(self, t: float, h: float) -> AMROscillation:
         """Retrieve an oscillation by temperature and magnetic field.
 
@@ -654,37 +1421,67 @@ class Experiment:
         """
         return self.oscillations_dict[request_key]
 
+    def get_oscillation_index(self) -> OscillationIndex:
+        """Return the temperature/field index, building it if oscillations changed.
+
+        Returns:
+            OscillationIndex over this experiment's oscillations.
+        """
+        # The size check also catches direct edits of oscillations_dict
+        if self._oscillation_index is None or len(
+            self._oscillation_index.oscillations
+        ) != len(self.oscillations_dict):
+            self._oscillation_index = OscillationIndex(
+                list(self.oscillations_dict.values())
+            )
+        return self._oscillation_index
+
     def get_multiple_oscillations(
         self,
         t: float | list | None = None,
         h: float | list | None = None,
+        t_range: tuple | None = None,
+        h_range: tuple | None = None,
+        t_tol: float = 0,
+        h_tol: float = 0,
     ) -> list | None:
         """Filter oscillations by temperature and/or magnetic field.
 
         Args:
             t: Temperature value(s) to filter by. None returns all temperatures.
             h: Magnetic field value(s) to filter by. None returns all fields.
+            t_range: Inclusive (min, max) temperature range to filter by.
+            h_range: Inclusive (min, max) magnetic field range to filter by.
+            t_tol: Tolerance for matching t values. Exact match by default.
+            h_tol: Tolerance for matching h values. Exact match by default.
 
         Returns:
             List of AMROscillation objects matching the criteria.
         """
 
-        if t is None and h is None:
+        if t is None and h is None and t_range is None and h_range is None:
             return list(self.oscillations_dict.values())
 
-        if t is not None:
-            t = np.atleast_1d(t).flatten()
+        return self.get_oscillation_index().select(
+            t=t, h=h, t_range=t_range, h_range=h_range, t_tol=t_tol, h_tol=h_tol
+        )
+
+    def get_nearest_oscillation(
+        self, t: float, h: float, t_tol: float = np.inf, h_tol: float = np.inf
+    ) -> AMROscillation | None:
+        """Retrieve the oscillation closest to a temperature and magnetic field.
 
-        if h is not None:
-            h = np.atleast_1d(h).flatten()
+        Args:
+            t: Target temperature in Kelvin.
+            h: Target magnetic field in Tesla.
+            t_tol: Maximum temperature distance.
+            h_tol: Maximum magnetic field distance.
 
-        oscillations = []
-        for osc in self.oscillations_dict.values():
-            t_matches = (t is None) or np.any(osc.compare_temperature(t))
-            h_matches = (h is None) or np.any(osc.compare_magnetic_field(h))
-            if t_matches and h_matches:
-                oscillations.append(osc)
-        return oscillations
+        Returns:
+            Closest AMROscillation, ranked by temperature then field distance, or
+            None if none lies within the tolerances.
+        """
+        return self.get_oscillation_index().nearest(t, h, t_tol=t_tol, h_tol=h_tol)
 
     def get_experiment_as_dataframe(self) -> pd.DataFrame:
         """Convert all oscillation data in this experiment to a DataFrame.
@@ -692,31 +1489,262 @@ class Experiment:
         Returns:
             DataFrame with one row per angle measurement, including all derived values.
         """
-        rows = []
+        oscs = list(self.oscillations_dict.values())
+        if len(oscs) == 0:
+            return pd.DataFrame()
+
+        # Each oscillation has arrays of angles and resistivities with derived values
+        data_columns = [osc.osc_data.get_data_columns() for osc in oscs]
+        n_rows = [len(osc.osc_data.angles_degs) for osc in oscs]
+        columns = {
+            HEADER_EXP_LABEL: np.repeat(self.experiment_label, sum(n_rows)),
+            HEADER_TEMP: np.repeat([osc.key.temperature for osc in oscs], n_rows),
+            HEADER_MAGNET: np.repeat([osc.key.magnetic_field for osc in oscs], n_rows),
+            HEADER_GEO: np.repeat(self.geometry, sum(n_rows)),
+        }
+        for header in data_columns[0].keys():
+            columns[header] = np.concatenate([cols[header] for cols in data_columns])
+        return pd.DataFrame(columns)
+
+    def get_experiment_as_arrays(self) -> dict[str, np.ndarray]:
+        """Pack all oscillations in this experiment into flat, columnar arrays.
+
+        Angles, resistivities, Fourier spectra and fit parameters of every oscillation
+        are concatenated into one array per quantity. The '*_offsets' arrays give the
+        start and end of each oscillation's slice, so oscillation i of e.g. angles_degs
+        is angles_degs[data_offsets[i]:data_offsets[i + 1]]. Parameter bounds are not
+        stored.
+
+        Returns:
+            Dictionary of array name to numpy array, suitable for np.savez().
+        """
+        temps, fields_, n_data, n_fourier = [], [], [], []
+        n_fit, n_residuals, n_covar = [], [], []
+        angles, res, xf, yf = [], [], [], []
+        fit_stats = {
+            "fit_means": [],
+            "fit_means_errs": [],
+            "fit_chi_squared": [],
+            "fit_red_chi_squared": [],
+            "fit_succeeded": [],
+            "fit_required_refit": [],
+        }
+        fit_params = {
+            "fit_symmetries": [],
+            "fit_amplitudes": [],
+            "fit_amplitudes_errs": [],
+            "fit_phases": [],
+            "fit_phases_errs": [],
+        }
+        has_fit, residuals, covars = [], [], []
+
         for osc_key, osc in self.oscillations_dict.items():
             data = osc.osc_data
-            # Each oscillation has arrays of angles and resistivities with derived values   │
-            for i in range(len(data.angles_degs)):
-                row = {
-                    HEADER_EXP_LABEL: self.experiment_label,
-                    HEADER_TEMP: osc_key.temperature,
-                    HEADER_MAGNET: osc_key.magnetic_field,
-                    HEADER_GEO: self.geometry,
-                    HEADER_ANGLE_DEG: data.angles_degs[i],
-                    HEADER_ANGLE_RAD: data.angles_rads[i],
-                    HEADER_RES_OHM: data.res_ohms[i],
-                    HEADER_RES_UOHM: c.convert_ohms_to_uohms(data.res_ohms[i]),
-                    HEADER_RES_DEL_MEAN_OHM: data.delta_res_mean_ohms[i],
-                    HEADER_RES_DEL_MEAN_UOHM: data.delta_res_mean_uohms[i],
-                    HEADER_RES_DEF_MEAN_NORM: data.delta_res_mean_norm[i],
-                    HEADER_RES_DEL_MEAN_NORM_PCT: data.delta_res_mean_norm_pct[i],
-                    HEADER_RES_DEL_0DEG_OHM: data.delta_res_0deg_ohms[i],
-                    HEADER_RES_DEL_0DEG_UOHM: data.delta_res_0deg_uohms[i],
-                    HEADER_RES_DEL_0DEG_NORM: data.delta_res_0deg_norm[i],
-                    HEADER_RES_DEL_0DEG_NORM_PCT: data.delta_res_0deg_norm_pct[i],
-                }
-                rows.append(row)
-        return pd.DataFrame(rows)
+            temps.append(osc_key.temperature)
+            fields_.append(osc_key.magnetic_field)
+            n_data.append(len(data.angles_degs))
+            angles.append(data.angles_degs)
+            res.append(data.res_ohms)
+
+            fourier = osc.fourier_result
+            if fourier is None:
+                n_fourier.append(0)
+            else:
+                n_fourier.append(len(fourier.xf))
+                xf.append(fourier.xf)
+                yf.append(fourier.yf)
+
+            fit = osc.fit_result
+            has_fit.append(fit is not None)
+            if fit is None:
+                n_fit.append(0)
+                n_residuals.append(0)
+                n_covar.append(0)
+                for name in fit_stats:
+                    fit_stats[name].append(np.nan)
+                continue
+
+            params = fit.lmfit_params
+            mean_param = params[HEADER_PARAM_MEAN_PREFIX]
+            fit_stats["fit_means"].append(mean_param.value)
+            fit_stats["fit_means_errs"].append(self._get_param_stderr(mean_param))
+            fit_stats["fit_chi_squared"].append(fit.chi_squared)
+            fit_stats["fit_red_chi_squared"].append(fit.red_chi_squared)
+            fit_stats["fit_succeeded"].append(fit.fit_succeeded)
+            fit_stats["fit_required_refit"].append(fit.required_refit)
+
+            n_fit.append(len(fit.symmetries))
+            for freq in fit.symmetries:
+                amp_param = params[HEADER_PARAM_AMP_PREFIX + str(freq)]
+                phase_param = params[HEADER_PARAM_PHASE_PREFIX + str(freq)]
+                fit_params["fit_symmetries"].append(freq)
+                fit_params["fit_amplitudes"].append(amp_param.value)
+                fit_params["fit_amplitudes_errs"].append(
+                    self._get_param_stderr(amp_param)
+                )
+                fit_params["fit_phases"].append(phase_param.value)
+                fit_params["fit_phases_errs"].append(
+                    self._get_param_stderr(phase_param)
+                )
+            n_residuals.append(len(fit.model_residuals_ohms))
+            residuals.append(fit.model_residuals_ohms)
+
+            if fit.covar_matrix is None:
+                n_covar.append(0)
+            else:
+                n_covar.append(len(fit.covar_matrix))
+                covars.append(np.ravel(fit.covar_matrix))
+
+        arrays = {
+            "temperatures": np.asarray(temps, dtype=float),
+            "magnetic_fields": np.asarray(fields_, dtype=float),
+            "data_offsets": self._get_offsets(n_data),
+            "angles_degs": self._concat(angles, float),
+            "res_ohms": self._concat(res, float),
+            "fourier_offsets": self._get_offsets(n_fourier),
+            "fourier_xf": self._concat(xf, int),
+            "fourier_yf": self._concat(yf, complex),
+            "has_fit": np.asarray(has_fit, dtype=bool),
+            "fit_offsets": self._get_offsets(n_fit),
+            "fit_residual_offsets": self._get_offsets(n_residuals),
+            "fit_residuals": self._concat(residuals, float),
+            "fit_covar_sizes": np.asarray(n_covar, dtype=int),
+            "fit_covars": self._concat(covars, float),
+        }
+        for name, vals in fit_stats.items():
+            arrays[name] = np.asarray(vals, dtype=float)
+        arrays["fit_symmetries"] = np.asarray(fit_params.pop("fit_symmetries"), int)
+        for name, vals in fit_params.items():
+            arrays[name] = np.asarray(vals, dtype=float)
+        return arrays
+
+    @classmethod
+    def load_experiment_from_arrays(
+        cls, metadata: dict, arrays: dict[str, np.ndarray]
+    ) -> "Experiment":
+        """Build an Experiment from arrays made by get_experiment_as_arrays().
+
+        The experimental data is kept packed, with each oscillation's data a view
+        into the stored flat arrays. Fit results are rebuilt as lmfit MinimizerResult
+        objects holding the stored parameters, errors, statistics, residuals and
+        covariance matrix.
+
+        Args:
+            metadata: Dictionary with experiment_label, geometry, wire_sep,
+                cross_section and material.
+            arrays: Dictionary of array name to numpy array.
+
+        Returns:
+            Experiment containing all stored oscillations and their results.
+        """
+        packed = PackedOscillations(
+            temperatures=arrays["temperatures"],
+            magnetic_fields=arrays["magnetic_fields"],
+            offsets=arrays["data_offsets"],
+            angles_degs=arrays["angles_degs"],
+            res_ohms=arrays["res_ohms"],
+        )
+        exp = cls.from_packed_oscillations(
+            experiment_label=metadata["experiment_label"],
+            geometry=metadata["geometry"],
+            wire_sep=metadata["wire_sep"],
+            cross_section=metadata["cross_section"],
+            packed=packed,
+            material=metadata.get("material"),
+        )
+        fourier_offsets = arrays["fourier_offsets"]
+        fit_offsets = arrays["fit_offsets"]
+        residual_offsets = arrays["fit_residual_offsets"]
+        covar_offsets = cls._get_offsets(arrays["fit_covar_sizes"] ** 2)
+
+        for i, osc in enumerate(exp.oscillations_dict.values()):
+            fourier_slice = slice(fourier_offsets[i], fourier_offsets[i + 1])
+            if fourier_offsets[i + 1] > fourier_offsets[i]:
+                osc.add_fourier_result(
+                    xf=arrays["fourier_xf"][fourier_slice],
+                    yf=arrays["fourier_yf"][fourier_slice],
+                )
+
+            if arrays["has_fit"][i]:
+                fit_slice = slice(fit_offsets[i], fit_offsets[i + 1])
+                residual_slice = slice(residual_offsets[i], residual_offsets[i + 1])
+                covar_size = arrays["fit_covar_sizes"][i]
+                covar = None
+                if covar_size > 0:
+                    covar = arrays["fit_covars"][
+                        covar_offsets[i] : covar_offsets[i + 1]
+                    ].reshape(covar_size, covar_size)
+                lmfit_result = cls._build_lmfit_result(
+                    arrays, i, fit_slice, residual_slice, covar
+                )
+                osc.add_fit_result(
+                    lmfit_result=lmfit_result,
+                    refitted=bool(arrays["fit_required_refit"][i]),
+                )
+        return exp
+
+    @staticmethod
+    def _build_lmfit_result(
+        arrays: dict[str, np.ndarray],
+        i: int,
+        fit_slice: slice,
+        residual_slice: slice,
+        covar: np.ndarray | None,
+    ) -> lm.minimizer.MinimizerResult:
+        """Rebuild the lmfit result of oscillation i from stored fit arrays."""
+        params = lm.Parameters()
+        params.add(HEADER_PARAM_MEAN_PREFIX, value=arrays["fit_means"][i])
+        params[HEADER_PARAM_MEAN_PREFIX].stderr = Experiment._get_stored_stderr(
+            arrays["fit_means_errs"][i]
+        )
+        for freq, amp, amp_err, phase, phase_err in zip(
+            arrays["fit_symmetries"][fit_slice],
+            arrays["fit_amplitudes"][fit_slice],
+            arrays["fit_amplitudes_errs"][fit_slice],
+            arrays["fit_phases"][fit_slice],
+            arrays["fit_phases_errs"][fit_slice],
+        ):
+            freq = int(freq)
+            params.add(HEADER_PARAM_FREQ_PREFIX + str(freq), value=freq, vary=False)
+            params.add(HEADER_PARAM_AMP_PREFIX + str(freq), value=amp)
+            params.add(HEADER_PARAM_PHASE_PREFIX + str(freq), value=phase)
+            params[HEADER_PARAM_AMP_PREFIX + str(freq)].stderr = (
+                Experiment._get_stored_stderr(amp_err)
+            )
+            params[HEADER_PARAM_PHASE_PREFIX + str(freq)].stderr = (
+                Experiment._get_stored_stderr(phase_err)
+            )
+
+        return lm.minimizer.MinimizerResult(
+            params=params,
+            chisqr=arrays["fit_chi_squared"][i],
+            redchi=arrays["fit_red_chi_squared"][i],
+            covar=covar,
+            success=bool(arrays["fit_succeeded"][i]),
+            residual=arrays["fit_residuals"][residual_slice],
+        )
+
+    @staticmethod
+    def _get_param_stderr(param: lm.Parameter) -> float:
+        """Return a parameter's standard error, or NaN if it was not estimated."""
+        return np.nan if param.stderr is None else param.stderr
+
+    @staticmethod
+    def _get_stored_stderr(stderr: float) -> float | None:
+        """Return a stored standard error, or None if it was not estimated."""
+        return None if np.isnan(stderr) else float(stderr)
+
+    @staticmethod
+    def _get_offsets(lengths: list | np.ndarray) -> np.ndarray:
+        """Return the slice offsets of consecutive blocks with the given lengths."""
+        return np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+
+    @staticmethod
+    def _concat(arrays: list, dtype: type) -> np.ndarray:
+        """Concatenate a list of arrays, returning an empty array if there are none."""
+        if len(arrays) == 0:
+            return np.empty(0, dtype=dtype)
+        return np.concatenate(arrays).astype(dtype, copy=False)
 
 
 @dataclass
@@ -729,9 +1757,22 @@ class ProjectData:
 
     fit_filter_str: str | None = None
 
+    # Signatures of the processed files each experiment was loaded from
+    source_files: dict = field(default_factory=dict)
+
     def __post_init__(self) -> None:
-        """Initialize the pickle file path for this project."""
+        """Initialize the pickle file and project store paths for this project."""
         self.pickle_fp = FINAL_DATA_PATH / (self.project_name + ".pkl")
+        self._init_project_store()
+
+    def _init_project_store(self) -> None:
+        """Point this project at its default store, with every experiment loaded."""
+        self.store_path = FINAL_DATA_PATH / (
+            self.project_name + PROJECT_STORE_DIR_SUFFIX
+        )
+        # Labels of stored experiments that have not been read from the store yet
+        self.unloaded_experiments = []
+        return
 
     def add_experiment(self, exp: Experiment) -> None:
         """Add an experiment to this project.
@@ -758,46 +1799,104 @@ class ProjectData:
             print("Experiment not found. Cannot replace non-existent experiment.")
             print(exp.experiment_label)
 
+    def remove_experiment(self, act_label: str) -> None:
+        """Remove an experiment, and all of its oscillations, from this project.
+
+        Args:
+            act_label: Experiment label string.
+        """
+        if act_label in self.experiments_dict.keys():
+            del self.experiments_dict[act_label]
+            self.experiments_count -= 1
+        elif act_label in self.unloaded_experiments:
+            # Its shard is deleted on the next save_project()
+            self.unloaded_experiments.remove(act_label)
+        else:
+            print("Experiment not found. Cannot remove non-existent experiment.")
+            print(act_label)
+
     def get_experiment(self, act_label: str) -> Experiment:
         """Retrieve an experiment by its label.
 
+        Experiments not yet read from the project store are loaded on first access.
+
         Args:
             act_label: Experiment label string.
 
         Returns:
             Experiment object matching the label.
         """
+        if act_label in self.unloaded_experiments:
+            self.load_experiments(act_label)
         return self.experiments_dict[act_label]
 
+    def has_experiment(self, act_label: str) -> bool:
+        """Check whether this project holds an experiment, loaded or not.
+
+        Args:
+            act_label: Experiment label string.
+
+        Returns:
+            True if the experiment is loaded or can be read from the project store.
+        """
+        return (
+            act_label in self.experiments_dict or act_label in self.unloaded_experiments
+        )
+
     def get_experiment_labels(self) -> list[str]:
-        """Return list of all experiment labels in this project."""
-        return list(self.experiments_dict.keys())
+        """Return list of all experiment labels in this project.
+
+        Includes experiments not yet read from the project store.
+        """
+        labels = list(self.experiments_dict.keys())
+        return labels + [
+            act_label
+            for act_label in self.unloaded_experiments
+            if act_label not in self.experiments_dict
+        ]
 
     def filter_oscillations(
         self,
         experiments: str | list | None = None,
         t_vals: float | list | None = None,
         h_vals: float | list | None = None,
+        t_range: tuple | None = None,
+        h_range: tuple | None = None,
+        t_tol: float = 0,
+        h_tol: float = 0,
     ) -> list:
         """Filter all oscillations across experiments by label, temperature, and/or field.
 
+        Experiments not yet read from the project store are loaded first.
+
         Args:
             experiments: Experiment label(s) to filter by.
             t_vals: Temperature value(s) to filter by.
             h_vals: Magnetic field value(s) to filter by.
+            t_range: Inclusive (min, max) temperature range to filter by.
+            h_range: Inclusive (min, max) magnetic field range to filter by.
+            t_tol: Tolerance for matching t_vals. Exact match by default.
+            h_tol: Tolerance for matching h_vals. Exact match by default.
 
         Returns:
             Flattened list of matching AMROscillation objects.
         """
         if experiments is None:
-            experiments = self.experiments_dict.keys()
+            experiments = self.get_experiment_labels()
         elif isinstance(experiments, str):
             experiments = [experiments]
 
         osc_list = []
         for exp_label in experiments:
-            exp = self.experiments_dict[exp_label]
-            oscs = exp.get_multiple_oscillations(t_vals, h_vals)
+            exp = self.get_experiment(exp_label)
+            oscs = exp.get_multiple_oscillations(
+                t_vals,
+                h_vals,
+                t_range=t_range,
+                h_range=h_range,
+                t_tol=t_tol,
+                h_tol=h_tol,
+            )
             osc_list.append(oscs)
         osc_list = u.flatten_list(osc_list)
         return osc_list
@@ -810,6 +1909,19 @@ class ProjectData:
         """
         return self.pickle_fp.is_file()
 
+    def check_for_project_store(self, path: Path = None) -> bool:
+        """Check for an existing columnar project store.
+
+        Args:
+            path: Store directory. Uses default if None.
+
+        Returns:
+            True if a project store index exists at the path, False otherwise.
+        """
+        if path is None:
+            path = self.store_path
+        return (path / PROJECT_STORE_INDEX_FN).is_file()
+
     def read_amro_data_from_dataframe(self, df: pd.DataFrame) -> None:
         """Load AMRO data from a pandas DataFrame into the project structure.
 
@@ -817,9 +1929,8 @@ class ProjectData:
             df: DataFrame containing AMRO oscillation data.
         """
 
-        for act in df[HEADER_EXP_LABEL].unique():
-            sub_df = u.query_dataframe(df, act=act)
-            geom = sub_df[HEADER_GEO].unique()[0]
+        for act, sub_df in df.groupby(HEADER_EXP_LABEL, sort=False):
+            geom = sub_df[HEADER_GEO].iloc[0]
 
             try:
                 exper = self.get_experiment(act)
@@ -827,36 +1938,102 @@ class ProjectData:
                 exper = Experiment(experiment_label=act, geometry=geom)
                 self.add_experiment(exper)
 
-            for t in sub_df[HEADER_TEMP].unique():
-                sub_sub_df = u.query_dataframe(sub_df, t=t)
-                for h in sub_sub_df[HEADER_MAGNET].unique():
-                    experiment_df = u.query_dataframe(sub_sub_df, h=h)
-
-                    key = OscillationKey(
-                        experiment_label=act, temperature=t, magnetic_field=h
-                    )
-                    angles = experiment_df[HEADER_ANGLE_DEG].values
-                    res = experiment_df[HEADER_RES_OHM].values
+            for (t, h), experiment_df in sub_df.groupby(
+                [HEADER_TEMP, HEADER_MAGNET], sort=False
+            ):
+                key = OscillationKey(
+                    experiment_label=act, temperature=t, magnetic_field=h
+                )
+                angles = experiment_df[HEADER_ANGLE_DEG].values
+                res = experiment_df[HEADER_RES_OHM].values
 
-                    exp_data = ExperimentalData(
-                        experiment_key=key, angles_degs=angles, res_ohms=res
-                    )
-                    osc = AMROscillation(key=key, osc_data=exp_data)
-                    exper.add_oscillation(osc)
+                exp_data = ExperimentalData(
+                    experiment_key=key, angles_degs=angles, res_ohms=res
+                )
+                osc = AMROscillation(key=key, osc_data=exp_data)
+                exper.add_oscillation(osc)
         return
 
     def read_fit_results_from_dataframe(
-        self, df: pd.DataFrame, lmfit_results_dict: dict
+        self, df: pd.DataFrame, lmfit_results_dict: dict | None = None
     ) -> None:
-        """Load fit results from a DataFrame and lmfit objects dictionary.
+        """Load fit results from a DataFrame, optionally with their lmfit objects.
+
+        Without lmfit_results_dict, each row of the DataFrame (as written by
+        get_fit_results_as_df()) is turned directly into a CompactFitResult. The
+        covariance matrix is not stored in the DataFrame and is left as None.
+
+        Args:
+            df: DataFrame containing fit parameter data.
+            lmfit_results_dict: Nested dictionary of lmfit MinimizerResult objects,
+                keyed by experiment label, temperature and field. If given, full
+                FitResult objects are built from it instead.
+        """
+        if lmfit_results_dict is not None:
+            self._read_lmfit_results(df, lmfit_results_dict)
+            return
+        if len(df) == 0:
+            return
+
+        df, keys, offsets = self._split_dataframe_by_oscillation(df)
+
+        freq_cols = [
+            col
+            for col in df.columns
+            if col.startswith(HEADER_PARAM_FREQ_PREFIX)
+            and col[len(HEADER_PARAM_FREQ_PREFIX) :].isdigit()
+        ]
+        freqs = np.asarray(
+            [int(col[len(HEADER_PARAM_FREQ_PREFIX) :]) for col in freq_cols]
+        )
+        present = df[freq_cols].notna().to_numpy()
+
+        def get_columns(prefix: str, suffix: str = "") -> np.ndarray:
+            cols = [prefix + str(f) + suffix for f in freqs]
+            return df[cols].to_numpy(dtype=float)
+
+        amps = get_columns(HEADER_PARAM_AMP_PREFIX)
+        amps_errs = get_columns(HEADER_PARAM_AMP_PREFIX, "_err")
+        phases = get_columns(HEADER_PARAM_PHASE_PREFIX)
+        phases_errs = get_columns(HEADER_PARAM_PHASE_PREFIX, "_err")
+        means = df[HEADER_PARAM_MEAN_PREFIX].to_numpy(dtype=float)
+        means_errs = df[HEADER_PARAM_MEAN_PREFIX + "_err"].to_numpy(dtype=float)
+        chisqrs = df[HEADER_FIT_CHISQ].to_numpy(dtype=float)
+        redchis = df[HEADER_FIT_RED_CHISQ].to_numpy(dtype=float)
+        succeeded = df["fit_succeeded"].to_numpy(dtype=bool)
+        refitted = df["required_refit"].to_numpy(dtype=bool)
+
+        missing = set()
+        for (act, t, h), row in zip(keys, offsets[:-1]):
+            exper = self._get_experiment_for_import(act, missing)
+            if exper is None:
+                continue
+            osc = exper.get_oscillation(t=t, h=h)
+            valid = present[row]
+            osc.add_compact_fit_result(
+                symmetries=freqs[valid],
+                amplitudes=amps[row, valid],
+                amplitudes_errs=amps_errs[row, valid],
+                phases=phases[row, valid],
+                phases_errs=phases_errs[row, valid],
+                mean=means[row],
+                mean_err=means_errs[row],
+                chi_squared=float(chisqrs[row]),
+                red_chi_squared=float(redchis[row]),
+                fit_succeeded=bool(succeeded[row]),
+                refitted=bool(refitted[row]),
+            )
+        return
+
+    def _read_lmfit_results(self, df: pd.DataFrame, lmfit_results_dict: dict) -> None:
+        """Add the lmfit result of every oscillation in the DataFrame.
 
         Args:
             df: DataFrame containing fit parameter data.
             lmfit_results_dict: Nested dictionary of lmfit MinimizerResult objects.
         """
 
-        for act in df[HEADER_EXP_LABEL].unique():
-            sub_df = u.query_dataframe(df, act=act)
+        for act, sub_df in df.groupby(HEADER_EXP_LABEL, sort=False):
             try:
                 exper = self.get_experiment(act)
             except KeyError:
@@ -865,62 +2042,132 @@ class ProjectData:
                 )
                 return
 
-            for t in sub_df[HEADER_TEMP].unique():
-                sub_sub_df = u.query_dataframe(sub_df, t=t)
-                for h in sub_sub_df[HEADER_MAGNET].unique():
+            for t, h in (
+                sub_df[[HEADER_TEMP, HEADER_MAGNET]]
+                .drop_duplicates()
+                .itertuples(index=False)
+            ):
 
-                    lmfit_obj, refitted = lmfit_results_dict[act][t][h]
+                lmfit_obj, refitted = lmfit_results_dict[act][t][h]
 
-                    osc = exper.get_oscillation(t=t, h=h)
+                osc = exper.get_oscillation(t=t, h=h)
 
-                    osc.add_fit_result(
-                        lmfit_result=lmfit_obj,
-                        refitted=refitted,
-                    )
+                osc.add_fit_result(
+                    lmfit_result=lmfit_obj,
+                    refitted=refitted,
+                )
 
         return
 
     def read_fourier_results_from_dataframe(self, df: pd.DataFrame) -> None:
         """Load Fourier results from a pandas DataFrame.
 
+        The long-format frame is sorted by oscillation once and split at the group
+        offsets, so every FourierResult is built from array slices.
+
         Args:
             df: DataFrame containing Fourier transform results.
         """
-        for act in df[HEADER_EXP_LABEL].unique():
-            sub_df = u.query_dataframe(df, act=act)
+        if len(df) == 0:
+            return
 
-            try:
-                exper = self.get_experiment(act)
-            except KeyError:
-                print(
-                    f"No Experiment found for {act}. Create Experiment before adding Fourier Results."
-                )
+        df, keys, offsets = self._split_dataframe_by_oscillation(df)
+        freqs = df[HEADER_PARAM_FREQ_PREFIX].to_numpy()
+        mags = df[HEADER_PARAM_AMP_PREFIX].to_numpy()
+        phases = df[HEADER_PHASE + "_rads"].to_numpy()
+        yf = mags * np.exp(1j * phases)
+
+        missing = set()
+        for (act, t, h), start, stop in zip(keys, offsets[:-1], offsets[1:]):
+            exper = self._get_experiment_for_import(act, missing)
+            if exper is None:
                 continue
+            osc = exper.get_oscillation(t=t, h=h)
+            osc.add_fourier_result(xf=freqs[start:stop], yf=yf[start:stop])
+
+        return
+
+    @staticmethod
+    def _split_dataframe_by_oscillation(
+        df: pd.DataFrame,
+    ) -> tuple[pd.DataFrame, list[tuple], np.ndarray]:
+        """Sort a long-format DataFrame by oscillation and find each group's rows.
 
-            for t in sub_df[HEADER_TEMP].unique():
-                sub_sub_df = u.query_dataframe(sub_df, t=t)
-                for h in sub_sub_df[HEADER_MAGNET].unique():
-                    fourier_result_df = u.query_dataframe(sub_sub_df, h=h)
-                    osc = exper.get_oscillation(t=t, h=h)
+        Args:
+            df: DataFrame with experiment label, temperature and field columns.
+
+        Returns:
+            Tuple of (sorted DataFrame, list of (label, temperature, field) keys,
+            row offsets), where oscillation i spans rows offsets[i]:offsets[i + 1].
+        """
+        df = df.sort_values(
+            [HEADER_EXP_LABEL, HEADER_TEMP, HEADER_MAGNET], kind="stable"
+        )
+        acts = df[HEADER_EXP_LABEL].to_numpy()
+        temps = df[HEADER_TEMP].to_numpy(dtype=float)
+        fields_ = df[HEADER_MAGNET].to_numpy(dtype=float)
+
+        is_start = np.ones(len(df), dtype=bool)
+        is_start[1:] = (
+            (acts[1:] != acts[:-1])
+            | (temps[1:] != temps[:-1])
+            | (fields_[1:] != fields_[:-1])
+        )
+        starts = np.flatnonzero(is_start)
+        keys = list(
+            zip(
+                acts[starts].tolist(),
+                temps[starts].tolist(),
+                fields_[starts].tolist(),
+            )
+        )
+        return df, keys, np.append(starts, len(df))
 
-                    freqs = fourier_result_df[HEADER_PARAM_FREQ_PREFIX].values
+    def _get_experiment_for_import(self, act: str, missing: set) -> Experiment | None:
+        """Return an experiment to import results into, reporting missing ones once.
 
-                    mags = fourier_result_df[HEADER_PARAM_AMP_PREFIX].values
-                    phases = fourier_result_df[HEADER_PHASE + "_rads"].values
-                    yf = mags * np.exp(1j * phases)
+        Args:
+            act: Experiment label.
+            missing: Labels already reported as missing. Updated in place.
 
-                    osc.add_fourier_result(xf=freqs, yf=yf)
+        Returns:
+            Experiment, or None if the project has no experiment with this label.
+        """
+        if act in missing:
+            return None
+        try:
+            return self.get_experiment(act)
+        except KeyError:
+            print(
+                f"No Experiment found for {act}. Create Experiment before adding results."
+            )
+            missing.add(act)
+            return None
 
+    def compact_fit_results(self) -> None:
+        """Replace every loaded fit result with an equivalent CompactFitResult."""
+        for experiment in self.experiments_dict.values():
+            for osc in experiment.oscillations_dict.values():
+                osc.compact_fit_result()
         return
 
-    def save_project_to_pickle(self, fp: Path = None) -> None:
+    def save_project_to_pickle(
+        self, fp: Path = None, compact_fit_results: bool = False
+    ) -> None:
         """Save this project to a pickle file.
 
         Args:
             fp: File path for saving. Uses default if None.
+            compact_fit_results: If True, replace fit results with CompactFitResult
+                objects before pickling, which shrinks the file considerably.
         """
         if fp is None:
             fp = self.pickle_fp
+        if self.unloaded_experiments:
+            # Export the whole project, not only the experiments read so far
+            self.load_experiments(self.unloaded_experiments)
+        if compact_fit_results:
+            self.compact_fit_results()
         with open(fp, "wb") as f:
             pickle.dump(self, f)
         return
@@ -936,46 +2183,184 @@ class ProjectData:
             ProjectData instance loaded from file.
         """
         with open(fp, "rb") as f:
-            return pickle.load(f)
+            project = pickle.load(f)
+        project._init_project_store()
+        # Pickled before source files were recorded
+        project.source_files = getattr(project, "source_files", {})
+        return project
+
+    def save_project(self, path: Path = None) -> list[str]:
+        """Save this project to a columnar store, with one .npz shard per experiment.
+
+        Shards hold the arrays from Experiment.get_experiment_as_arrays(), and an
+        index file holds the project and experiment metadata along with each shard's
+        content hash. Only experiments whose arrays differ from their stored shard
+        are written, and shards of experiments removed from the project are deleted.
+
+        Args:
+            path: Store directory. Uses default if None.
+
+        Returns:
+            List of labels of the experiments whose shards were written.
+        """
+        if path is None:
+            path = self.store_path
+        path.mkdir(parents=True, exist_ok=True)
+
+        stored = {}
+        if self.check_for_project_store(path):
+            stored = self._read_store_index(path)["experiments"]
+
+        experiments, written = {}, []
+        for act_label, exp in self.experiments_dict.items():
+            arrays = exp.get_experiment_as_arrays()
+            arrays_hash = u.get_arrays_hash(arrays)
+            shard_fn = act_label + ".npz"
+            old_entry = stored.get(act_label, {})
+            if (
+                old_entry.get("sha256") != arrays_hash
+                or not (path / shard_fn).is_file()
+            ):
+                np.savez(path / shard_fn, **arrays)
+                written.append(act_label)
+
+            experiments[act_label] = {
+                "experiment_label": act_label,
+                "geometry": exp.geometry,
+                "wire_sep": float(exp.wire_sep),
+                "cross_section": float(exp.cross_section),
+                "material": exp.material,
+                "oscillations_count": len(exp.oscillations_dict),
+                "shard": shard_fn,
+                "sha256": arrays_hash,
+            }
+
+        for act_label in self.unloaded_experiments:
+            if act_label in stored and act_label not in experiments:
+                experiments[act_label] = stored[act_label]
+
+        for act_label, old_entry in stored.items():
+            if act_label not in experiments:
+                (path / old_entry["shard"]).unlink(missing_ok=True)
+
+        index = {
+            "project_name": self.project_name,
+            "fit_filter_str": self.fit_filter_str,
+            "source_files": self.source_files,
+            "experiments": experiments,
+        }
+        with open(path / PROJECT_STORE_INDEX_FN, "w") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        return written
+
+    @classmethod
+    def load_project(
+        cls,
+        project_name: str,
+        experiments: str | list | None = None,
+        path: Path = None,
+    ) -> "ProjectData":
+        """Load a ProjectData instance from its columnar store.
+
+        Only the requested experiments are read. The remaining stored experiments
+        are read on first access through get_experiment() or load_experiments().
+
+        Args:
+            project_name: Name of the project.
+            experiments: Experiment label(s) to read now. Reads all if None.
+            path: Store directory. Uses default if None.
+
+        Returns:
+            ProjectData instance loaded from the store.
+        """
+        project = cls(project_name=project_name)
+        if path is not None:
+            project.store_path = path
 
-    def get_fit_results_as_df(self) -> pd.DataFrame:
+        index = project._read_store_index(project.store_path)
+        project.fit_filter_str = index["fit_filter_str"]
+        project.source_files = index["source_files"]
+        project.unloaded_experiments = list(index["experiments"].keys())
+
+        if experiments is None:
+            experiments = list(index["experiments"].keys())
+        project.load_experiments(experiments)
+        return project
+
+    def load_experiments(self, experiments: str | list) -> None:
+        """Read experiments that have not been loaded yet from the project store.
+
+        Args:
+            experiments: Experiment label(s) to read.
+        """
+        if isinstance(experiments, str):
+            experiments = [experiments]
+
+        index = self._read_store_index(self.store_path)
+        for act_label in list(experiments):
+            if act_label not in self.unloaded_experiments:
+                continue
+            metadata = index["experiments"][act_label]
+            with np.load(self.store_path / metadata["shard"]) as shard:
+                arrays = {name: shard[name] for name in shard.files}
+            self.add_experiment(
+                Experiment.load_experiment_from_arrays(metadata, arrays)
+            )
+            self.unloaded_experiments.remove(act_label)
+        return
+
+    @staticmethod
+    def _read_store_index(path: Path) -> dict:
+        """Read the index file of the project store at the given path."""
+        with open(path / PROJECT_STORE_INDEX_FN, "r") as f:
+            return json.load(f)
+
+    def get_fit_results_as_df(self, fit_results: dict | None = None) -> pd.DataFrame:
         """Convert all fit results to a DataFrame with one row per oscillation.
 
+        Args:
+            fit_results: Fit results keyed by OscillationKey to convert instead of
+                those attached to the oscillations, e.g. one filter setting of
+                AMROFitter.fit_filter_sweep().
+
         Returns:
             DataFrame containing fit parameters and statistics.
         """
-        rows = []
-        for act_label in self.experiments_dict.keys():
-            experiment = self.experiments_dict[act_label]
-            for osc_key in experiment.oscillations_dict.keys():
-                osc = experiment.oscillations_dict[osc_key]
-
-                fit_result = osc.fit_result
-                if fit_result is None:
-                    print(f"No fit result found for {osc_key}")
-                    continue
+        if fit_results is None:
+            fit_results = {}
+            for act_label in self.get_experiment_labels():
+                experiment = self.get_experiment(act_label)
+                for osc_key in experiment.oscillations_dict.keys():
+                    osc = experiment.oscillations_dict[osc_key]
+                    if osc.fit_result is None:
+                        print(f"No fit result found for {osc_key}")
+                        continue
+                    fit_results[osc_key] = osc.fit_result
 
-                row = {
-                    HEADER_EXP_LABEL: osc_key.experiment_label,
-                    HEADER_TEMP: osc_key.temperature,
-                    HEADER_MAGNET: osc_key.magnetic_field,
-                    HEADER_GEO: experiment.geometry,
-                    HEADER_PARAM_MEAN_PREFIX: fit_result.mean,
-                    HEADER_PARAM_MEAN_PREFIX + "_err": fit_result.mean_err,
-                    HEADER_FIT_CHISQ: fit_result.chi_squared,
-                    HEADER_FIT_RED_CHISQ: fit_result.red_chi_squared,
-                    "fit_succeeded": fit_result.fit_succeeded,
-                    "required_refit": fit_result.required_refit,
-                }
-                # for freq in fit_result.fitted_params_dict.keys():
-                for freq in fit_result.symmetries:
-                    params = fit_result.fitted_params_dict[freq]
-                    row[HEADER_PARAM_FREQ_PREFIX + str(freq)] = freq
-                    row[HEADER_PARAM_AMP_PREFIX + str(freq)] = params[0][0]
-                    row[HEADER_PARAM_AMP_PREFIX + str(freq) + "_err"] = params[0][1]
-                    row[HEADER_PARAM_PHASE_PREFIX + str(freq)] = params[1][0]
-                    row[HEADER_PARAM_PHASE_PREFIX + str(freq) + "_err"] = params[1][1]
-                rows.append(row)
+        rows = []
+        for osc_key, fit_result in fit_results.items():
+            experiment = self.get_experiment(osc_key.experiment_label)
+            row = {
+                HEADER_EXP_LABEL: osc_key.experiment_label,
+                HEADER_TEMP: osc_key.temperature,
+                HEADER_MAGNET: osc_key.magnetic_field,
+                HEADER_GEO: experiment.geometry,
+                HEADER_PARAM_MEAN_PREFIX: fit_result.mean,
+                HEADER_PARAM_MEAN_PREFIX + "_err": fit_result.mean_err,
+                HEADER_FIT_CHISQ: fit_result.chi_squared,
+                HEADER_FIT_RED_CHISQ: fit_result.red_chi_squared,
+                "fit_succeeded": fit_result.fit_succeeded,
+                "required_refit": fit_result.required_refit,
+            }
+            # for freq in fit_result.fitted_params_dict.keys():
+            for freq in fit_result.symmetries:
+                params = fit_result.fitted_params_dict[freq]
+                row[HEADER_PARAM_FREQ_PREFIX + str(freq)] = freq
+                row[HEADER_PARAM_AMP_PREFIX + str(freq)] = params[0][0]
+                row[HEADER_PARAM_AMP_PREFIX + str(freq) + "_err"] = params[0][1]
+                row[HEADER_PARAM_PHASE_PREFIX + str(freq)] = params[1][0]
+                row[HEADER_PARAM_PHASE_PREFIX + str(freq) + "_err"] = params[1][1]
+            rows.append(row)
 
         return pd.DataFrame(rows)
 
@@ -1020,8 +2405,8 @@ class ProjectData:
             DataFrame containing frequency, amplitude, and phase data.
         """
         rows = []
-        for act_label in self.experiments_dict.keys():
-            experiment = self.experiments_dict[act_label]
+        for act_label in self.get_experiment_labels():
+            experiment = self.get_experiment(act_label)
             for osc_key in experiment.oscillations_dict.keys():
                 osc = experiment.oscillations_dict[osc_key]
                 if osc.fourier_result is None:
@@ -1079,27 +2464,30 @@ class ProjectData:
     def get_summary_statistics(self) -> dict:
         """Calculate summary statistics for this project.
 
+        Experiments not yet read from the project store are loaded first.
+
         Returns:
             Dictionary containing counts of experiments, oscillations, and completed analyses.
         """
-        n_oscillations = sum(
-            len(exp.oscillations_dict) for exp in self.experiments_dict.values()
-        )
+        experiments = [
+            self.get_experiment(act_label) for act_label in self.get_experiment_labels()
+        ]
+        n_oscillations = sum(len(exp.oscillations_dict) for exp in experiments)
         n_fourier = sum(
             1
-            for exp in self.experiments_dict.values()
+            for exp in experiments
             for osc in exp.oscillations_dict.values()
             if osc.fourier_result is not None
         )
         n_fits = sum(
             1
-            for exp in self.experiments_dict.values()
+            for exp in experiments
             for osc in exp.oscillations_dict.values()
             if osc.fit_result is not None
         )
 
         return {
-            "n_experiments": len(self.experiments_dict),
+            "n_experiments": len(experiments),
             "n_oscillations": n_oscillations,
             "n_fourier_completed": n_fourier,
             "n_fits_completed": n_fits,
@@ -1127,7 +2515,7 @@ class ProjectData:
             cross_section: Cross-sectional area in cm^2.
             force_rescale: If True, rescale even if geometry values aren't default.
         """
-        old_exp = self.experiments_dict[experiment_label]
+        old_exp = self.get_experiment(experiment_label)
 
         if (old_exp.cross_section != 1 or old_exp.wire_sep != 1) and not force_rescale:
             print(
@@ -1164,7 +2552,7 @@ class ProjectData:
                 )
                 new_exp.add_oscillation(new_osc)
             self.replace_experiment(new_exp)
-            self.save_project_to_pickle()
+            self.save_project()
         return
 
     def _is_valid_scaling_input(
@@ -1203,26 +2591,156 @@ class ProjectData:
 
         return True
 
+    def get_combined_csv_fp(self) -> Path:
+        """Return the default path of this project's combined AMRO CSV."""
+        return FINAL_DATA_PATH / (self.project_name + COMBINED_AMRO_FN_SUFFIX)
+
+    def check_for_combined_csv(self) -> bool:
+        """Check for an existing combined AMRO CSV.
+
+        Returns:
+            True if the combined CSV exists at the default path, False otherwise.
+        """
+        return self.get_combined_csv_fp().is_file()
+
+    @staticmethod
+    def get_source_files_fp(fp: Path) -> Path:
+        """Return the path of the source files sidecar of a combined AMRO CSV.
+
+        Args:
+            fp: Path of the combined AMRO CSV.
+
+        Returns:
+            Path of the JSON file next to it, e.g. <name>_amro_combined_sources.json.
+        """
+        fp = Path(fp)
+        return fp.with_name(fp.stem + SOURCE_FILES_FN_SUFFIX)
+
     def save_amro_data_to_csv(self, fp: Path = None):
-        """TODO: Write tests for this"""
+        """Write the data of every experiment to a single long-format CSV.
+
+        Each experiment's wire separation and cross section are written alongside
+        its rows, so load_amro_data_from_csv() can rebuild the experiments. The
+        recorded source files are written to a JSON sidecar (see
+        get_source_files_fp()), so a project rebuilt from the CSV can still tell
+        which processed files changed since.
+
+        Args:
+            fp: Output path. Uses the project's combined CSV path if None.
+        """
         if fp is None:
-            fp = FINAL_DATA_PATH / (self.project_name + COMBINED_AMRO_FN_SUFFIX)
+            fp = self.get_combined_csv_fp()
 
         dfs = []
-        for exp_key, exp in self.experiments_dict.items():
+        for act_label in self.get_experiment_labels():
+            exp = self.get_experiment(act_label)
             df = exp.get_experiment_as_dataframe()
+            df.insert(df.columns.get_loc(HEADER_GEO) + 1, HEADER_WIRE_SEP, exp.wire_sep)
+            df.insert(
+                df.columns.get_loc(HEADER_WIRE_SEP) + 1,
+                HEADER_CROSS_SECTION,
+                exp.cross_section,
+            )
             dfs.append(df)
         if len(dfs) > 0:
             df = pd.concat(dfs)
             df.to_csv(fp, index=False, sep=",")
+            with open(self.get_source_files_fp(fp), "w") as f:
+                json.dump(self.source_files, f, indent=1)
         else:
             print("No experiments found to save!")
         return
 
     @classmethod
-    def load_amro_data_from_csv(cls, fp: Path = None):
-        """Expected format should match that outputted by save_amro_data_to_csv()"""
-        df = pd.read_csv(fp, sep=",")
+    def load_amro_data_from_csv(
+        cls, project_name: str, fp: Path = None, chunksize: int = None
+    ) -> "ProjectData":
+        """Rebuild a project's experiments and oscillations from a combined AMRO CSV.
 
-        # TODO Implement the reading in of the CSV into Experiment's and their AMROscillations.
-        return
+        Only LOADER_DESIRED_COLS are read. Rows are sorted and split by oscillation,
+        and each experiment's data is held in flat arrays (see PackedOscillations).
+        Files written before the wire separation and cross section were saved load
+        with both set to 1, as for unscaled measurements. Source files recorded in
+        the CSV's sidecar, if any, are restored.
+
+        Args:
+            project_name: Name of the project to rebuild.
+            fp: Path of a CSV in the format written by save_amro_data_to_csv(). Uses
+                the project's combined CSV path if None.
+            chunksize: If given, stream the file this many rows at a time. Each chunk
+                is split by oscillation and only its angle and resistivity arrays are
+                kept, so the whole file is never held as one DataFrame. Oscillations
+                spanning several chunks are joined in file order.
+
+        Returns:
+            ProjectData holding one Experiment per experiment label in the file.
+        """
+        project = cls(project_name=project_name)
+        if fp is None:
+            fp = project.get_combined_csv_fp()
+
+        reader = pd.read_csv(
+            fp,
+            sep=",",
+            usecols=lambda col: col in LOADER_DESIRED_COLS,
+            chunksize=chunksize,
+        )
+        chunks = reader if chunksize is not None else [reader]
+
+        # Angle and resistivity arrays of each oscillation, in file order
+        osc_pieces = {}
+        exp_metadata = {}
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            chunk, keys, offsets = cls._split_dataframe_by_oscillation(chunk)
+            angles_degs = chunk[HEADER_ANGLE_DEG].to_numpy(dtype=float)
+            res_ohms = chunk[HEADER_RES_OHM].to_numpy(dtype=float)
+            for key, start, stop in zip(keys, offsets[:-1], offsets[1:]):
+                osc_pieces.setdefault(key, []).append(
+                    (angles_degs[start:stop], res_ohms[start:stop])
+                )
+                if key[0] not in exp_metadata:
+                    first_row = chunk.iloc[start]
+                    exp_metadata[key[0]] = (
+                        first_row[HEADER_GEO],
+                        float(first_row.get(HEADER_WIRE_SEP, 1)),
+                        float(first_row.get(HEADER_CROSS_SECTION, 1)),
+                    )
+
+        if len(osc_pieces) == 0:
+            print(f"No AMRO data found in {Path(fp).name}")
+            return project
+
+        source_files_fp = cls.get_source_files_fp(fp)
+        if source_files_fp.is_file():
+            with open(source_files_fp) as f:
+                project.source_files = json.load(f)
+
+        # Sorted by label, so each experiment is a contiguous run of keys
+        keys = sorted(osc_pieces.keys())
+        acts = [key[0] for key in keys]
+        exp_starts = [0] + [i for i in range(1, len(acts)) if acts[i] != acts[i - 1]]
+        for i0, i1 in zip(exp_starts, exp_starts[1:] + [len(acts)]):
+            exp_keys = keys[i0:i1]
+            pieces = [osc_pieces.pop(key) for key in exp_keys]
+            angles_degs = [np.concatenate([p[0] for p in osc]) for osc in pieces]
+            res_ohms = [np.concatenate([p[1] for p in osc]) for osc in pieces]
+            packed = PackedOscillations(
+                temperatures=np.asarray([key[1] for key in exp_keys], dtype=float),
+                magnetic_fields=np.asarray([key[2] for key in exp_keys], dtype=float),
+                offsets=Experiment._get_offsets([len(a) for a in angles_degs]),
+                angles_degs=Experiment._concat(angles_degs, float),
+                res_ohms=Experiment._concat(res_ohms, float),
+            )
+            geometry, wire_sep, cross_section = exp_metadata[acts[i0]]
+            project.add_experiment(
+                Experiment.from_packed_oscillations(
+                    experiment_label=acts[i0],
+                    geometry=geometry,
+                    wire_sep=wire_sep,
+                    cross_section=cross_section,
+                    packed=packed,
+                )
+            )
+        return project
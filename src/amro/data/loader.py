@@ -81,18 +81,43 @@ class AMROLoader:
         self.verbose = verbose
         self.project_data.check_for_saved_data()
 
-    def load_amro(self) -> ProjectData:
-        """Load AMRO data from pickle cache or run ETL pipeline.
+    def load_amro(self, update: bool = True) -> ProjectData:
+        """Load AMRO data from the project store or run ETL pipeline.
 
-        Checks for existing pickled data first. If found, loads from cache.
-        Otherwise, runs the full ETL pipeline to load and process raw data.
+        Checks for an existing project store first, then for pickled project data
+        and then the combined AMRO CSV to import. If found, loads from cache and
+        merges in any processed files that are new, changed, or removed since the
+        cache was written. A combined CSV without recorded source files is imported
+        as is, since every processed file would otherwise be re-read. Otherwise,
+        runs the full ETL pipeline to load and process raw data.
+
+        Args:
+            update: If True, bring a cached project up to date with PROCESSED_DATA_PATH.
 
         Returns:
             ProjectData object containing all loaded experiments and oscillations.
         """
-        if self.pickle_fp.is_file():
+        if self.project_data.check_for_project_store():
             print("Loading : {}".format(self.project_name))
+            self.project_data = ProjectData.load_project(self.project_name)
+            if update:
+                self._update_amro_etl()
+        elif self.pickle_fp.is_file():
+            print("Importing : {}".format(self.pickle_fp.name))
             self.project_data = ProjectData.load_project_from_pickle(self.pickle_fp)
+            if not (update and self._update_amro_etl()):
+                self.project_data.save_project()
+        elif self.project_data.check_for_combined_csv():
+            fp = self.project_data.get_combined_csv_fp()
+            print("Importing : {}".format(fp.name))
+            self.project_data = ProjectData.load_amro_data_from_csv(
+                self.project_name, fp
+            )
+            if update and len(self.project_data.source_files) == 0:
+                print("No source files recorded for the CSV. Skipping update.")
+                update = False
+            if not (update and self._update_amro_etl()):
+                self.project_data.save_project()
         else:
             print("Running AMRO ETL.")
             self._run_amro_etl()
@@ -112,7 +137,7 @@ class AMROLoader:
 
         Reads processed CSV files from PROCESSED_DATA_PATH, extracts experiment
         metadata and oscillation data, transforms into data structures, and loads
-        into the project_data container. Saves the result to a pickle file.
+        into the project_data container. Saves the result to the project store.
         """
         filenames = list(PROCESSED_DATA_PATH.glob("*.csv"))
 
@@ -122,61 +147,192 @@ class AMROLoader:
             if self._is_valid_amro_filename(filename):
                 print(f"Reading {filename}")
                 valid_data_found = True
-                # Read experiment
-                experiment_df = pd.read_csv(PROCESSED_DATA_PATH / filename, sep=",")
-                (
-                    exp_label,
-                    osc_keys,
-                    geometry,
-                    wire_sep,
-                    cross_section,
-                ) = self._parse_experiment_metadata(experiment_df)
-                if exp_label not in self.project_data.experiments_dict:
-                    exp = Experiment(
-                        experiment_label=exp_label,
-                        geometry=geometry,
-                        wire_sep=wire_sep,
-                        cross_section=cross_section,
-                    )
-                    self.project_data.add_experiment(exp)
+                new_exp = self._read_experiment_file(filename)
+                exp_label = new_exp.experiment_label
+                if not self.project_data.has_experiment(exp_label):
+                    self.project_data.add_experiment(new_exp)
                 else:
                     exp = self.project_data.get_experiment(exp_label)
-
-                for osc_key in osc_keys:
-                    T_label = osc_key.temperature
-                    H_label = osc_key.magnetic_field
-                    # Parse oscillation
-                    osc = experiment_df.query(
-                        f"{HEADER_MAGNET}=={H_label} & {HEADER_TEMP}=={T_label}"
-                    )
-                    # EXTRACT
-                    angles = osc[HEADER_ANGLE_DEG].values
-                    resistivities = osc[HEADER_RES_OHM].values
-
-                    # TRANSFORM
-                    exp_data = ExperimentalData(
-                        experiment_key=osc_key,
-                        angles_degs=angles,
-                        res_ohms=resistivities,
-                    )
-                    osc = AMROscillation(key=osc_key, osc_data=exp_data)
-
-                    # LOAD
-                    exp.add_oscillation(osc)
+                    for osc in new_exp.oscillations_dict.values():
+                        exp.add_oscillation(osc)
+                self._record_source_file(filename, exp_label)
 
         if not valid_data_found:
             print("Could not find valid data!")
         else:
             print("AMRO loading complete")
-            self.project_data.save_amro_data_to_csv()
-            print(
-                f"Combined AMRO saved to {self.project_data.project_name + COMBINED_AMRO_FN_SUFFIX}"
+            self._save_project_data()
+        return None
+
+    def _update_amro_etl(self) -> bool:
+        """Merge new, changed, and removed processed files into cached project data.
+
+        Each processed file is compared against the signature recorded when it was
+        last loaded. Only experiments from new or changed files are re-read, and
+        within those, oscillations whose data is unchanged keep their Fourier and
+        fit results. Experiments whose file has been removed are dropped.
+
+        Returns:
+            True if anything changed, in which case the project has been saved.
+        """
+        source_files = self.project_data.source_files
+
+        filenames = [
+            fn
+            for fn in sorted(PROCESSED_DATA_PATH.glob("*.csv"))
+            if self._is_valid_amro_filename(fn)
+        ]
+        current_names = {fn.name for fn in filenames}
+
+        n_changed = 0
+        for filename in filenames:
+            entry = source_files.get(filename.name)
+            signature = u.get_file_signature(PROCESSED_DATA_PATH / filename, entry)
+            if entry is not None and entry["sha256"] == signature["sha256"]:
+                entry.update(signature)
+                continue
+
+            print(f"Merging {filename.name}")
+            n_changed += 1
+            new_exp = self._read_experiment_file(filename)
+            self._merge_experiment(new_exp)
+            self._record_source_file(filename, new_exp.experiment_label, signature)
+
+        for name in list(source_files.keys()):
+            if name in current_names:
+                continue
+            print(f"{name} was removed from the processed data folder.")
+            n_changed += 1
+            exp_label = source_files.pop(name)["experiment_label"]
+            if self.project_data.has_experiment(exp_label):
+                self.project_data.remove_experiment(exp_label)
+
+        if n_changed > 0:
+            print(f"Updated {n_changed} processed files.")
+            self._save_project_data()
+        elif self.verbose:
+            print("Project data is up to date with the processed data folder.")
+        return n_changed > 0
+
+    def _merge_experiment(self, new_exp: Experiment) -> None:
+        """Merge a freshly read experiment into the project data.
+
+        Oscillations whose angles and resistivities match the cached oscillation
+        are replaced by the cached object, so their analysis results are kept.
+
+        Args:
+            new_exp: Experiment read from a processed file.
+        """
+        exp_label = new_exp.experiment_label
+        if not self.project_data.has_experiment(exp_label):
+            self.project_data.add_experiment(new_exp)
+            return
+
+        old_exp = self.project_data.get_experiment(exp_label)
+        n_kept = 0
+        for key, osc in new_exp.oscillations_dict.items():
+            old_osc = old_exp.oscillations_dict.get(key)
+            if old_osc is not None and self._is_same_osc_data(
+                old_osc.osc_data, osc.osc_data
+            ):
+                new_exp.replace_oscillation(old_osc)
+                n_kept += 1
+        if self.verbose:
+            n_new = new_exp.oscillations_count - n_kept
+            print(f"{exp_label}: kept {n_kept} oscillations, re-loaded {n_new}.")
+        self.project_data.replace_experiment(new_exp)
+        return
+
+    def _is_same_osc_data(
+        self, old_data: ExperimentalData, new_data: ExperimentalData
+    ) -> bool:
+        """Check whether two oscillations hold the same measurements.
+
+        Args:
+            old_data: Cached ExperimentalData object.
+            new_data: Freshly read ExperimentalData object.
+
+        Returns:
+            True if the angles and resistivities are identical.
+        """
+        return np.array_equal(old_data.angles_degs, new_data.angles_degs) and (
+            np.array_equal(old_data.res_ohms, new_data.res_ohms)
+        )
+
+    def _read_experiment_file(self, filename: Path) -> Experiment:
+        """Read a processed AMRO file into a new Experiment.
+
+        Args:
+            filename: Path of the processed file.
+
+        Returns:
+            Experiment holding one AMROscillation per T/H pairing in the file.
+        """
+        experiment_df = pd.read_csv(PROCESSED_DATA_PATH / filename, sep=",")
+        (
+            exp_label,
+            osc_keys,
+            geometry,
+            wire_sep,
+            cross_section,
+        ) = self._parse_experiment_metadata(experiment_df)
+        exp = Experiment(
+            experiment_label=exp_label,
+            geometry=geometry,
+            wire_sep=wire_sep,
+            cross_section=cross_section,
+        )
+
+        for osc_key in osc_keys:
+            T_label = osc_key.temperature
+            H_label = osc_key.magnetic_field
+            # Parse oscillation
+            osc = experiment_df.query(
+                f"{HEADER_MAGNET}=={H_label} & {HEADER_TEMP}=={T_label}"
             )
-            self.project_data.save_project_to_pickle()
-            print(
-                "Project state pickled as: {}".format(self.project_data.pickle_fp.name)
+            # EXTRACT
+            angles = osc[HEADER_ANGLE_DEG].values
+            resistivities = osc[HEADER_RES_OHM].values
+
+            # TRANSFORM
+            exp_data = ExperimentalData(
+                experiment_key=osc_key,
+                angles_degs=angles,
+                res_ohms=resistivities,
             )
-        return None
+            osc = AMROscillation(key=osc_key, osc_data=exp_data)
+
+            # LOAD
+            exp.add_oscillation(osc)
+        return exp
+
+    def _record_source_file(
+        self, filename: Path, exp_label: str, signature: dict | None = None
+    ) -> None:
+        """Record the signature of a processed file and the experiment it holds.
+
+        Args:
+            filename: Path of the processed file.
+            exp_label: Label of the experiment read from the file.
+            signature: Signature from utils.get_file_signature(). Computed if None.
+        """
+        if signature is None:
+            signature = u.get_file_signature(PROCESSED_DATA_PATH / filename)
+        self.project_data.source_files[filename.name] = {
+            **signature,
+            "experiment_label": exp_label,
+        }
+        return
+
+    def _save_project_data(self) -> None:
+        """Save the combined AMRO CSV and the project store."""
+        self.project_data.save_amro_data_to_csv()
+        print(
+            f"Combined AMRO saved to {self.project_data.project_name + COMBINED_AMRO_FN_SUFFIX}"
+        )
+        self.project_data.save_project()
+        print("Project state saved to: {}".format(self.project_data.store_path.name))
+        return
 
     def _is_valid_amro_filename(self, filename: Path) -> bool:
         """Check if a filename matches the expected AMRO data file naming pattern.
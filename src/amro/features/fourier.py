@@ -10,6 +10,7 @@ from ..data import (
     ExperimentalData,
 )
 from ..plotting.fourier import _plot_n_strongest
+from ..utils import utils as u
 from scipy.fft import rfft, rfftfreq
 
 
@@ -21,6 +22,9 @@ class Fourier:
         amro_data: ProjectData,
         overwrite_result=False,
         verbose: bool = False,
+        batched: bool = True,
+        workers: int | None = None,
+        method: str = "fft",
     ):
         """Initialize the Fourier transformer.
 
@@ -28,7 +32,20 @@ class Fourier:
             amro_data: ProjectData object containing AMRO experiments and oscillations.
             overwrite_result: If True, overwrite existing Fourier results.
             verbose: If True, print detailed processing information.
+            batched: If True, transform equal-length oscillations together in one FFT
+                call per length. If False, transform each oscillation separately.
+            workers: Number of threads scipy.fft may use for each batched FFT. Uses
+                scipy's default if None.
+            method: Transform used. "fft" treats each oscillation as evenly sampled
+                over one rotation. "nudft" evaluates a non-uniform DFT at the measured
+                angles, so uneven steps and dropped angles do not distort the
+                amplitudes and phases.
+
+        Raises:
+            ValueError: If the method is not recognised.
         """
+        if method not in ("fft", "nudft"):
+            raise ValueError(f"Unknown Fourier method: {method}")
         self.project_data = amro_data
 
         self.all_results_df = pd.DataFrame()
@@ -37,6 +54,9 @@ class Fourier:
         self.save_fp = self.save_dir / self.save_name
         self.verbose = verbose
         self.overwrite = overwrite_result
+        self.batched = batched
+        self.workers = workers
+        self.method = method
 
         return
 
@@ -45,8 +65,9 @@ class Fourier:
 
         Iterates through all experiments and their oscillations, performing
         FFT analysis on each. Results are stored in the oscillation objects
-        and saved to CSV and pickle files.
+        and saved to CSV files and the project store.
         """
+        to_transform = []
         for exp_label in self.project_data.get_experiment_labels():
 
             experiment = self.project_data.get_experiment(exp_label)
@@ -65,8 +86,19 @@ class Fourier:
                         f"Fourier Transforming {key.experiment_label}, T={key.temperature}K, H={key.magnetic_field}T"
                     )
 
-                xf, yf = self._perform_fourier_transform(osc.osc_data)
-                osc.add_fourier_result(xf, yf)
+                if self.batched:
+                    to_transform.append(osc)
+                elif self.method == "nudft":
+                    xf, yf = self._perform_nudft(osc.osc_data)
+                    osc.add_fourier_result(xf, yf)
+                else:
+                    xf, yf = self._perform_fourier_transform(osc.osc_data)
+                    osc.add_fourier_result(xf, yf)
+
+        if len(to_transform) > 0 and self.method == "nudft":
+            self._perform_batched_nudfts(to_transform)
+        elif len(to_transform) > 0:
+            self._perform_batched_fourier_transforms(to_transform)
 
         self.project_data.save_fourier_results_to_csv()
         print(
@@ -74,8 +106,8 @@ class Fourier:
             + self.project_data.project_name
             + FOURIER_FN_SUFFIX
         )
-        self.project_data.save_project_to_pickle()
-        print("Project state pickled.")
+        self.project_data.save_project()
+        print("Project state saved.")
 
         return
 
@@ -147,3 +179,86 @@ class Fourier:
             xf = xf[1:]
             yf = yf[1:]
         return xf, yf
+
+    def _perform_batched_fourier_transforms(self, oscillations: list) -> None:
+        """Perform FFTs on many oscillations at once and store their results.
+
+        Oscillations are grouped by number of angle points. Each group's
+        mean-subtracted resistivities are stacked into a 2-D block, transformed
+        with a single rfft call along the last axis, and the rows are added back
+        to their oscillations as Fourier results.
+
+        Args:
+            oscillations: List of AMROscillation objects to transform.
+        """
+        blocks = {}
+        for osc in oscillations:
+            n_points = len(osc.osc_data.delta_res_mean_ohms)
+            blocks.setdefault(n_points, []).append(osc)
+
+        for n_points, block in blocks.items():
+            fft_data = np.stack([osc.osc_data.delta_res_mean_ohms for osc in block])
+
+            yf = rfft(fft_data, n=n_points, axis=-1, norm="ortho", workers=self.workers)
+            xf = rfftfreq(n_points, 1 / n_points)
+
+            if xf[0] == 0:
+                xf = xf[1:]
+                yf = yf[:, 1:]
+            for osc, osc_yf in zip(block, yf):
+                osc.add_fourier_result(xf, osc_yf)
+        return
+
+    def _perform_nudft(self, data: ExperimentalData) -> tuple[np.ndarray, np.ndarray]:
+        """Perform a non-uniform DFT on mean-subtracted AMRO oscillation data.
+
+        The transform is evaluated at integer symmetries 1 to N // 2 for N angle
+        points, like the FFT, but at the measured angles. Each point is weighted by
+        the angular span it covers, corrected so that low symmetries are recovered
+        exactly despite uneven steps and gaps (see utils.build_nudft_matrix()).
+
+        Args:
+            data: ExperimentalData object containing oscillation measurements.
+
+        Returns:
+            Tuple of (frequencies, amplitudes) where frequencies are the
+            rotational symmetry values and amplitudes are complex coefficients.
+        """
+        xf = self._get_nudft_freqs(len(data.angles_rads))
+        yf = data.delta_res_mean_ohms @ u.build_nudft_matrix(data.angles_rads, xf)
+        return xf, yf
+
+    def _perform_batched_nudfts(self, oscillations: list) -> None:
+        """Perform non-uniform DFTs on many oscillations at once and store their results.
+
+        Oscillations measured at the same angles share one transform matrix, so each
+        group's mean-subtracted resistivities are stacked into a 2-D block and
+        transformed with a single matrix product.
+
+        Args:
+            oscillations: List of AMROscillation objects to transform.
+        """
+        blocks = {}
+        for osc in oscillations:
+            blocks.setdefault(osc.osc_data.angles_rads.tobytes(), []).append(osc)
+
+        for block in blocks.values():
+            rads = block[0].osc_data.angles_rads
+            xf = self._get_nudft_freqs(len(rads))
+            nudft_data = np.stack([osc.osc_data.delta_res_mean_ohms for osc in block])
+
+            yf = nudft_data @ u.build_nudft_matrix(rads, xf)
+            for osc, osc_yf in zip(block, yf):
+                osc.add_fourier_result(xf, osc_yf)
+        return
+
+    def _get_nudft_freqs(self, n_points: int) -> np.ndarray:
+        """Return the symmetries evaluated by the non-uniform DFT.
+
+        Args:
+            n_points: Number of angle points in the oscillation.
+
+        Returns:
+            Array of integer symmetries 1 to n_points // 2.
+        """
+        return np.arange(1, n_points // 2 + 1)
@@ -1,5 +1,12 @@
+import copy
+import os
+import shutil
 import lmfit as lm
 import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from scipy.linalg import solve_triangular
+from scipy.optimize import least_squares
 
 
 from ..utils import utils as u
@@ -10,6 +17,12 @@ from ..plotting.fitter import (
 )
 
 from ..config import (
+    FINAL_DATA_PATH,
+    FIT_CACHE_DIR_NAME,
+    FIT_SWEEP_FN_SUFFIX,
+    HEADER_FIT_MIN_AMP_RATIO,
+    HEADER_FIT_MAX_FREQ,
+    HEADER_FIT_FORCE_SYM,
     HEADER_PARAM_AMP_PREFIX,
     HEADER_PARAM_PHASE_PREFIX,
     HEADER_PARAM_FREQ_PREFIX,
@@ -33,6 +46,10 @@ class AMROFitter:
         force_four_and_two_sym=False,
         verbose=False,
         if_save_file_exists_overwrite=False,
+        n_jobs: int | None = 1,
+        solver: str = "lmfit",
+        warm_start: str | None = None,
+        fit_cache: bool = False,
     ) -> None:
         """Initialize the AMROFitter.
 
@@ -43,7 +60,31 @@ class AMROFitter:
             force_four_and_two_sym: If True, always include 2-fold and 4-fold symmetry terms.
             verbose: If True, print detailed processing information.
             if_save_file_exists_overwrite: If True, overwrite existing fit results.
+            n_jobs: Number of worker processes used to fit oscillations in parallel.
+                1 fits serially, None uses one process per CPU.
+            solver: Fitting backend. "lmfit" minimizes with lmfit and finite-difference
+                derivatives. "least_squares" uses scipy.optimize.least_squares on the
+                raw parameter vector with the model's analytic Jacobian. "linear"
+                solves the fixed-frequency model exactly by linear least squares,
+                falling back to lmfit when a bound is active.
+            warm_start: If "temperature" or "field", fit each experiment's
+                oscillations in order along sweeps of that variable, starting each
+                fit from the converged parameters of the previous one. If None, every
+                fit starts from its own Fourier guesses. Not used by the linear
+                solver, which needs no starting point.
+            fit_cache: If True, fit results are stored under FINAL_DATA_PATH, keyed
+                on the oscillation's data, initial parameters, bounds and solver.
+                Refitting an oscillation whose model is unchanged, e.g. after a
+                filter change that keeps its frequency set, loads the stored fit.
+                Batched linear solves are cheaper than a lookup and are not cached.
+
+        Raises:
+            ValueError: If the solver or warm start variable is not recognised.
         """
+        if solver not in ("lmfit", "least_squares", "linear"):
+            raise ValueError(f"Unknown solver: {solver}")
+        if warm_start not in (None, "temperature", "field"):
+            raise ValueError(f"Unknown warm start variable: {warm_start}")
 
         # Fit Param filter values
         self.min_amp_ratio = min_amp_ratio
@@ -52,8 +93,12 @@ class AMROFitter:
         self.force_four_and_two_sym = force_four_and_two_sym
         self.verbose = verbose
         self.overwrite = if_save_file_exists_overwrite
+        self.n_jobs = n_jobs
+        self.solver = solver
+        self.warm_start = warm_start
+        self.fit_cache_dir = FINAL_DATA_PATH / FIT_CACHE_DIR_NAME if fit_cache else None
 
-        self.filter_str = "ratio_{}_maxf_{}".format(min_amp_ratio, max_freq)
+        self.filter_str = self._get_filter_str(min_amp_ratio, max_freq)
 
         self.failed_fits = []
         return
@@ -86,29 +131,48 @@ class AMROFitter:
         Args:
             act_label: Experiment label identifying which experiment to fit.
         """
-        if act_label not in self.project_data.experiments_dict.keys():
+        if not self.project_data.has_experiment(act_label):
             print(f"{act_label} is not a valid experiment label.")
             return
 
-        if self.project_data.fit_filter_str is None:
-            self.project_data.fit_filter_str = self.filter_str
+        self.fit_experiments([act_label])
+        return
 
-        experiment = self.project_data.get_experiment(act_label)
-        i = 0
-        for osc_key in experiment.oscillations_dict.keys():
-            i += 1
-            osc = experiment.get_oscillation_from_key(osc_key)
+    def fit_experiments(self, act_labels: list | None = None) -> None:
+        """Fit all oscillations in the specified experiments, then save the results.
 
-            if osc.fit_result is not None and not self.overwrite:
-                print(f"Already fitted {osc_key}. Skipping...")
-                continue
-            elif osc.fourier_result is None:
-                print(f"No Fourier for {osc_key}. Skipping...")
-                continue
-            print(f"Fitting {osc_key}.")
+        Oscillations from every experiment are fitted together, so with n_jobs > 1
+        a single process pool is shared across all of them.
+
+        Args:
+            act_labels: Experiment labels to fit. Fits every experiment if None.
+        """
+        valid_labels = self._get_valid_labels(act_labels)
+        if len(valid_labels) == 0:
+            return
 
-            lmfit_result, refit_bool = self._fit_oscillation(osc)
+        if self.project_data.fit_filter_str is None:
+            self.project_data.fit_filter_str = self.filter_str
 
+        to_fit = []
+        for act_label in valid_labels:
+            experiment = self.project_data.get_experiment(act_label)
+            for osc_key in experiment.oscillations_dict.keys():
+                osc = experiment.get_oscillation_from_key(osc_key)
+
+                if osc.fit_result is not None and not self.overwrite:
+                    print(f"Already fitted {osc_key}. Skipping...")
+                    continue
+                elif osc.fourier_result is None:
+                    print(f"No Fourier for {osc_key}. Skipping...")
+                    continue
+                print(f"Fitting {osc_key}.")
+                to_fit.append(osc)
+
+        fit_results = self._fit_oscillations(to_fit)
+
+        # Merge results back in the order the oscillations were collected
+        for osc, (lmfit_result, refit_bool) in zip(to_fit, fit_results):
             osc.add_fit_result(
                 lmfit_result=lmfit_result,
                 refitted=refit_bool,
@@ -116,7 +180,7 @@ class AMROFitter:
 
             if not lmfit_result.success:
                 self.failed_fits.append(osc.key)
-        print(f"Total fitted: {i}")
+        print(f"Total fitted: {len(to_fit)}")
         self.project_data.save_fit_results_to_csv()
 
         fn = (
@@ -127,13 +191,438 @@ class AMROFitter:
         )
         print("Fit results saved to: " + fn)
 
-        self.project_data.save_project_to_pickle()
-        print("Project state pickled.")
+        self.project_data.save_project()
+        print("Project state saved.")
 
         return
 
+    def fit_filter_sweep(
+        self,
+        filter_grid: list[tuple[float, int, bool]],
+        act_labels: list | None = None,
+        save: bool = True,
+    ) -> pd.DataFrame:
+        """Fit the specified experiments under several fit filter settings at once.
+
+        Each setting is a (min_amp_ratio, max_freq, force_four_and_two_sym) tuple.
+        Settings often filter an oscillation down to the same frequency set, so each
+        distinct (oscillation, frequency set) model is fitted only once, starting
+        from the guesses of the first setting that produces it, and its fit is
+        reported under every such setting. Fits use this fitter's solver, n_jobs,
+        warm start and fit cache. With n_jobs > 1 the models of every setting are
+        fitted in one process pool; the linear solver fits each setting's models
+        serially as batches. The oscillations' own fit results and the saved
+        project are left unchanged.
+
+        Args:
+            filter_grid: Filter settings to fit.
+            act_labels: Experiment labels to fit. Fits every experiment if None.
+            save: If True, save the table to FINAL_DATA_PATH as
+                <project_name>_fit_sweep.csv.
+
+        Returns:
+            Long-format DataFrame with one row per (setting, oscillation): the
+            setting's filter values followed by the columns of
+            ProjectData.get_fit_results_as_df().
+        """
+        oscillations = []
+        for act_label in self._get_valid_labels(act_labels):
+            experiment = self.project_data.get_experiment(act_label)
+            for osc in experiment.oscillations_dict.values():
+                if osc.fourier_result is None:
+                    print(f"No Fourier for {osc.key}. Skipping...")
+                    continue
+                oscillations.append(osc)
+
+        # Assign each model to the first filter setting that produces it
+        setting_fitters = []
+        setting_models = []
+        setting_new_models = []
+        assigned_models = set()
+        for min_amp_ratio, max_freq, force_four_and_two_sym in filter_grid:
+            fitter = copy.copy(self)
+            fitter.min_amp_ratio = min_amp_ratio
+            fitter.max_freq = max_freq
+            fitter.force_four_and_two_sym = force_four_and_two_sym
+            fitter.filter_str = self._get_filter_str(min_amp_ratio, max_freq)
+            fitter.failed_fits = []
+
+            models = {}
+            new_models = {}
+            for osc in oscillations:
+                _, f_list = fitter._initialize_parameters_from_fourier(
+                    osc.fourier_result, osc.osc_data.mean_res_ohms
+                )
+                model = (osc.key, frozenset(f_list))
+                if model not in assigned_models:
+                    assigned_models.add(model)
+                    new_models[model] = osc
+                models[osc.key] = model
+            setting_fitters.append(fitter)
+            setting_models.append(models)
+            setting_new_models.append(new_models)
+
+        print(
+            f"Fitting {len(assigned_models)} models for "
+            f"{len(filter_grid)} filter settings."
+        )
+        setting_oscillations = [
+            list(new_models.values()) for new_models in setting_new_models
+        ]
+        if self.solver == "linear" or self.n_jobs == 1:
+            setting_results = [
+                fitter._fit_oscillations(oscillations) if oscillations else []
+                for fitter, oscillations in zip(setting_fitters, setting_oscillations)
+            ]
+        else:
+            setting_results = self._fit_settings_in_pool(
+                setting_fitters, setting_oscillations
+            )
+
+        model_fits = {}
+        for new_models, fit_results in zip(setting_new_models, setting_results):
+            for (model, osc), (lmfit_result, refit_bool) in zip(
+                new_models.items(), fit_results
+            ):
+                model_fits[model] = osc.build_fit_result(lmfit_result, refit_bool)
+                if not lmfit_result.success and osc.key not in self.failed_fits:
+                    self.failed_fits.append(osc.key)
+
+        dfs = []
+        for (min_amp_ratio, max_freq, force_four_and_two_sym), models in zip(
+            filter_grid, setting_models
+        ):
+            df = self.project_data.get_fit_results_as_df(
+                fit_results={key: model_fits[model] for key, model in models.items()}
+            )
+            df.insert(0, HEADER_FIT_MIN_AMP_RATIO, min_amp_ratio)
+            df.insert(1, HEADER_FIT_MAX_FREQ, max_freq)
+            df.insert(2, HEADER_FIT_FORCE_SYM, force_four_and_two_sym)
+            dfs.append(df)
+        sweep_df = pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+
+        if save:
+            fp = FINAL_DATA_PATH / (
+                self.project_data.project_name + FIT_SWEEP_FN_SUFFIX
+            )
+            sweep_df.to_csv(fp, index=False)
+            print("Fit sweep results saved to: " + fp.name)
+        return sweep_df
+
+    def _fit_settings_in_pool(
+        self,
+        setting_fitters: list["AMROFitter"],
+        setting_oscillations: list[list[AMROscillation]],
+    ) -> list[list[tuple[lm.minimizer.MinimizerResult, bool]]]:
+        """Fit the oscillations of several filter settings in a single process pool.
+
+        Every (setting, oscillation) fit, or every (setting, sweep) fit if
+        warm_start is set, is submitted to the same pool, so small settings do not
+        leave workers idle and the pool is started only once.
+
+        Args:
+            setting_fitters: Fitters configured with each setting's filter values.
+            setting_oscillations: Oscillations to fit under each setting.
+
+        Returns:
+            List of (MinimizerResult, was_refitted) tuple lists, one per setting, in
+            the same order as that setting's oscillations.
+        """
+        setting_results = [[None] * len(oscs) for oscs in setting_oscillations]
+        with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+            futures = []
+            for s, (fitter, oscillations) in enumerate(
+                zip(setting_fitters, setting_oscillations)
+            ):
+                # Workers only need the fit settings, not the whole project
+                worker_fitter = copy.copy(fitter)
+                worker_fitter.project_data = None
+                worker_fitter.failed_fits = []
+                if self.warm_start is not None:
+                    for sweep in self._get_sweeps(oscillations):
+                        future = executor.submit(
+                            worker_fitter._fit_sweep, [oscillations[i] for i in sweep]
+                        )
+                        futures.append((s, sweep, future))
+                else:
+                    for i, osc in enumerate(oscillations):
+                        future = executor.submit(worker_fitter._fit_oscillation, osc)
+                        futures.append((s, [i], future))
+
+            for s, indices, future in futures:
+                fits = future.result()
+                if self.warm_start is None:
+                    fits = [fits]
+                for i, fit in zip(indices, fits):
+                    setting_results[s][i] = fit
+        return setting_results
+
+    def _get_valid_labels(self, act_labels: list | None) -> list:
+        """Return the experiment labels that exist in the project.
+
+        Args:
+            act_labels: Experiment labels to check. All labels if None.
+
+        Returns:
+            List of valid experiment labels, in the given order.
+        """
+        if act_labels is None:
+            act_labels = self.project_data.get_experiment_labels()
+
+        valid_labels = []
+        for act_label in act_labels:
+            if not self.project_data.has_experiment(act_label):
+                print(f"{act_label} is not a valid experiment label.")
+            else:
+                valid_labels.append(act_label)
+        return valid_labels
+
+    @staticmethod
+    def _get_filter_str(min_amp_ratio: float, max_freq: int) -> str:
+        """Return the fit filter string used in fit result file names."""
+        return "ratio_{}_maxf_{}".format(min_amp_ratio, max_freq)
+
+    def _fit_oscillations(
+        self, oscillations: list[AMROscillation]
+    ) -> list[tuple[lm.minimizer.MinimizerResult, bool]]:
+        """Fit several oscillations with the configured solver.
+
+        The linear solver fits groups of oscillations together. Other solvers fit
+        each oscillation individually, serially or across a process pool, in sweep
+        order if warm_start is set.
+
+        Args:
+            oscillations: AMROscillation objects to fit.
+
+        Returns:
+            List of (MinimizerResult, was_refitted) tuples, in the same order as
+            the oscillations.
+        """
+        if self.solver == "linear":
+            return self._fit_oscillations_batched(oscillations)
+        elif self.warm_start is not None:
+            return self._fit_oscillations_in_sweeps(oscillations)
+        return self._fit_oscillations_individually(oscillations)
+
+    def _fit_oscillations_in_sweeps(
+        self, oscillations: list[AMROscillation]
+    ) -> list[tuple[lm.minimizer.MinimizerResult, bool]]:
+        """Fit oscillations in order along temperature or field sweeps.
+
+        Oscillations of an experiment sharing a field (warm_start="temperature") or
+        a temperature (warm_start="field") form a sweep, fitted in order of the swept
+        variable. Each fit starts from the previous successful fit in its sweep.
+        Sweeps are independent, so they are spread across a process pool when
+        n_jobs > 1.
+
+        Args:
+            oscillations: AMROscillation objects to fit.
+
+        Returns:
+            List of (MinimizerResult, was_refitted) tuples, in the same order as
+            the oscillations.
+        """
+        sweeps = self._get_sweeps(oscillations)
+
+        if self.n_jobs == 1 or len(sweeps) <= 1:
+            sweep_results = [
+                self._fit_sweep([oscillations[i] for i in sweep]) for sweep in sweeps
+            ]
+        else:
+            worker_fitter = copy.copy(self)
+            worker_fitter.project_data = None
+            worker_fitter.failed_fits = []
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                futures = [
+                    executor.submit(
+                        worker_fitter._fit_sweep, [oscillations[i] for i in sweep]
+                    )
+                    for sweep in sweeps
+                ]
+                sweep_results = [future.result() for future in futures]
+
+        results = [None] * len(oscillations)
+        for sweep, fits in zip(sweeps, sweep_results):
+            for i, fit in zip(sweep, fits):
+                results[i] = fit
+        return results
+
+    def _get_sweeps(self, oscillations: list[AMROscillation]) -> list[list[int]]:
+        """Group oscillations into the sweeps used by warm_start.
+
+        Args:
+            oscillations: AMROscillation objects to group.
+
+        Returns:
+            List of sweeps, each a list of indices into oscillations ordered along
+            the swept variable.
+        """
+        sweeps = {}
+        for i, osc in enumerate(oscillations):
+            if self.warm_start == "temperature":
+                sweep_key = (osc.key.experiment_label, osc.key.magnetic_field)
+                position = osc.key.temperature
+            else:
+                sweep_key = (osc.key.experiment_label, osc.key.temperature)
+                position = osc.key.magnetic_field
+            sweeps.setdefault(sweep_key, []).append((position, i))
+        return [[i for _, i in sorted(sweep)] for sweep in sweeps.values()]
+
+    def _fit_sweep(
+        self, oscillations: list[AMROscillation]
+    ) -> list[tuple[lm.minimizer.MinimizerResult, bool]]:
+        """Fit a sweep of oscillations in order, warm-starting from each neighbour.
+
+        Args:
+            oscillations: AMROscillation objects ordered along the sweep.
+
+        Returns:
+            List of (MinimizerResult, was_refitted) tuples, in sweep order.
+        """
+        results = []
+        seed_params = None
+        for osc in oscillations:
+            result, was_refitted = self._fit_oscillation(osc, seed_params)
+            results.append((result, was_refitted))
+            if result.success and result.covar is not None:
+                seed_params = result.params
+        return results
+
+    def _fit_oscillations_individually(
+        self, oscillations: list[AMROscillation]
+    ) -> list[tuple[lm.minimizer.MinimizerResult, bool]]:
+        """Fit each oscillation on its own, serially or across a process pool.
+
+        Args:
+            oscillations: AMROscillation objects to fit.
+
+        Returns:
+            List of (MinimizerResult, was_refitted) tuples, in the same order as
+            the oscillations.
+        """
+        if self.n_jobs == 1 or len(oscillations) <= 1:
+            return [self._fit_oscillation(osc) for osc in oscillations]
+
+        # Workers only need the fit settings, not the whole project
+        worker_fitter = copy.copy(self)
+        worker_fitter.project_data = None
+        worker_fitter.failed_fits = []
+        with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+            futures = [
+                executor.submit(worker_fitter._fit_oscillation, osc)
+                for osc in oscillations
+            ]
+            return [future.result() for future in futures]
+
+    def _fit_oscillations_batched(
+        self, oscillations: list[AMROscillation]
+    ) -> list[tuple[lm.minimizer.MinimizerResult, bool]]:
+        """Fit oscillations with the linear solver, sharing work across groups.
+
+        Oscillations sampled on the same angle grid with the same filtered frequency
+        set share one sin/cos design matrix. Each group factorizes it once (QR) and
+        solves every oscillation in the group as one matrix right-hand side.
+        Oscillations whose solution has an active bound, and groups whose design
+        matrix is rank deficient, are fitted individually instead.
+
+        Args:
+            oscillations: AMROscillation objects to fit.
+
+        Returns:
+            List of (MinimizerResult, was_refitted) tuples, in the same order as
+            the oscillations.
+        """
+        results = [None] * len(oscillations)
+        groups = {}
+        for i, osc in enumerate(oscillations):
+            params, f_list = self._initialize_parameters_from_fourier(
+                osc.fourier_result, osc.osc_data.mean_res_ohms
+            )
+            group_key = (osc.osc_data.angles_rads.tobytes(), tuple(f_list))
+            groups.setdefault(group_key, []).append((i, params, f_list))
+
+        to_fit_individually = []
+        for members in groups.values():
+            first_idx, _, f_list = members[0]
+            self.current_f_list = f_list
+            x = oscillations[first_idx].osc_data.angles_rads
+            group_results = self._solve_linear_group(
+                x,
+                [oscillations[i].osc_data.res_ohms for i, _, _ in members],
+                [params for _, params, _ in members],
+            )
+            del self.current_f_list
+
+            for (i, _, _), result in zip(members, group_results):
+                if result is None:
+                    to_fit_individually.append(i)
+                else:
+                    results[i] = (result, False)
+
+        if self.verbose and len(to_fit_individually) > 0:
+            print(f"Fitting {len(to_fit_individually)} oscillations individually.")
+        individual_results = self._fit_oscillations_individually(
+            [oscillations[i] for i in to_fit_individually]
+        )
+        for i, result in zip(to_fit_individually, individual_results):
+            results[i] = result
+        return results
+
+    def _solve_linear_group(
+        self, x: np.ndarray, ys: list[np.ndarray], params_list: list[lm.Parameters]
+    ) -> list[lm.minimizer.MinimizerResult | None]:
+        """Solve the linear model for oscillations sharing one design matrix.
+
+        Args:
+            x: Angle grid in radians shared by the group.
+            ys: Resistivity arrays sampled on x, one per oscillation.
+            params_list: Initial parameters for each oscillation. Those solved here
+                are updated in place with the fitted values.
+
+        Returns:
+            List of denormalized MinimizerResults, with None for oscillations that
+            need a nonlinear fit.
+        """
+        design = u.build_sine_design_matrix(
+            x, np.asarray(self.current_f_list, dtype=float)
+        )
+        n_data, n_coefs = design.shape
+        q, r = np.linalg.qr(design)
+        if n_data < n_coefs or np.linalg.matrix_rank(r) < n_coefs:
+            return [None] * len(ys)
+
+        scales = np.array([self._normalize_data(y)[1] for y in ys])
+        y_norms = np.column_stack(ys) / scales
+        coefs = solve_triangular(r, q.T @ y_norms)
+        residuals = design @ coefs - y_norms
+        redchis = np.sum(residuals**2, axis=0) / max(1, n_data - n_coefs)
+        r_inv = solve_triangular(r, np.eye(n_coefs))
+        unscaled_covar = r_inv @ r_inv.T
+
+        group_results = []
+        for j, params in enumerate(params_list):
+            p_fit, transform_jac = self._convert_linear_coefficients(coefs[:, j])
+            mean_param = params[HEADER_PARAM_MEAN_PREFIX]
+            if not mean_param.min < p_fit[0] < mean_param.max:
+                group_results.append(None)
+                continue
+
+            covar = transform_jac @ (unscaled_covar * redchis[j]) @ transform_jac.T
+            result = self._build_minimizer_result(
+                params,
+                p_fit,
+                covar,
+                residuals[:, j],
+                True,
+                "Solved by linear least squares.",
+                copy_params=False,
+            )
+            result.params = self._denormalize_parameters(result.params, scales[j])
+            group_results.append(result)
+        return group_results
+
     def _fit_oscillation(
-        self, osc: AMROscillation
+        self, osc: AMROscillation, seed_params: lm.Parameters | None = None
     ) -> tuple[lm.minimizer.MinimizerResult, bool]:
         """Fit a single AMRO oscillation using least squares optimization.
 
@@ -143,6 +632,8 @@ class AMROFitter:
 
         Args:
             osc: AMROscillation object containing experimental data and Fourier results.
+            seed_params: Fitted parameters of a neighbouring oscillation. If given,
+                they replace the Fourier guesses (see _seed_parameters()).
 
         Returns:
             Tuple of (MinimizerResult, was_refitted) indicating fit results and
@@ -158,9 +649,19 @@ class AMROFitter:
         self.current_f_list = f_list
 
         y_norm, norm_scale = self._normalize_data(y)
+        if seed_params is not None:
+            self._seed_parameters(initial_params, seed_params, np.mean(y_norm))
+
+        if self.fit_cache_dir is not None:
+            cache_key = self._get_fit_cache_key(initial_params, x, y)
+            cached_fit = self._load_cached_fit(cache_key)
+            if cached_fit is not None:
+                if self.verbose:
+                    print(f"Loaded cached fit for {osc.key}.")
+                del self.current_f_list
+                return cached_fit
 
-        minner = lm.Minimizer(self._obj_func, initial_params, fcn_args=(x, y_norm))
-        results = minner.minimize()
+        results = self._minimize(initial_params, x, y_norm)
 
         was_refitted = False
         if results.covar is None:
@@ -175,8 +676,151 @@ class AMROFitter:
 
         results.params = self._denormalize_parameters(results.params, norm_scale)
         del self.current_f_list
+        if self.fit_cache_dir is not None:
+            self._save_cached_fit(cache_key, results, was_refitted)
         return results, was_refitted
 
+    def _get_fit_cache_key(
+        self, params: lm.Parameters, x: np.ndarray, y: np.ndarray
+    ) -> str:
+        """Get the fit cache key of an oscillation's fit.
+
+        The key covers everything the fit result depends on: the data, the initial
+        value, bounds and vary flag of every parameter, and the solver.
+
+        Args:
+            params: lmfit Parameters object with initial values and bounds.
+            x: Array of angle values in radians.
+            y: Array of resistivity values, before normalization.
+
+        Returns:
+            Hex digest identifying the fit.
+        """
+        return u.get_arrays_hash(
+            {
+                "angles_rads": x,
+                "res_ohms": y,
+                "param_names": np.array(list(params.keys())),
+                "param_values": np.array([p.value for p in params.values()]),
+                "param_mins": np.array([p.min for p in params.values()]),
+                "param_maxs": np.array([p.max for p in params.values()]),
+                "param_varys": np.array([p.vary for p in params.values()]),
+                "solver": np.array([self.solver]),
+            }
+        )
+
+    def _load_cached_fit(
+        self, cache_key: str
+    ) -> tuple[lm.minimizer.MinimizerResult, bool] | None:
+        """Load a fit from the fit cache.
+
+        Args:
+            cache_key: Key from _get_fit_cache_key().
+
+        Returns:
+            Cached (MinimizerResult, was_refitted) tuple, or None if the fit is not
+            cached or its file cannot be read.
+        """
+        fp = self.fit_cache_dir / (cache_key + ".npz")
+        if not fp.is_file():
+            return None
+        try:
+            with np.load(fp) as entry:
+                arrays = {name: entry[name] for name in entry.files}
+        except (OSError, ValueError, EOFError):
+            print(f"Could not read cached fit {fp.name}. Refitting...")
+            return None
+
+        params = lm.Parameters()
+        for name, value, stderr, p_min, p_max, vary in zip(
+            arrays["param_names"].tolist(),
+            arrays["param_values"].tolist(),
+            arrays["param_stderrs"].tolist(),
+            arrays["param_mins"].tolist(),
+            arrays["param_maxs"].tolist(),
+            arrays["param_varys"].tolist(),
+        ):
+            params.add(name, value=value, vary=vary, min=p_min, max=p_max)
+            params[name].stderr = None if np.isnan(stderr) else stderr
+
+        covar = arrays["covar"] if arrays["covar"].size > 0 else None
+        results = lm.minimizer.MinimizerResult(
+            params=params,
+            var_names=arrays["var_names"].tolist(),
+            residual=arrays["residual"],
+            chisqr=float(arrays["chisqr"]),
+            redchi=float(arrays["redchi"]),
+            covar=covar,
+            success=bool(arrays["success"]),
+            message=str(arrays["message"]),
+            nfev=int(arrays["nfev"]),
+            ndata=int(arrays["ndata"]),
+            nvarys=int(arrays["nvarys"]),
+            nfree=int(arrays["nfree"]),
+            method=str(arrays["method"]),
+            errorbars=covar is not None,
+        )
+        return results, bool(arrays["was_refitted"])
+
+    def _save_cached_fit(
+        self,
+        cache_key: str,
+        results: lm.minimizer.MinimizerResult,
+        was_refitted: bool,
+    ) -> None:
+        """Save a fit to the fit cache as an .npz file of plain arrays.
+
+        The fit is written to a temporary file first, so parallel workers never
+        read a partly written entry.
+
+        Args:
+            cache_key: Key from _get_fit_cache_key().
+            results: MinimizerResult of the fit, with denormalized parameters.
+            was_refitted: Whether the fit required relaxed bounds.
+        """
+        params = list(results.params.values())
+        arrays = {
+            "param_names": np.array([p.name for p in params]),
+            "param_values": np.array([p.value for p in params], dtype=float),
+            "param_stderrs": np.array(
+                [np.nan if p.stderr is None else p.stderr for p in params],
+                dtype=float,
+            ),
+            "param_mins": np.array([p.min for p in params], dtype=float),
+            "param_maxs": np.array([p.max for p in params], dtype=float),
+            "param_varys": np.array([p.vary for p in params]),
+            "var_names": np.array(results.var_names),
+            "residual": np.asarray(results.residual, dtype=float),
+            "chisqr": results.chisqr,
+            "redchi": results.redchi,
+            "covar": (
+                np.empty((0, 0)) if results.covar is None else np.asarray(results.covar)
+            ),
+            "success": results.success,
+            "message": str(results.message),
+            "nfev": results.nfev,
+            "ndata": results.ndata,
+            "nvarys": results.nvarys,
+            "nfree": results.nfree,
+            "method": str(results.method),
+            "was_refitted": was_refitted,
+        }
+
+        self.fit_cache_dir.mkdir(parents=True, exist_ok=True)
+        fp = self.fit_cache_dir / (cache_key + ".npz")
+        tmp_fp = fp.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_fp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_fp, fp)
+        return
+
+    def clear_fit_cache(self) -> None:
+        """Delete every fit stored in the fit cache."""
+        fit_cache_dir = FINAL_DATA_PATH / FIT_CACHE_DIR_NAME
+        if fit_cache_dir.is_dir():
+            shutil.rmtree(fit_cache_dir)
+        return
+
     def _normalize_data(self, y: np.ndarray) -> tuple[np.ndarray, float]:
         """Normalize resistivity data by its maximum absolute value.
 
@@ -251,6 +895,32 @@ class AMROFitter:
                 current_freqs.append(4)
         return initial_p_guesses, current_freqs
 
+    def _seed_parameters(
+        self, params: lm.Parameters, seed_params: lm.Parameters, mean_guess: float
+    ) -> None:
+        """Start a fit from the converged parameters of a neighbouring oscillation.
+
+        Amplitude ratios and phases of the frequencies both fits share are copied
+        from seed_params, with phases wrapped into (-pi, pi] so they start well
+        inside their bounds. Other frequencies keep their Fourier guesses.
+
+        Args:
+            params: Initial parameters of the fit, updated in place.
+            seed_params: Fitted parameters of the neighbouring oscillation.
+            mean_guess: Initial mean, on the normalized scale of the fit.
+        """
+        params[HEADER_PARAM_MEAN_PREFIX].set(value=mean_guess)
+        for freq in self.current_f_list:
+            amp_name = HEADER_PARAM_AMP_PREFIX + str(freq)
+            phase_name = HEADER_PARAM_PHASE_PREFIX + str(freq)
+            if amp_name not in seed_params or phase_name not in seed_params:
+                continue
+            params[amp_name].set(value=seed_params[amp_name].value)
+            params[phase_name].set(
+                value=float(np.angle(np.exp(1j * seed_params[phase_name].value)))
+            )
+        return
+
     def _add_parameter(
         self,
         frequency: int,
@@ -398,7 +1068,243 @@ class AMROFitter:
         for name, param in params.items():
             if HEADER_PARAM_PHASE_PREFIX in name:
                 param.set(min=-np.inf, max=np.inf)
-        minner = lm.Minimizer(self._obj_func, params, fcn_args=(x, y_norm))
-        results = minner.minimize()
+        results = self._minimize(params, x, y_norm)
 
         return results
+
+    def _minimize(
+        self, params: lm.Parameters, x: np.ndarray, y_norm: np.ndarray
+    ) -> lm.minimizer.MinimizerResult:
+        """Minimize the sine-series residuals with the configured solver.
+
+        The linear solver falls back to lmfit when its solution has an active bound.
+
+        Args:
+            params: lmfit Parameters object with initial values and bounds.
+            x: Array of angle values in radians.
+            y_norm: Array of normalized resistivity values.
+
+        Returns:
+            MinimizerResult of the fit.
+        """
+        if self.solver == "least_squares":
+            return self._minimize_least_squares(params, x, y_norm)
+        elif self.solver == "linear":
+            results = self._minimize_linear(params, x, y_norm)
+            if results is not None:
+                return results
+            if self.verbose:
+                print("Linear solution has an active bound. Fitting with lmfit.")
+
+        minner = lm.Minimizer(self._obj_func, params, fcn_args=(x, y_norm))
+        return minner.minimize()
+
+    def _minimize_linear(
+        self, params: lm.Parameters, x: np.ndarray, y_norm: np.ndarray
+    ) -> lm.minimizer.MinimizerResult | None:
+        """Solve the fixed-frequency sine series exactly by linear least squares.
+
+        With fixed frequencies, mean*(1 + sum(a_i*sin(f_i*x + phi_i))) equals
+        c_0 + sum(b_i*sin(f_i*x) + c_i*cos(f_i*x)), where c_0 = mean,
+        b_i = mean*a_i*cos(phi_i) and c_i = mean*a_i*sin(phi_i). The coefficients
+        are found with one lstsq call on the sin/cos design matrix, then mapped back
+        to mean, amplitudes and phases. Their covariance is propagated through the
+        Jacobian of that mapping.
+
+        Args:
+            params: lmfit Parameters object with initial values and bounds.
+            x: Array of angle values in radians.
+            y_norm: Array of normalized resistivity values.
+
+        Returns:
+            MinimizerResult holding a copy of params updated with the fitted values,
+            or None if the mean is outside its bounds or the design matrix is rank
+            deficient, in which case a nonlinear solver is needed.
+        """
+        freqs = np.asarray(self.current_f_list, dtype=float)
+        design = u.build_sine_design_matrix(x, freqs)
+        coefs, _, rank, _ = np.linalg.lstsq(design, y_norm, rcond=None)
+        if rank < design.shape[1]:
+            return None
+
+        p_fit, transform_jac = self._convert_linear_coefficients(coefs)
+        mean_param = params[HEADER_PARAM_MEAN_PREFIX]
+        if not mean_param.min < p_fit[0] < mean_param.max:
+            return None
+
+        residual = design @ coefs - y_norm
+        redchi = float(np.sum(residual**2)) / max(1, len(y_norm) - len(coefs))
+        coefs_covar = np.linalg.inv(design.T @ design) * redchi
+        covar = transform_jac @ coefs_covar @ transform_jac.T
+
+        return self._build_minimizer_result(
+            params, p_fit, covar, residual, True, "Solved by linear least squares."
+        )
+
+    def _convert_linear_coefficients(
+        self, coefs: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Map linear sin/cos coefficients to the [mean, amps..., phases...] vector.
+
+        Args:
+            coefs: Coefficients ordered as [c_0, b_1..b_n, c_1..c_n], matching the
+                columns of u.build_sine_design_matrix().
+
+        Returns:
+            Tuple of (parameter vector, Jacobian of the parameters with respect to
+            the coefficients).
+        """
+        n_freqs = (len(coefs) - 1) // 2
+        mean = coefs[0]
+        b = coefs[1 : 1 + n_freqs]
+        c = coefs[1 + n_freqs :]
+        r = np.hypot(b, c)
+
+        p_fit = np.concatenate(([mean], r / mean, np.arctan2(c, b)))
+
+        amp_rows = slice(1, 1 + n_freqs)
+        phase_rows = slice(1 + n_freqs, None)
+        freq_idx = np.arange(n_freqs)
+        jac = np.zeros((len(coefs), len(coefs)))
+        jac[0, 0] = 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            jac[amp_rows, 0] = -r / mean**2
+            jac[amp_rows][freq_idx, 1 + freq_idx] = b / (r * mean)
+            jac[amp_rows][freq_idx, 1 + n_freqs + freq_idx] = c / (r * mean)
+            jac[phase_rows][freq_idx, 1 + freq_idx] = -c / r**2
+            jac[phase_rows][freq_idx, 1 + n_freqs + freq_idx] = b / r**2
+        return p_fit, jac
+
+    def _get_param_vector_names(self) -> list[str]:
+        """Return parameter names in [mean, amps..., phases...] vector order."""
+        return (
+            [HEADER_PARAM_MEAN_PREFIX]
+            + [HEADER_PARAM_AMP_PREFIX + str(f) for f in self.current_f_list]
+            + [HEADER_PARAM_PHASE_PREFIX + str(f) for f in self.current_f_list]
+        )
+
+    def _build_minimizer_result(
+        self,
+        params: lm.Parameters,
+        p_fit: np.ndarray,
+        covar: np.ndarray | None,
+        residual: np.ndarray,
+        success: bool,
+        message: str,
+        nfev: int = 1,
+        copy_params: bool = True,
+    ) -> lm.minimizer.MinimizerResult:
+        """Wrap a fitted parameter vector in an lmfit MinimizerResult.
+
+        Args:
+            params: lmfit Parameters object the fit started from.
+            p_fit: Fitted values in [mean, amps..., phases...] order.
+            covar: Covariance matrix of p_fit, or None if it could not be estimated.
+            residual: Residuals (model - data) at p_fit.
+            success: Whether the solver reported success.
+            message: Solver message.
+            nfev: Number of residual evaluations.
+            copy_params: If False, update params in place instead of copying them.
+
+        Returns:
+            MinimizerResult holding params updated with the fitted values.
+        """
+        names = self._get_param_vector_names()
+        fitted_params = params.copy() if copy_params else params
+        for i, name in enumerate(names):
+            fitted_params[name].value = p_fit[i]
+            if covar is not None:
+                fitted_params[name].stderr = float(np.sqrt(covar[i, i]))
+
+        n_data, n_varys = len(residual), len(names)
+        chisqr = float(np.sum(residual**2))
+        return lm.minimizer.MinimizerResult(
+            params=fitted_params,
+            var_names=names,
+            residual=residual,
+            chisqr=chisqr,
+            redchi=chisqr / max(1, n_data - n_varys),
+            covar=covar,
+            success=success,
+            message=message,
+            nfev=nfev,
+            ndata=n_data,
+            nvarys=n_varys,
+            nfree=n_data - n_varys,
+            method=self.solver,
+            errorbars=covar is not None,
+        )
+
+    def _minimize_least_squares(
+        self, params: lm.Parameters, x: np.ndarray, y_norm: np.ndarray
+    ) -> lm.minimizer.MinimizerResult:
+        """Minimize with scipy's least_squares, using the model's analytic Jacobian.
+
+        The parameters are unpacked once into a vector ordered as
+        [mean, amps..., phases...], so each evaluation works on plain arrays.
+        Amplitudes and phases are solved without bounds, since a sign flip of an
+        amplitude is a phase shift of pi and phases are periodic. The result is
+        then mapped back into the parameter bounds: negative amplitudes are flipped
+        and each phase is wrapped to within pi of its initial guess.
+
+        The covariance matrix is estimated as inv(J^T J) scaled by the reduced
+        chi-square, matching lmfit's default, and is None if J is rank deficient.
+
+        Args:
+            params: lmfit Parameters object with initial values and bounds.
+            x: Array of angle values in radians.
+            y_norm: Array of normalized resistivity values.
+
+        Returns:
+            MinimizerResult holding a copy of params updated with the fitted values.
+        """
+        freqs = np.asarray(self.current_f_list, dtype=float)
+        n_freqs = len(freqs)
+        names = self._get_param_vector_names()
+        phase_names = names[1 + n_freqs :]
+
+        mean_param = params[HEADER_PARAM_MEAN_PREFIX]
+        lower = np.full(len(names), -np.inf)
+        upper = np.full(len(names), np.inf)
+        lower[0], upper[0] = mean_param.min, mean_param.max
+        p0 = np.array([params[name].value for name in names])
+        p0[0] = np.clip(p0[0], lower[0], upper[0])
+
+        def residuals(p):
+            model = u.sine_builder(x, p[1 : 1 + n_freqs], freqs, p[1 + n_freqs :], p[0])
+            return model - y_norm
+
+        def jacobian(p):
+            return u.sine_builder_jacobian(
+                x, p[1 : 1 + n_freqs], freqs, p[1 + n_freqs :], p[0]
+            )
+
+        fit = least_squares(
+            residuals, p0, jac=jacobian, bounds=(lower, upper), x_scale="jac"
+        )
+
+        p_fit = fit.x.copy()
+        amps, phases = p_fit[1 : 1 + n_freqs], p_fit[1 + n_freqs :]
+        phases[amps < 0] += np.pi
+        amps[:] = np.abs(amps)
+        # Take the phase closest to the initial guess, shifted into the bounds
+        phases[:] = (
+            p0[1 + n_freqs :]
+            + np.mod(phases - p0[1 + n_freqs :] + np.pi, 2 * np.pi)
+            - np.pi
+        )
+        for i, name in enumerate(phase_names):
+            if phases[i] > params[name].max:
+                phases[i] -= 2 * np.pi
+            elif phases[i] < params[name].min:
+                phases[i] += 2 * np.pi
+
+        covar = None
+        jac = jacobian(p_fit)
+        if np.linalg.matrix_rank(jac) == len(names):
+            redchi = float(np.sum(fit.fun**2)) / max(1, len(y_norm) - len(names))
+            covar = np.linalg.inv(jac.T @ jac) * redchi
+
+        return self._build_minimizer_result(
+            params, p_fit, covar, fit.fun, fit.success, fit.message, fit.nfev
+        )
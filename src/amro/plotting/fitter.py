@@ -60,7 +60,7 @@ def _plot_fits_with_residuals(
     # Set seaborn style
     project_data = fitter.project_data
 
-    if exp_choice not in project_data.experiments_dict.keys():
+    if not project_data.has_experiment(exp_choice):
         print(f"{exp_choice} is not a valid experiment choice.")
         return None, None
     experiment = project_data.get_experiment(exp_choice)
@@ -26,8 +26,9 @@ def _quick_plot_amro(loader) -> None:
     Args:
         loader: AMROLoader instance containing project data to visualize.
     """
-    data = loader.project_data
-    for key, exp in data.experiments_dict.items():
+    project_data = loader.project_data
+    for act_label in project_data.get_experiment_labels():
+        exp = project_data.get_experiment(act_label)
 
         data = exp.get_experiment_as_dataframe()
         _ = sns.relplot(
@@ -6,12 +6,20 @@ from .conversions import *
 __all__ = [
     "query_dataframe",
     "sine_builder",
+    "sine_builder_jacobian",
+    "build_sine_design_matrix",
+    "get_sine_basis",
+    "get_periodic_quadrature_weights",
+    "build_nudft_matrix",
     "convert_degs_to_rads",
     "convert_rads_to_degs",
     "convert_ohms_to_uohms",
     "convert_uohms_to_ohms",
     "build_query_string",
+    "build_query_mask",
     "convert_params_to_ndarrays",
     "calculate_model_resistivities",
     "format_oscillation_key",
+    "get_file_signature",
+    "get_arrays_hash",
 ]
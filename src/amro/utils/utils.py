@@ -1,6 +1,9 @@
+import hashlib
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 import lmfit as lm
+from pathlib import Path
 
 from ..config import (
     HEADER_EXP_LABEL,
@@ -10,6 +13,7 @@ from ..config import (
     HEADER_PARAM_AMP_PREFIX,
     HEADER_PARAM_PHASE_PREFIX,
     HEADER_PARAM_MEAN_PREFIX,
+    SINE_BASIS_CACHE_SIZE,
 )
 
 
@@ -30,11 +34,40 @@ def query_dataframe(
     Returns:
         Filtered DataFrame matching the specified criteria.
     """
-    q = build_query_string(act, h, t)
-    if len(q) > 0:
-        return df.query(q)
-    else:
+    if act is None and h is None and t is None:
         return df
+    return df[build_query_mask(df, act, h, t)]
+
+
+def build_query_mask(
+    df: pd.DataFrame,
+    act: str | list | None = None,
+    h: float | int | list | None = None,
+    t: float | int | list | None = None,
+) -> np.ndarray:
+    """Build a boolean row mask for filtering AMRO DataFrames.
+
+    Values are compared exactly against the columns, without formatting them into
+    a query string.
+
+    Args:
+        df: Pandas DataFrame to be filtered.
+        act: Experiment label(s) to match.
+        h: Magnetic field value(s) to match.
+        t: Temperature value(s) to match.
+
+    Returns:
+        Boolean array, True for rows matching every given criterion.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for header, values in (
+        (HEADER_EXP_LABEL, act),
+        (HEADER_MAGNET, h),
+        (HEADER_TEMP, t),
+    ):
+        if values is not None:
+            mask &= df[header].isin(np.atleast_1d(values)).to_numpy()
+    return mask
 
 
 def build_query_string(
@@ -69,7 +102,9 @@ def sine_builder(
 ) -> np.ndarray:
     """Construct a Fourier series model from sine components.
 
-    Computes: mean * (1 + sum(amp_i * sin(freq_i * rads + phase_i)))
+    Computes: mean * (1 + sum(amp_i * sin(freq_i * rads + phase_i))), expanding
+    each term with the angle-addition identity so that only the cached sine and
+    cosine tables of get_sine_basis() are needed.
 
     Args:
         rads: Array of angle values in radians.
@@ -81,13 +116,162 @@ def sine_builder(
     Returns:
         Array of model resistivity values.
     """
-    summation = np.sum(
-        amps[:, None] * np.sin(freqs[:, None] * rads + phases[:, None]), axis=0
-    )
+    sines, cosines = get_sine_basis(rads, freqs)
+    summation = (amps * np.cos(phases)) @ sines + (amps * np.sin(phases)) @ cosines
 
     return mean * (summation + 1)
 
 
+def get_sine_basis(rads, freqs) -> tuple[np.ndarray, np.ndarray]:
+    """Return the sine and cosine tables of a set of frequencies on an angle grid.
+
+    Oscillations measured on the same angles with the same frequencies share the
+    tables, which are kept in a least-recently-used cache of SINE_BASIS_CACHE_SIZE
+    entries. The returned arrays are read-only.
+
+    Args:
+        rads: Array of angle values in radians.
+        freqs: Array of frequencies (cycles per rotation).
+
+    Returns:
+        Tuple of (sin(freqs * rads), cos(freqs * rads)), each of shape
+        (len(freqs), len(rads)).
+    """
+    rads = np.asarray(rads, dtype=float)
+    freqs = np.asarray(freqs, dtype=float)
+    return _get_cached_sine_basis(rads.tobytes(), freqs.tobytes())
+
+
+@lru_cache(maxsize=SINE_BASIS_CACHE_SIZE)
+def _get_cached_sine_basis(
+    rads_bytes: bytes, freqs_bytes: bytes
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the tables for get_sine_basis(), keyed on the raw array bytes."""
+    arg = np.outer(np.frombuffer(freqs_bytes), np.frombuffer(rads_bytes))
+    sines = np.sin(arg)
+    cosines = np.cos(arg)
+    sines.flags.writeable = False
+    cosines.flags.writeable = False
+    return sines, cosines
+
+
+def build_sine_design_matrix(rads: np.ndarray, freqs: np.ndarray) -> np.ndarray:
+    """Construct the design matrix of a fixed-frequency sine series.
+
+    Columns are ordered as [1, sin(freq_i * rads)..., cos(freq_i * rads)...], so
+    mean * (1 + sum(amp_i * sin(freq_i * rads + phase_i))) is the product of this
+    matrix with [mean, mean*amp_i*cos(phase_i)..., mean*amp_i*sin(phase_i)...].
+
+    Args:
+        rads: Array of angle values in radians.
+        freqs: Array of frequencies (cycles per rotation).
+
+    Returns:
+        Array of shape (len(rads), 1 + 2 * len(freqs)).
+    """
+    sines, cosines = get_sine_basis(rads, freqs)
+    return np.hstack((np.ones((len(rads), 1)), sines.T, cosines.T))
+
+
+def get_periodic_quadrature_weights(
+    rads: np.ndarray, exact_degree: int = 0
+) -> np.ndarray:
+    """Construct quadrature weights for angles covering one rotation.
+
+    Each angle is first given the trapezoidal weight, half the distance to its
+    neighbours wrapping around 2*pi, so unevenly spaced and missing angles are
+    accounted for and the weights sum to 2*pi. If both 0 and 2*pi are sampled, each
+    gets half the usual weight. The weights are then given the smallest correction
+    that integrates sin(k * rads) and cos(k * rads) exactly for k up to exact_degree.
+
+    Args:
+        rads: Array of angle values in radians, spanning at most one rotation.
+        exact_degree: Highest harmonic integrated exactly. 0 keeps the trapezoidal
+            weights.
+
+    Returns:
+        Array of weights, in the same order as rads.
+    """
+    order = np.argsort(rads, kind="stable")
+    sorted_rads = rads[order]
+    prev_rads = np.roll(sorted_rads, 1)
+    prev_rads[0] -= 2 * np.pi
+    next_rads = np.roll(sorted_rads, -1)
+    next_rads[-1] += 2 * np.pi
+
+    weights = np.empty(len(rads))
+    weights[order] = (next_rads - prev_rads) / 2
+    if exact_degree > 0:
+        # Integrals of 1, cos(k * rads) and sin(k * rads) over one rotation
+        harmonics = build_sine_design_matrix(rads, np.arange(1, exact_degree + 1)).T
+        integrals = np.zeros(len(harmonics))
+        integrals[0] = 2 * np.pi
+        weights += np.linalg.lstsq(
+            harmonics, integrals - harmonics @ weights, rcond=None
+        )[0]
+    return weights
+
+
+def build_nudft_matrix(
+    rads: np.ndarray, freqs: np.ndarray, exact_degree: int | None = None
+) -> np.ndarray:
+    """Construct the matrix of a non-uniform discrete Fourier transform.
+
+    Entry (n, k) is sqrt(N) / (2*pi) * w_n * exp(-1j * freqs[k] * rads[n]), where w_n
+    are the weights from get_periodic_quadrature_weights(). The coefficient at freq
+    is exact for signals made of harmonics up to exact_degree - freq. A signal's
+    product with this matrix matches rfft(signal, norm="ortho") at the same
+    frequencies when the N angles are evenly spaced over one rotation.
+
+    Args:
+        rads: Array of angle values in radians.
+        freqs: Array of frequencies (cycles per rotation).
+        exact_degree: Highest harmonic the weights integrate exactly. Uses N // 4 if
+            None.
+
+    Returns:
+        Complex array of shape (len(rads), len(freqs)).
+    """
+    if exact_degree is None:
+        exact_degree = len(rads) // 4
+    weights = get_periodic_quadrature_weights(rads, exact_degree)
+    weights = weights * np.sqrt(len(rads)) / (2 * np.pi)
+    return weights[:, np.newaxis] * np.exp(-1j * np.outer(rads, freqs))
+
+
+def sine_builder_jacobian(
+    rads, amps: np.ndarray, freqs: np.ndarray, phases: np.ndarray, mean: float | int
+) -> np.ndarray:
+    """Construct the Jacobian of sine_builder() with respect to its fit parameters.
+
+    Columns are ordered as [mean, amps..., phases...], with
+        d/d(mean)    = 1 + sum(amp_i * sin(freq_i * rads + phase_i))
+        d/d(amp_i)   = mean * sin(freq_i * rads + phase_i)
+        d/d(phase_i) = mean * amp_i * cos(freq_i * rads + phase_i)
+
+    Args:
+        rads: Array of angle values in radians.
+        amps: Array of amplitude ratios for each frequency component.
+        freqs: Array of frequencies (cycles per rotation).
+        phases: Array of phase offsets in radians.
+        mean: Mean resistivity value (offset).
+
+    Returns:
+        Array of shape (len(rads), 1 + 2 * len(freqs)).
+    """
+    basis_sines, basis_cosines = get_sine_basis(rads, freqs)
+    cos_phases = np.cos(phases)[:, None]
+    sin_phases = np.sin(phases)[:, None]
+    sines = basis_sines * cos_phases + basis_cosines * sin_phases
+    cosines = basis_cosines * cos_phases - basis_sines * sin_phases
+
+    jacobian = np.empty((len(rads), 1 + 2 * len(freqs)))
+    jacobian[:, 0] = 1 + amps @ sines
+    jacobian[:, 1 : 1 + len(freqs)] = mean * sines.T
+    jacobian[:, 1 + len(freqs) :] = mean * (amps[:, None] * cosines).T
+    return jacobian
+
+
 def flatten_list(lst: list) -> list:
     """Flatten a nested list into a single-level list.
 
@@ -203,3 +387,53 @@ def format_oscillation_key(act: str, t: float, h: float) -> str:
         Formatted string in the form '{act}_T{t}K_H{h}T'.
     """
     return f"{act}_T{t}K_H{h}T"
+
+
+def get_file_signature(fp: Path, previous: dict | None = None) -> dict:
+    """Get the size, modification time and content hash of a file.
+
+    The hash in a previously recorded signature is reused when the size and
+    modification time are unchanged, so unchanged files are not re-read.
+
+    Args:
+        fp: Path to the file.
+        previous: Signature recorded for this file earlier, if any.
+
+    Returns:
+        Dictionary with 'size', 'mtime' and 'sha256' keys.
+    """
+    stat = fp.stat()
+    signature = {"size": stat.st_size, "mtime": stat.st_mtime}
+    if (
+        previous is not None
+        and previous.get("size") == signature["size"]
+        and previous.get("mtime") == signature["mtime"]
+    ):
+        signature["sha256"] = previous["sha256"]
+    else:
+        file_hash = hashlib.sha256()
+        with open(fp, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                file_hash.update(chunk)
+        signature["sha256"] = file_hash.hexdigest()
+    return signature
+
+
+def get_arrays_hash(arrays: dict) -> str:
+    """Get a content hash of a dictionary of numpy arrays.
+
+    Array names, dtypes and shapes are hashed alongside the data, so arrays with
+    the same bytes but different layouts hash differently.
+
+    Args:
+        arrays: Dictionary of array name to numpy array.
+
+    Returns:
+        Hex digest of the SHA-256 hash.
+    """
+    arrays_hash = hashlib.sha256()
+    for name in sorted(arrays.keys()):
+        arr = np.ascontiguousarray(arrays[name])
+        arrays_hash.update(f"{name}:{arr.dtype.str}:{arr.shape}".encode())
+        arrays_hash.update(arr.tobytes())
+    return arrays_hash.hexdigest()
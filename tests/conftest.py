@@ -50,6 +50,7 @@ def isolate_test_paths(tmp_path, monkeypatch):
     monkeypatch.setattr("amro.data.cleaner.RAW_DATA_PATH", tmp_path)
     monkeypatch.setattr("amro.data.cleaner.PROCESSED_DATA_PATH", tmp_path)
     monkeypatch.setattr("amro.features.fourier.FINAL_DATA_PATH", tmp_path)
+    monkeypatch.setattr("amro.models.fitter.FINAL_DATA_PATH", tmp_path)
     monkeypatch.setattr("amro.plotting.fitter.PROCESSED_FIGURES_PATH", tmp_path)
 
     return tmp_path
@@ -10,6 +10,9 @@ from unittest.mock import patch, MagicMock
 from amro.data.cleaner import AMROCleaner
 from amro.data import OscillationKey
 from amro.config import (
+    TESTS_PATH,
+    CLEANER_SAVE_FN_SUFFIX,
+    CLEANER_MANIFEST_FN,
     HEADER_EXPERIMENT_PREFIX,
     HEADER_TEMP,
     HEADER_MAGNET,
@@ -20,6 +23,7 @@ from amro.config import (
     HEADER_MAGNET_RAW_OE_ABS,
     CLEANER_HEADER_LENGTH,
     CLEANER_OPTION_LABEL,
+    CLEANER_RAW_COL_DTYPES,
 )
 
 
@@ -65,6 +69,16 @@ def sample_header():
     return header
 
 
+@pytest.fixture
+def raw_data_folder(tmp_path):
+    """Isolated raw data folder holding two copies of the example PPMS data file."""
+    example_fp = TESTS_PATH / "fixtures" / "example_raw_amro_datafile.dat"
+    for label in ["11", "12"]:
+        fn = f"YbPdBi_{HEADER_EXPERIMENT_PREFIX}{label}_example.dat"
+        (tmp_path / fn).write_text(example_fp.read_text())
+    return tmp_path
+
+
 @pytest.fixture
 def sample_raw_dataframe():
     """Sample raw DataFrame with oscillation data for anti-symmetrization.
@@ -158,6 +172,10 @@ class TestAMROCleanerInit:
         """Test get_experiment_labels returns empty list initially."""
         assert cleaner.get_experiment_labels() == []
 
+    def test_get_failed_files_empty(self, cleaner):
+        """Test get_failed_files returns empty dict initially."""
+        assert cleaner.get_failed_files() == {}
+
 
 # =============================================================================
 # Header Parsing Tests
@@ -212,6 +230,42 @@ class TestHeaderParsing:
             cleaner._parse_and_verify_header(sample_header)
 
 
+# =============================================================================
+# Raw File Reading Tests
+# =============================================================================
+
+
+class TestReadPPMSFile:
+
+    def test_read_ppms_file_returns_header(self, cleaner):
+        """Test the header is read in the same pass as the data."""
+        fp = TESTS_PATH / "fixtures" / "example_raw_amro_datafile.dat"
+        header, _ = cleaner._read_ppms_file(fp)
+
+        assert len(header) == CLEANER_HEADER_LENGTH
+        exp_label, geom, _, _ = cleaner._parse_and_verify_header(header)
+        assert exp_label == f"{HEADER_EXPERIMENT_PREFIX}11"
+        assert "para" in geom.lower()
+
+    def test_read_ppms_file_reads_only_needed_columns(self, cleaner):
+        """Test only the columns used by the cleaner are parsed, with set dtypes."""
+        fp = TESTS_PATH / "fixtures" / "example_raw_amro_datafile.dat"
+        _, data = cleaner._read_ppms_file(fp)
+
+        assert list(data.columns) == list(CLEANER_RAW_COL_DTYPES.keys())
+        assert all(dtype == np.float64 for dtype in data.dtypes)
+        assert len(data) > 0
+
+    def test_get_columns_for_calcs_after_read(self, cleaner):
+        """Test the reduced column set is still prepared for calculations."""
+        fp = TESTS_PATH / "fixtures" / "example_raw_amro_datafile.dat"
+        _, data = cleaner._read_ppms_file(fp)
+        data = cleaner._get_columns_for_calcs(data)
+
+        for col in [HEADER_RES_OHM, HEADER_TEMP, HEADER_MAGNET, HEADER_ANGLE_DEG]:
+            assert col in data.columns
+
+
 # =============================================================================
 # Experiment Label Tests
 # =============================================================================
@@ -351,30 +405,30 @@ class TestOutlierCleaning:
 
 class TestAntiSymmetrization:
 
-    def test_anti_symmetrize_oscillation_basic(self, cleaner, sample_raw_dataframe):
+    def test_anti_symmetrize_oscillations_basic(self, cleaner, sample_raw_dataframe):
         """Test basic anti-symmetrization produces averaged data."""
-        result = cleaner._anti_symmetrize_oscillation(sample_raw_dataframe)
+        result = cleaner._anti_symmetrize_oscillations(sample_raw_dataframe)
 
         assert result is not None
         # Should have half the rows (averaged +H and -H)
         assert len(result) == len(sample_raw_dataframe) // 2
 
-    def test_anti_symmetrize_oscillation_preserves_angles(
+    def test_anti_symmetrize_oscillations_preserves_angles(
         self, cleaner, sample_raw_dataframe
     ):
         """Test that all unique angles are preserved."""
-        result = cleaner._anti_symmetrize_oscillation(sample_raw_dataframe)
+        result = cleaner._anti_symmetrize_oscillations(sample_raw_dataframe)
 
         original_angles = sample_raw_dataframe[HEADER_ANGLE_DEG].unique()
         result_angles = result[HEADER_ANGLE_DEG].unique()
 
         np.testing.assert_array_equal(np.sort(original_angles), np.sort(result_angles))
 
-    def test_anti_symmetrize_oscillation_averages_resistivity(
+    def test_anti_symmetrize_oscillations_averages_resistivity(
         self, cleaner, sample_raw_dataframe
     ):
         """Test that resistivity is properly averaged."""
-        result = cleaner._anti_symmetrize_oscillation(sample_raw_dataframe)
+        result = cleaner._anti_symmetrize_oscillations(sample_raw_dataframe)
 
         # Average of +H and -H should be close to base value
         mean_res = result[HEADER_RES_OHM].mean()
@@ -382,6 +436,36 @@ class TestAntiSymmetrization:
 
         np.testing.assert_almost_equal(mean_res, expected_mean, decimal=10)
 
+    def test_anti_symmetrize_oscillations_multiple_in_one_pass(
+        self, cleaner, sample_raw_dataframe
+    ):
+        """Test that every T/H oscillation in a frame is anti-symmetrized together."""
+        second_osc = sample_raw_dataframe.copy()
+        second_osc[HEADER_TEMP] = 5.0
+        combined = pd.concat([sample_raw_dataframe, second_osc], ignore_index=True)
+
+        result = cleaner._anti_symmetrize_oscillations(combined)
+
+        assert len(result) == len(combined) // 2
+        assert set(result[HEADER_TEMP].unique()) == {2.0, 5.0}
+
+    def test_anti_symmetrize_oscillations_handles_each_oscillation_separately(
+        self, cleaner, sample_raw_dataframe
+    ):
+        """Test missing measurements in one oscillation don't affect another."""
+        second_osc = sample_raw_dataframe.copy()
+        second_osc[HEADER_TEMP] = 5.0
+        # Drop the -H measurement at the first angle of the second oscillation
+        second_osc = second_osc.drop(index=len(second_osc) // 2)
+        combined = pd.concat([sample_raw_dataframe, second_osc], ignore_index=True)
+
+        result = cleaner._anti_symmetrize_oscillations(combined)
+
+        n_angles = len(sample_raw_dataframe) // 2
+        counts = result.groupby(HEADER_TEMP).size()
+        assert counts[2.0] == n_angles
+        assert counts[5.0] == n_angles - 1
+
 
 # =============================================================================
 # Missing/Extra Measurement Handling Tests
@@ -468,6 +552,24 @@ class TestVerification:
 
         assert result is None
 
+    def test_verify_averaged_df_drops_only_invalid_oscillations(
+        self, cleaner, sample_raw_dataframe
+    ):
+        """Test verification is done per oscillation."""
+        second_osc = sample_raw_dataframe.copy()
+        second_osc[HEADER_TEMP] = 5.0
+        combined = pd.concat([sample_raw_dataframe, second_osc], ignore_index=True)
+        averaged = combined.groupby(
+            [HEADER_TEMP, HEADER_MAGNET, HEADER_ANGLE_DEG], as_index=False
+        ).mean()
+
+        # Remove a row of the second oscillation only
+        averaged_bad = averaged.iloc[:-1]
+
+        result = cleaner._verify_averaged_df(averaged_bad, combined)
+
+        assert list(result[HEADER_TEMP].unique()) == [2.0]
+
 
 # =============================================================================
 # Filter Tests
@@ -523,3 +625,189 @@ class TestIntegration:
 
         assert test_cleaner.load_path == tmp_path
         assert test_cleaner.save_path == tmp_path
+
+
+# =============================================================================
+# Folder Cleaning Tests
+# =============================================================================
+
+
+class TestCleanDataFromFolder:
+
+    def test_serial_cleaning_saves_files(self, raw_data_folder):
+        """Test each raw file is cleaned and saved in filename order."""
+        cleaner = AMROCleaner(datafile_type=".dat")
+        cleaner.clean_data_from_folder()
+
+        assert cleaner.get_experiment_labels() == [
+            f"{HEADER_EXPERIMENT_PREFIX}11",
+            f"{HEADER_EXPERIMENT_PREFIX}12",
+        ]
+        for label in cleaner.get_experiment_labels():
+            assert (raw_data_folder / (label + CLEANER_SAVE_FN_SUFFIX)).is_file()
+
+    def test_parallel_matches_serial(self, raw_data_folder):
+        """Test cleaning with a process pool gives the same labels and output."""
+        serial_cleaner = AMROCleaner(datafile_type=".dat")
+        serial_cleaner.clean_data_from_folder(workers=1)
+        fn = f"{HEADER_EXPERIMENT_PREFIX}11" + CLEANER_SAVE_FN_SUFFIX
+        serial_df = pd.read_csv(raw_data_folder / fn)
+
+        parallel_cleaner = AMROCleaner(datafile_type=".dat")
+        parallel_cleaner.clean_data_from_folder(workers=2)
+        parallel_df = pd.read_csv(raw_data_folder / fn)
+
+        assert (
+            parallel_cleaner.get_experiment_labels()
+            == serial_cleaner.get_experiment_labels()
+        )
+        pd.testing.assert_frame_equal(serial_df, parallel_df)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_bad_file_does_not_abort_batch(self, raw_data_folder, workers):
+        """Test a file that fails to clean is reported and the rest are processed."""
+        bad_fn = f"{HEADER_EXPERIMENT_PREFIX}10_bad.dat"
+        (raw_data_folder / bad_fn).write_text("not,a,ppms,file\n")
+
+        cleaner = AMROCleaner(datafile_type=".dat")
+        cleaner.clean_data_from_folder(workers=workers)
+
+        assert bad_fn in cleaner.get_failed_files()
+        assert len(cleaner.get_experiment_labels()) == 2
+
+
+# =============================================================================
+# Incremental Cleaning Tests
+# =============================================================================
+
+
+class TestIncrementalCleaning:
+
+    def test_manifest_written(self, raw_data_folder):
+        """Test a manifest entry is recorded for every cleaned file."""
+        cleaner = AMROCleaner(datafile_type=".dat")
+        cleaner.clean_data_from_folder()
+
+        manifest = cleaner._load_manifest()
+        assert (raw_data_folder / CLEANER_MANIFEST_FN).is_file()
+        assert len(manifest) == 2
+        for entry in manifest.values():
+            assert entry["config"] == cleaner._get_cleaner_config()
+            assert len(entry["sha256"]) == 64
+
+    def test_unchanged_files_skipped(self, raw_data_folder, capsys):
+        """Test re-running skips files whose cleaned output is still valid."""
+        AMROCleaner(datafile_type=".dat").clean_data_from_folder()
+        capsys.readouterr()
+
+        cleaner = AMROCleaner(datafile_type=".dat")
+        with patch.object(AMROCleaner, "_clean_file") as mock_clean:
+            cleaner.clean_data_from_folder()
+
+        mock_clean.assert_not_called()
+        assert len(cleaner.get_experiment_labels()) == 2
+        assert "unchanged" in capsys.readouterr().out
+
+    def test_changed_file_recleaned(self, raw_data_folder):
+        """Test only new or changed files are re-cleaned."""
+        AMROCleaner(datafile_type=".dat").clean_data_from_folder()
+
+        changed_fp = raw_data_folder / f"YbPdBi_{HEADER_EXPERIMENT_PREFIX}12_example.dat"
+        changed_fp.write_text(changed_fp.read_text() + "\n")
+
+        cleaner = AMROCleaner(datafile_type=".dat")
+        with patch.object(
+            AMROCleaner, "_clean_file", return_value=f"{HEADER_EXPERIMENT_PREFIX}12"
+        ) as mock_clean:
+            cleaner.clean_data_from_folder()
+
+        mock_clean.assert_called_once_with(changed_fp)
+
+    def test_missing_output_recleaned(self, raw_data_folder):
+        """Test a file is re-cleaned when its cleaned output was deleted."""
+        AMROCleaner(datafile_type=".dat").clean_data_from_folder()
+        fn = f"{HEADER_EXPERIMENT_PREFIX}11" + CLEANER_SAVE_FN_SUFFIX
+        (raw_data_folder / fn).unlink()
+
+        AMROCleaner(datafile_type=".dat").clean_data_from_folder()
+
+        assert (raw_data_folder / fn).is_file()
+
+    def test_changed_config_recleans(self, raw_data_folder, monkeypatch):
+        """Test every file is re-cleaned when a cleaner threshold changes."""
+        AMROCleaner(datafile_type=".dat").clean_data_from_folder()
+        monkeypatch.setattr("amro.data.cleaner.CLEANER_OUTLIER_RES_STD", 4)
+
+        cleaner = AMROCleaner(datafile_type=".dat")
+        with patch.object(AMROCleaner, "_clean_file", return_value=None) as mock_clean:
+            cleaner.clean_data_from_folder()
+
+        assert mock_clean.call_count == 2
+
+    def test_force_recleans(self, raw_data_folder):
+        """Test force ignores the manifest."""
+        AMROCleaner(datafile_type=".dat").clean_data_from_folder()
+
+        cleaner = AMROCleaner(datafile_type=".dat")
+        with patch.object(AMROCleaner, "_clean_file", return_value=None) as mock_clean:
+            cleaner.clean_data_from_folder(force=True)
+
+        assert mock_clean.call_count == 2
+
+
+# =============================================================================
+# Chunked Cleaning Tests
+# =============================================================================
+
+
+class TestChunkedCleaning:
+
+    def _clean_and_read(self, folder, chunksize):
+        """Clean the folder and return the cleaned DataFrame of experiment 11."""
+        AMROCleaner(datafile_type=".dat", chunksize=chunksize).clean_data_from_folder(
+            force=True
+        )
+        fn = f"{HEADER_EXPERIMENT_PREFIX}11" + CLEANER_SAVE_FN_SUFFIX
+        return pd.read_csv(folder / fn)
+
+    @pytest.mark.parametrize("chunksize", [7, 100, 10000])
+    def test_chunked_matches_whole_file(self, raw_data_folder, chunksize):
+        """Test streaming a file gives the same output as reading it whole."""
+        whole_df = self._clean_and_read(raw_data_folder, None)
+        chunked_df = self._clean_and_read(raw_data_folder, chunksize)
+
+        pd.testing.assert_frame_equal(whole_df, chunked_df)
+        assert list(raw_data_folder.glob("*.partial")) == []
+
+    def test_repeated_oscillation_skipped(self, raw_data_folder, capsys):
+        """Test rows of an already saved T/H pairing that reappear are skipped."""
+        whole_df = self._clean_and_read(raw_data_folder, None)
+
+        # Append the first oscillation's rows again after the rest of the file
+        fp = raw_data_folder / f"YbPdBi_{HEADER_EXPERIMENT_PREFIX}11_example.dat"
+        lines = fp.read_text().splitlines()
+        data_start = CLEANER_HEADER_LENGTH + 1
+        fp.write_text("\n".join(lines + lines[data_start : data_start + 90]) + "\n")
+        chunked_df = self._clean_and_read(raw_data_folder, 50)
+
+        pd.testing.assert_frame_equal(whole_df, chunked_df)
+        assert "already saved oscillation" in capsys.readouterr().out
+
+    def test_failed_file_leaves_no_partial_output(self, raw_data_folder):
+        """Test an error while streaming removes the partially written file."""
+        cleaner = AMROCleaner(datafile_type=".dat", chunksize=50)
+        calls = []
+        original = AMROCleaner._get_columns_for_calcs
+
+        def fail_late(self, df):
+            calls.append(len(df))
+            if len(calls) > 5:
+                raise ValueError("bad chunk")
+            return original(self, df)
+
+        with patch.object(AMROCleaner, "_get_columns_for_calcs", fail_late):
+            cleaner.clean_data_from_folder(force=True)
+
+        assert len(cleaner.get_failed_files()) == 2
+        assert list(raw_data_folder.glob("*.partial")) == []
+        assert list(raw_data_folder.glob("*" + CLEANER_SAVE_FN_SUFFIX)) == []
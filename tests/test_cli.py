@@ -1,4 +1,4 @@
-"""Tests for CLI scripts (run_pipeline.py and run_cleaner.py)."""
+"""Tests for CLI scripts (run_pipeline.py, run_cleaner.py and run_filter_sweep.py)."""
 
 import sys
 import pytest
@@ -15,6 +15,7 @@ from amro.data import Experiment, ProjectData
 sys.path.insert(0, str(pytest.importorskip("pathlib").Path(__file__).resolve().parents[1] / "scripts"))
 from run_pipeline import parse_args as pipeline_parse_args, check_geometry_defaults
 from run_cleaner import parse_args as cleaner_parse_args
+from run_filter_sweep import parse_args as sweep_parse_args, get_filter_grid
 
 
 # =============================================================================
@@ -29,6 +30,9 @@ class TestCleanerParseArgs:
         with patch("sys.argv", ["run_cleaner.py"]):
             args = cleaner_parse_args()
         assert args.datafile_type == ".dat"
+        assert args.jobs == 1
+        assert args.chunksize is None
+        assert args.force is False
         assert args.verbose is False
 
     def test_datafile_type_csv(self):
@@ -46,6 +50,21 @@ class TestCleanerParseArgs:
             args = cleaner_parse_args()
         assert args.verbose is True
 
+    def test_force_flag(self):
+        with patch("sys.argv", ["run_cleaner.py", "--force"]):
+            args = cleaner_parse_args()
+        assert args.force is True
+
+    def test_jobs(self):
+        with patch("sys.argv", ["run_cleaner.py", "--jobs", "4"]):
+            args = cleaner_parse_args()
+        assert args.jobs == 4
+
+    def test_chunksize(self):
+        with patch("sys.argv", ["run_cleaner.py", "--chunksize", "50000"]):
+            args = cleaner_parse_args()
+        assert args.chunksize == 50000
+
 
 # =============================================================================
 # run_pipeline: Argument Parsing Tests
@@ -74,6 +93,12 @@ class TestPipelineParseArgs:
         assert args.max_freq == 8
         assert args.force_symmetry is True
         assert args.save_name is None
+        assert args.jobs == 1
+        assert args.solver == "lmfit"
+        assert args.fourier_method == "fft"
+        assert args.warm_start is None
+        assert args.fit_cache is False
+        assert args.refit is False
         assert args.verbose is False
         assert args.plot is False
 
@@ -82,6 +107,42 @@ class TestPipelineParseArgs:
             args = pipeline_parse_args()
         assert args.fourier_only is True
 
+    def test_jobs(self):
+        with patch("sys.argv", ["run_pipeline.py", "--project-name", "test", "--jobs", "4"]):
+            args = pipeline_parse_args()
+        assert args.jobs == 4
+
+    def test_solver(self):
+        with patch("sys.argv", ["run_pipeline.py", "--project-name", "test", "--solver", "least_squares"]):
+            args = pipeline_parse_args()
+        assert args.solver == "least_squares"
+
+    def test_solver_linear(self):
+        with patch("sys.argv", ["run_pipeline.py", "--project-name", "test", "--solver", "linear"]):
+            args = pipeline_parse_args()
+        assert args.solver == "linear"
+
+    def test_fourier_method_nudft(self):
+        with patch("sys.argv", ["run_pipeline.py", "--project-name", "test", "--fourier-method", "nudft"]):
+            args = pipeline_parse_args()
+        assert args.fourier_method == "nudft"
+
+    def test_warm_start(self):
+        with patch("sys.argv", ["run_pipeline.py", "--project-name", "test", "--warm-start", "temperature"]):
+            args = pipeline_parse_args()
+        assert args.warm_start == "temperature"
+
+    def test_fit_cache_and_refit(self):
+        with patch("sys.argv", ["run_pipeline.py", "--project-name", "test", "--fit-cache", "--refit"]):
+            args = pipeline_parse_args()
+        assert args.fit_cache is True
+        assert args.refit is True
+
+    def test_solver_invalid(self):
+        with patch("sys.argv", ["run_pipeline.py", "--project-name", "test", "--solver", "bfgs"]):
+            with pytest.raises(SystemExit):
+                pipeline_parse_args()
+
     def test_fit_only(self):
         with patch("sys.argv", ["run_pipeline.py", "--project-name", "test", "--fit-only"]):
             args = pipeline_parse_args()
@@ -213,4 +274,41 @@ class TestCheckGeometryDefaults:
     def test_empty_project_no_warnings(self):
         project = ProjectData(project_name="test")
         warnings = check_geometry_defaults(project, verbose=False)
-        assert warnings == []
\ No newline at end of file
+        assert warnings == []
+
+
+# =============================================================================
+# run_filter_sweep: Argument Parsing Tests
+# =============================================================================
+
+
+class TestFilterSweepParseArgs:
+    def test_defaults(self):
+        with patch("sys.argv", ["run_filter_sweep.py", "--project-name", "test"]):
+            args = sweep_parse_args()
+        assert args.min_amp_ratios == [0.075]
+        assert args.max_freqs == [8]
+        assert args.force_symmetry == ["on"]
+        assert args.jobs == 1
+        assert args.solver == "lmfit"
+        assert args.warm_start is None
+        assert args.fit_cache is False
+
+    def test_filter_grid_covers_every_combination(self):
+        argv = [
+            "run_filter_sweep.py", "--project-name", "test",
+            "--min-amp-ratios", "0.05", "0.1",
+            "--max-freqs", "6", "8", "10",
+            "--force-symmetry", "on", "off",
+        ]
+        with patch("sys.argv", argv):
+            args = sweep_parse_args()
+        grid = get_filter_grid(args)
+        assert len(grid) == 12
+        assert grid[0] == (0.05, 6, True)
+        assert grid[-1] == (0.1, 10, False)
+
+    def test_force_symmetry_invalid(self):
+        with patch("sys.argv", ["run_filter_sweep.py", "--project-name", "test", "--force-symmetry", "maybe"]):
+            with pytest.raises(SystemExit):
+                sweep_parse_args()
@@ -1,7 +1,9 @@
 """Tests for amro.data.data_structures module."""
 
 import pytest
+import pickle
 import numpy as np
+import pandas as pd
 import lmfit as lm
 
 from amro.config import (
@@ -10,15 +12,24 @@ from amro.config import (
     HEADER_PARAM_PHASE_PREFIX,
     HEADER_PARAM_AMP_PREFIX,
     HEADER_PARAM_FREQ_PREFIX,
+    HEADER_EXP_LABEL,
+    HEADER_TEMP,
+    HEADER_MAGNET,
+    HEADER_GEO,
+    HEADER_ANGLE_DEG,
+    HEADER_RES_OHM,
+    HEADER_RES_UOHM,
 )
 from amro.data import (
     OscillationKey,
     ExperimentalData,
     FourierResult,
     FitResult,
+    CompactFitResult,
     AMROscillation,
     Experiment,
     ProjectData,
+    PackedOscillations,
 )
 
 
@@ -312,6 +323,36 @@ class TestExperimentalData:
     def test_get_magnetic_field(self, sample_experimental_data):
         assert sample_experimental_data.get_magnetic_field() == 3.0
 
+    def test_derived_values_computed_lazily(self, sample_experimental_data):
+        assert "delta_res_0deg_norm_pct" not in vars(sample_experimental_data)
+
+        first = sample_experimental_data.delta_res_0deg_norm_pct
+
+        assert "delta_res_0deg_norm_pct" in vars(sample_experimental_data)
+        assert sample_experimental_data.delta_res_0deg_norm_pct is first
+        assert "delta_res_mean_uohms" not in vars(sample_experimental_data)
+
+    def test_reassigning_res_invalidates_derived_values(
+        self, sample_experimental_data
+    ):
+        old_mean = sample_experimental_data.mean_res_ohms
+        old_delta = sample_experimental_data.delta_res_mean_ohms
+
+        sample_experimental_data.res_ohms = sample_experimental_data.res_ohms * 2
+
+        assert sample_experimental_data.mean_res_ohms == pytest.approx(2 * old_mean)
+        np.testing.assert_allclose(
+            sample_experimental_data.delta_res_mean_ohms, 2 * old_delta
+        )
+
+    def test_pickle_excludes_derived_values(self, sample_experimental_data):
+        expected = sample_experimental_data.delta_res_mean_norm.copy()
+
+        restored = pickle.loads(pickle.dumps(sample_experimental_data))
+
+        assert "delta_res_mean_norm" not in vars(restored)
+        np.testing.assert_array_equal(restored.delta_res_mean_norm, expected)
+
 
 # =============================================================================
 # FourierResult Tests
@@ -456,6 +497,17 @@ class TestAMROscillation:
     def test_get_magnetic_field(self, sample_amro_oscillation):
         assert sample_amro_oscillation.get_magnetic_field() == 3.0
 
+    def test_get_oscillation_as_dataframe(
+        self, sample_amro_oscillation, sample_angles, sample_resistivities
+    ):
+        df = sample_amro_oscillation.get_oscillation_as_dataframe()
+        assert len(df) == len(sample_angles)
+        assert (df[HEADER_EXP_LABEL] == HEADER_EXPERIMENT_PREFIX + "11").all()
+        assert (df[HEADER_TEMP] == 2.0).all()
+        assert (df[HEADER_MAGNET] == 3.0).all()
+        np.testing.assert_array_equal(df[HEADER_ANGLE_DEG], sample_angles)
+        np.testing.assert_allclose(df[HEADER_RES_UOHM], sample_resistivities * 1e6)
+
 
 # =============================================================================
 # Experiment Tests
@@ -545,6 +597,62 @@ class TestExperiment:
         for osc in oscs_at_3T:
             assert osc.get_magnetic_field() == 3.0
 
+    def test_get_multiple_oscillations_by_set_and_range(self, populated_experiment):
+        oscs = populated_experiment.get_multiple_oscillations(t=[2.0, 10.0], h=7.0)
+        assert [(o.get_temperature(), o.get_magnetic_field()) for o in oscs] == [
+            (2.0, 7.0),
+            (10.0, 7.0),
+        ]
+
+        oscs = populated_experiment.get_multiple_oscillations(t_range=(2, 5))
+        assert [o.get_temperature() for o in oscs] == [2.0, 2.0, 5.0, 5.0]
+
+        oscs = populated_experiment.get_multiple_oscillations(
+            t_range=(3, 100), h_range=(0, 5)
+        )
+        assert [o.get_temperature() for o in oscs] == [5.0, 10.0]
+
+    def test_get_multiple_oscillations_with_tolerance(self, populated_experiment):
+        assert populated_experiment.get_multiple_oscillations(t=5.01) == []
+
+        oscs = populated_experiment.get_multiple_oscillations(t=5.01, t_tol=0.05)
+
+        assert [o.get_temperature() for o in oscs] == [5.0, 5.0]
+
+    def test_get_nearest_oscillation(self, populated_experiment):
+        osc = populated_experiment.get_nearest_oscillation(6.0, 6.0)
+        assert (osc.get_temperature(), osc.get_magnetic_field()) == (5.0, 7.0)
+
+        assert populated_experiment.get_nearest_oscillation(7.5, 3.0, t_tol=1) is None
+
+    def test_index_updated_after_adding_oscillation(self, populated_experiment):
+        assert populated_experiment.get_multiple_oscillations(t=20.0) == []
+
+        key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "11", 20.0, 3.0)
+        osc = AMROscillation(
+            key, ExperimentalData(key, np.linspace(0, 360, 361), np.full(361, 1e-5))
+        )
+        populated_experiment.add_oscillation(osc)
+
+        assert populated_experiment.get_multiple_oscillations(t=20.0) == [osc]
+
+    def test_get_experiment_as_dataframe(self, sample_experiment):
+        for t, n in [(2.0, 5), (5.0, 3)]:
+            key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "11", t, 9.0)
+            data = ExperimentalData(key, np.linspace(0, 360, n), np.full(n, t))
+            sample_experiment.add_oscillation(AMROscillation(key, data))
+
+        df = sample_experiment.get_experiment_as_dataframe()
+
+        assert len(df) == 8
+        assert list(df[HEADER_TEMP]) == [2.0] * 5 + [5.0] * 3
+        assert (df[HEADER_MAGNET] == 9.0).all()
+        assert (df[HEADER_GEO] == "perp").all()
+        assert list(df[HEADER_RES_OHM]) == [2.0] * 5 + [5.0] * 3
+
+    def test_get_experiment_as_dataframe_empty(self, sample_experiment):
+        assert sample_experiment.get_experiment_as_dataframe().empty
+
 
 # =============================================================================
 # ProjectData Tests
@@ -561,6 +669,16 @@ class TestProjectData:
         assert sample_project_data.experiments_count == 1
         assert HEADER_EXPERIMENT_PREFIX + "11" in sample_project_data.experiments_dict
 
+    def test_remove_experiment(self, sample_project_data, sample_experiment):
+        sample_project_data.add_experiment(sample_experiment)
+        sample_project_data.remove_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        assert sample_project_data.experiments_count == 0
+        assert sample_project_data.get_experiment_labels() == []
+
+    def test_remove_missing_experiment(self, sample_project_data, capsys):
+        sample_project_data.remove_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        assert "not found" in capsys.readouterr().out
+
     def test_get_experiment(self, sample_project_data, sample_experiment):
         sample_project_data.add_experiment(sample_experiment)
         retrieved = sample_project_data.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
@@ -663,6 +781,134 @@ class TestProjectData:
         )
         assert len(result) == 1
 
+    def test_filter_oscillations_by_range(self, populated_project_data):
+        result = populated_project_data.filter_oscillations(
+            t_range=(4, 12), h_vals=3.0
+        )
+
+        assert [osc.get_temperature() for osc in result] == [5.0, 10.0]
+
+    def test_read_amro_data_from_dataframe(self, populated_project_data):
+        df = populated_project_data.get_experiment(
+            HEADER_EXPERIMENT_PREFIX + "11"
+        ).get_experiment_as_dataframe()
+        project = ProjectData(project_name="copy")
+        project.add_experiment(
+            Experiment(HEADER_EXPERIMENT_PREFIX + "11", "perp", 1.0, 0.05)
+        )
+
+        project.read_amro_data_from_dataframe(df)
+
+        exp = project.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        assert list(exp.oscillations_dict) == list(
+            populated_project_data.experiments_dict[
+                HEADER_EXPERIMENT_PREFIX + "11"
+            ].oscillations_dict
+        )
+        np.testing.assert_array_equal(
+            exp.get_oscillation(5.0, 7.0).osc_data.angles_degs,
+            np.linspace(0, 360, 361),
+        )
+
+    def test_read_fourier_results_from_dataframe(self, populated_project_data):
+        exp = populated_project_data.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        for osc in exp.oscillations_dict.values():
+            osc.add_fourier_result(
+                xf=np.array([2, 4]),
+                yf=np.array([0.01 + 0.02j, osc.get_temperature() * 1j]),
+            )
+        df = populated_project_data.get_fourier_results_as_df()
+        for osc in exp.oscillations_dict.values():
+            osc.clear_fourier_result()
+
+        populated_project_data.read_fourier_results_from_dataframe(df)
+
+        for osc in exp.oscillations_dict.values():
+            np.testing.assert_array_equal(osc.fourier_result.xf, [2, 4])
+            np.testing.assert_allclose(
+                osc.fourier_result.yf, [0.01 + 0.02j, osc.get_temperature() * 1j]
+            )
+
+    def test_read_fourier_results_from_unsorted_dataframe(
+        self, populated_project_data, capsys
+    ):
+        exp = populated_project_data.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        for osc in exp.oscillations_dict.values():
+            osc.add_fourier_result(
+                xf=np.array([2, 4, 6]),
+                yf=np.array([0.5, osc.get_temperature() * 1j, osc.get_magnetic_field()]),
+            )
+        df = populated_project_data.get_fourier_results_as_df()
+        expected = {key: osc.fourier_result for key, osc in exp.oscillations_dict.items()}
+        unknown = df.iloc[:3].copy()
+        unknown[HEADER_EXP_LABEL] = "unknown"
+        df = pd.concat([df.iloc[::-1], unknown, unknown])
+
+        populated_project_data.read_fourier_results_from_dataframe(df)
+
+        assert capsys.readouterr().out.count("No Experiment found for unknown") == 1
+        for key, osc in exp.oscillations_dict.items():
+            assert (
+                osc.fourier_result.fourier_results_dict.keys()
+                == expected[key].fourier_results_dict.keys()
+            )
+            np.testing.assert_allclose(
+                np.sort(osc.fourier_result.amplitudes), np.sort(expected[key].amplitudes)
+            )
+
+    @pytest.mark.parametrize("chunksize", [None, 100])
+    def test_amro_csv_round_trip(self, populated_project_data, chunksize):
+        populated_project_data.save_amro_data_to_csv()
+
+        project = ProjectData.load_amro_data_from_csv(
+            "test_project", chunksize=chunksize
+        )
+
+        old_exp = populated_project_data.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        exp = project.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        assert exp.geometry == old_exp.geometry
+        assert exp.wire_sep == old_exp.wire_sep
+        assert exp.cross_section == old_exp.cross_section
+        assert set(exp.oscillations_dict) == set(old_exp.oscillations_dict)
+        for key, osc in exp.oscillations_dict.items():
+            old_data = old_exp.oscillations_dict[key].osc_data
+            np.testing.assert_allclose(osc.osc_data.angles_degs, old_data.angles_degs)
+            np.testing.assert_allclose(osc.osc_data.res_ohms, old_data.res_ohms)
+
+    def test_amro_csv_chunks_split_oscillations(self, populated_project_data, tmp_path):
+        exp = populated_project_data.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        fp = tmp_path / "interleaved_combined.csv"
+        # Interleave rows so every chunk holds pieces of several oscillations
+        df = exp.get_experiment_as_dataframe()
+        df.iloc[np.random.default_rng(0).permutation(len(df))].to_csv(fp, index=False)
+
+        full = ProjectData.load_amro_data_from_csv("full", fp)
+        chunked = ProjectData.load_amro_data_from_csv("chunked", fp, chunksize=97)
+
+        full_exp = full.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        chunked_exp = chunked.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        assert list(chunked_exp.oscillations_dict) == list(full_exp.oscillations_dict)
+        for key, osc in chunked_exp.oscillations_dict.items():
+            full_data = full_exp.oscillations_dict[key].osc_data
+            np.testing.assert_array_equal(osc.osc_data.angles_degs, full_data.angles_degs)
+            np.testing.assert_array_equal(osc.osc_data.res_ohms, full_data.res_ohms)
+
+    def test_load_amro_csv_without_geometry_columns(self, populated_project_data, tmp_path):
+        exp = populated_project_data.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        fp = tmp_path / "old_combined.csv"
+        exp.get_experiment_as_dataframe().iloc[::-1].to_csv(fp, index=False)
+
+        project = ProjectData.load_amro_data_from_csv("old", fp)
+
+        new_exp = project.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        assert new_exp.wire_sep == 1 and new_exp.cross_section == 1
+        assert new_exp.oscillations_count == exp.oscillations_count
+        # Rows are reversed in the file, so each oscillation's angles are too
+        np.testing.assert_array_equal(
+            new_exp.get_oscillation(5.0, 7.0).osc_data.angles_degs,
+            np.linspace(360, 0, 361),
+        )
+
     def test_change_project_name(self, sample_project_data):
         sample_project_data.change_project_name("new_name")
         assert sample_project_data.project_name == "new_name"
@@ -741,3 +987,373 @@ class TestFitResult:
 
     def test_get_magnetic_field(self, sample_fit_result):
         assert sample_fit_result.get_magnetic_field() == 3.0
+
+
+# =============================================================================
+# PackedOscillations Tests
+# =============================================================================
+
+
+class TestPackedOscillations:
+    def test_pack_replaces_data_with_views(self, populated_experiment):
+        oscillations = list(populated_experiment.oscillations_dict.values())
+        expected = [osc.osc_data.res_ohms.copy() for osc in oscillations]
+
+        packed = populated_experiment.pack_oscillations()
+
+        assert len(packed) == len(oscillations)
+        assert populated_experiment.packed_oscillations is packed
+        for osc, res in zip(oscillations, expected):
+            assert np.shares_memory(osc.osc_data.res_ohms, packed.res_ohms)
+            assert np.shares_memory(osc.osc_data.angles_degs, packed.angles_degs)
+            np.testing.assert_array_equal(osc.osc_data.res_ohms, res)
+
+    def test_pack_refreshes_derived_values(self, populated_experiment):
+        osc = next(iter(populated_experiment.oscillations_dict.values()))
+        old_rads = osc.osc_data.angles_rads
+
+        populated_experiment.pack_oscillations()
+
+        assert osc.osc_data.angles_rads is not old_rads
+        np.testing.assert_array_equal(osc.osc_data.angles_rads, old_rads)
+
+    def test_adding_oscillation_clears_packed(self, populated_experiment):
+        populated_experiment.pack_oscillations()
+        key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "11", 20.0, 3.0)
+        osc = AMROscillation(
+            key, ExperimentalData(key, np.linspace(0, 360, 361), np.full(361, 1e-5))
+        )
+
+        populated_experiment.add_oscillation(osc)
+
+        assert populated_experiment.packed_oscillations is None
+
+    def test_memory_mapped_round_trip(self, populated_experiment, tmp_path):
+        packed = populated_experiment.pack_oscillations()
+        packed.save(tmp_path / "packed")
+
+        loaded = PackedOscillations.load(tmp_path / "packed")
+        exp = Experiment.from_packed_oscillations(
+            experiment_label=populated_experiment.experiment_label,
+            geometry=populated_experiment.geometry,
+            wire_sep=populated_experiment.wire_sep,
+            cross_section=populated_experiment.cross_section,
+            packed=loaded,
+        )
+
+        assert isinstance(loaded.res_ohms, np.memmap)
+        assert list(exp.oscillations_dict) == list(
+            populated_experiment.oscillations_dict
+        )
+        for key, osc in exp.oscillations_dict.items():
+            original = populated_experiment.oscillations_dict[key]
+            assert np.shares_memory(osc.osc_data.res_ohms, loaded.res_ohms)
+            np.testing.assert_array_equal(
+                osc.osc_data.delta_res_mean_ohms, original.osc_data.delta_res_mean_ohms
+            )
+
+    def test_pickle_drops_packed_arrays(self, populated_experiment):
+        populated_experiment.pack_oscillations()
+
+        restored = pickle.loads(pickle.dumps(populated_experiment))
+
+        assert restored.packed_oscillations is None
+        for key, osc in restored.oscillations_dict.items():
+            np.testing.assert_array_equal(
+                osc.osc_data.res_ohms,
+                populated_experiment.oscillations_dict[key].osc_data.res_ohms,
+            )
+
+
+# =============================================================================
+# CompactFitResult Tests
+# =============================================================================
+
+
+class TestCompactFitResult:
+    @pytest.fixture
+    def fitted_oscillation(self, sample_oscillation_key, sample_lmfit_result):
+        angles = np.linspace(0, 360, 100, endpoint=False)
+        rads = np.deg2rad(angles)
+        res = 1e-5 * (1 + 0.1 * np.sin(4 * rads + 0.8))
+        osc = AMROscillation(
+            sample_oscillation_key,
+            ExperimentalData(sample_oscillation_key, angles, res),
+        )
+        osc.add_fit_result(lmfit_result=sample_lmfit_result, refitted=True)
+        return osc
+
+    def test_uses_slots(self, fitted_oscillation):
+        fitted_oscillation.compact_fit_result()
+        assert not hasattr(fitted_oscillation.fit_result, "__dict__")
+
+    def test_matches_fit_result(self, fitted_oscillation):
+        full = fitted_oscillation.fit_result
+        fitted_oscillation.compact_fit_result()
+        compact = fitted_oscillation.fit_result
+
+        assert isinstance(compact, CompactFitResult)
+        np.testing.assert_allclose(compact.model_res_ohms, full.model_res_ohms)
+        np.testing.assert_allclose(compact.model_res_uohms, full.model_res_uohms)
+        np.testing.assert_array_equal(
+            compact.model_residuals_uohms, full.model_residuals_uohms
+        )
+        np.testing.assert_array_equal(compact.symmetries, full.symmetries)
+        np.testing.assert_array_equal(compact.amplitudes_errs, full.amplitudes_errs)
+        assert compact.mean_err == full.mean_err
+        assert compact.chi_squared == full.chi_squared
+        assert compact.required_refit is True
+        assert compact.fitted_params_dict == full.fitted_params_dict
+        assert compact.fit_report == full.fit_report
+        for full_arr, compact_arr in zip(
+            full.get_fitted_params_with_errs(), compact.get_fitted_params_with_errs()
+        ):
+            np.testing.assert_allclose(compact_arr, full_arr)
+
+    def test_round_trip_to_fit_result(self, fitted_oscillation):
+        full = fitted_oscillation.fit_result
+        fitted_oscillation.compact_fit_result()
+        fitted_oscillation.expand_fit_result()
+        restored = fitted_oscillation.fit_result
+
+        assert isinstance(restored, FitResult)
+        assert restored.fit_report == full.fit_report
+        assert restored.fitted_params_dict == full.fitted_params_dict
+        np.testing.assert_allclose(restored.model_res_ohms, full.model_res_ohms)
+        np.testing.assert_array_equal(restored.covar_matrix, full.covar_matrix)
+
+    def test_missing_stderr_round_trips(self, fitted_oscillation):
+        for param in fitted_oscillation.fit_result.lmfit_params.values():
+            param.stderr = None
+        fitted_oscillation.compact_fit_result()
+
+        assert fitted_oscillation.fit_result.mean_err == 0
+        params = fitted_oscillation.fit_result.lmfit_params
+        assert all(param.stderr is None for param in params.values())
+
+    def test_project_pickle_is_smaller(self, sample_project_data, fitted_oscillation):
+        experiment = Experiment(HEADER_EXPERIMENT_PREFIX + "11", "perp", 1, 1)
+        experiment.add_oscillation(fitted_oscillation)
+        sample_project_data.add_experiment(experiment)
+        full_size = len(pickle.dumps(sample_project_data))
+
+        fp = sample_project_data.pickle_fp
+        sample_project_data.save_project_to_pickle(compact_fit_results=True)
+        loaded = ProjectData.load_project_from_pickle(fp)
+
+        assert fp.stat().st_size < full_size
+        fit = loaded.get_experiment(HEADER_EXPERIMENT_PREFIX + "11").oscillations_dict[
+            fitted_oscillation.key
+        ].fit_result
+        assert isinstance(fit, CompactFitResult)
+        np.testing.assert_allclose(
+            fit.model_res_ohms, fitted_oscillation.fit_result.model_res_ohms
+        )
+
+
+# =============================================================================
+# Project Store Tests
+# =============================================================================
+
+
+class TestProjectStore:
+    @pytest.fixture
+    def stored_project(
+        self, sample_project_data, sample_amro_oscillation, sample_lmfit_result
+    ):
+        """Project with two experiments, one holding Fourier and fit results."""
+        exp_11 = Experiment(
+            experiment_label=HEADER_EXPERIMENT_PREFIX + "11",
+            geometry="perp",
+            wire_sep=1.0,
+            cross_section=0.5,
+        )
+        sample_amro_oscillation.add_fourier_result(
+            xf=np.array([2, 4]), yf=np.array([0.05 + 0.01j, 0.1 - 0.02j])
+        )
+        sample_amro_oscillation.add_fit_result(sample_lmfit_result, refitted=False)
+        exp_11.add_oscillation(sample_amro_oscillation)
+
+        exp_12 = Experiment(
+            experiment_label=HEADER_EXPERIMENT_PREFIX + "12",
+            geometry="para",
+            wire_sep=0.1,
+            cross_section=0.02,
+        )
+        for t in [2.0, 5.0]:
+            key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "12", t, 9.0)
+            data = ExperimentalData(key, np.linspace(0, 360, 10), np.full(10, t))
+            exp_12.add_oscillation(AMROscillation(key, data))
+
+        sample_project_data.add_experiment(exp_11)
+        sample_project_data.add_experiment(exp_12)
+        sample_project_data.fit_filter_str = "ratio_0.1_maxf_8"
+        return sample_project_data
+
+    def test_save_writes_index_and_shards(self, stored_project, tmp_path):
+        written = stored_project.save_project()
+
+        assert written == [HEADER_EXPERIMENT_PREFIX + "11", HEADER_EXPERIMENT_PREFIX + "12"]
+        assert stored_project.check_for_project_store()
+        assert (stored_project.store_path / "ACTRot11.npz").is_file()
+        assert (stored_project.store_path / "ACTRot12.npz").is_file()
+
+    def test_round_trip(self, stored_project):
+        stored_project.save_project()
+
+        loaded = ProjectData.load_project("test_project")
+
+        assert loaded.get_experiment_labels() == stored_project.get_experiment_labels()
+        assert loaded.fit_filter_str == "ratio_0.1_maxf_8"
+        exp = loaded.get_experiment(HEADER_EXPERIMENT_PREFIX + "12")
+        assert exp.geometry == "para"
+        assert exp.cross_section == 0.02
+        assert exp.oscillations_count == 2
+        osc = exp.get_oscillation(5.0, 9.0)
+        np.testing.assert_array_equal(osc.osc_data.res_ohms, np.full(10, 5.0))
+        assert osc.fourier_result is None
+        assert osc.fit_result is None
+
+    def test_loaded_experiment_is_packed(self, stored_project):
+        stored_project.save_project()
+
+        loaded = ProjectData.load_project("test_project")
+
+        exp = loaded.get_experiment(HEADER_EXPERIMENT_PREFIX + "12")
+        assert len(exp.packed_oscillations) == 2
+        for osc in exp.oscillations_dict.values():
+            assert np.shares_memory(
+                osc.osc_data.res_ohms, exp.packed_oscillations.res_ohms
+            )
+
+    def test_round_trip_fourier_and_fit_results(
+        self, stored_project, sample_amro_oscillation
+    ):
+        stored_project.save_project()
+
+        loaded = ProjectData.load_project("test_project")
+        osc = loaded.get_experiment(HEADER_EXPERIMENT_PREFIX + "11").get_oscillation(
+            2.0, 3.0
+        )
+        old_fourier = sample_amro_oscillation.fourier_result
+        old_fit = sample_amro_oscillation.fit_result
+
+        np.testing.assert_array_equal(osc.fourier_result.xf, old_fourier.xf)
+        np.testing.assert_array_equal(osc.fourier_result.yf, old_fourier.yf)
+        np.testing.assert_array_equal(osc.fit_result.symmetries, old_fit.symmetries)
+        np.testing.assert_allclose(osc.fit_result.amplitudes, old_fit.amplitudes)
+        np.testing.assert_allclose(
+            osc.fit_result.amplitudes_errs, old_fit.amplitudes_errs
+        )
+        np.testing.assert_allclose(osc.fit_result.phases, old_fit.phases)
+        assert osc.fit_result.mean == old_fit.mean
+        assert osc.fit_result.chi_squared == old_fit.chi_squared
+        np.testing.assert_allclose(osc.fit_result.covar_matrix, old_fit.covar_matrix)
+        np.testing.assert_allclose(osc.fit_result.model_res_ohms, old_fit.model_res_ohms)
+        np.testing.assert_array_equal(
+            osc.fit_result.model_residuals_ohms, old_fit.model_residuals_ohms
+        )
+        assert osc.fit_result.required_refit is False
+
+    def test_save_writes_only_changed_experiments(self, stored_project):
+        stored_project.save_project()
+
+        assert stored_project.save_project() == []
+
+        exp = stored_project.get_experiment(HEADER_EXPERIMENT_PREFIX + "12")
+        exp.get_oscillation(2.0, 9.0).clear_fourier_result()
+        osc = exp.get_oscillation(2.0, 9.0)
+        osc.add_fourier_result(xf=np.array([1, 2]), yf=np.array([1.0, 0.5j]))
+
+        assert stored_project.save_project() == [HEADER_EXPERIMENT_PREFIX + "12"]
+
+    def test_save_deletes_removed_experiment_shard(self, stored_project):
+        stored_project.save_project()
+
+        stored_project.remove_experiment(HEADER_EXPERIMENT_PREFIX + "12")
+        stored_project.save_project()
+
+        assert not (stored_project.store_path / "ACTRot12.npz").is_file()
+        loaded = ProjectData.load_project("test_project")
+        assert loaded.get_experiment_labels() == [HEADER_EXPERIMENT_PREFIX + "11"]
+
+    def test_load_selected_experiments(self, stored_project):
+        stored_project.save_project()
+
+        loaded = ProjectData.load_project(
+            "test_project", experiments=HEADER_EXPERIMENT_PREFIX + "12"
+        )
+
+        assert list(loaded.experiments_dict) == [HEADER_EXPERIMENT_PREFIX + "12"]
+        assert loaded.unloaded_experiments == [HEADER_EXPERIMENT_PREFIX + "11"]
+
+    def test_unloaded_experiments_visible(self, stored_project):
+        stored_project.save_project()
+        loaded = ProjectData.load_project(
+            "test_project", experiments=HEADER_EXPERIMENT_PREFIX + "12"
+        )
+
+        assert sorted(loaded.get_experiment_labels()) == [
+            HEADER_EXPERIMENT_PREFIX + "11",
+            HEADER_EXPERIMENT_PREFIX + "12",
+        ]
+        assert loaded.has_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        assert not loaded.has_experiment("not_an_experiment")
+
+    def test_filter_oscillations_loads_unloaded_experiment(self, stored_project):
+        stored_project.save_project()
+        loaded = ProjectData.load_project(
+            "test_project", experiments=HEADER_EXPERIMENT_PREFIX + "12"
+        )
+
+        oscs = loaded.filter_oscillations(experiments=HEADER_EXPERIMENT_PREFIX + "11")
+
+        assert len(oscs) == 1
+        assert loaded.unloaded_experiments == []
+        assert loaded.get_summary_statistics()["n_experiments"] == 2
+
+    def test_remove_unloaded_experiment(self, stored_project):
+        stored_project.save_project()
+        loaded = ProjectData.load_project(
+            "test_project", experiments=HEADER_EXPERIMENT_PREFIX + "12"
+        )
+
+        loaded.remove_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        loaded.save_project()
+
+        reloaded = ProjectData.load_project("test_project")
+        assert reloaded.get_experiment_labels() == [HEADER_EXPERIMENT_PREFIX + "12"]
+
+    def test_get_experiment_loads_unloaded_experiment(self, stored_project):
+        stored_project.save_project()
+        loaded = ProjectData.load_project("test_project", experiments=[])
+
+        exp = loaded.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+
+        assert exp.oscillations_count == 1
+        assert loaded.experiments_count == 1
+        assert loaded.unloaded_experiments == [HEADER_EXPERIMENT_PREFIX + "12"]
+
+    def test_save_keeps_unloaded_experiments(self, stored_project):
+        stored_project.save_project()
+        loaded = ProjectData.load_project(
+            "test_project", experiments=HEADER_EXPERIMENT_PREFIX + "11"
+        )
+
+        loaded.save_project()
+
+        assert (loaded.store_path / "ACTRot12.npz").is_file()
+        reloaded = ProjectData.load_project("test_project")
+        assert reloaded.experiments_count == 2
+
+    def test_pickle_export_includes_unloaded_experiments(
+        self, stored_project, tmp_path
+    ):
+        stored_project.save_project()
+        loaded = ProjectData.load_project("test_project", experiments=[])
+
+        loaded.save_project_to_pickle()
+        imported = ProjectData.load_project_from_pickle(loaded.pickle_fp)
+
+        assert imported.experiments_count == 2
+        assert imported.unloaded_experiments == []
@@ -1,7 +1,10 @@
 """Tests for amro.models.fitter module."""
 
 import pytest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
 import numpy as np
+import pandas as pd
 import lmfit as lm
 
 from amro.config import (
@@ -10,6 +13,13 @@ from amro.config import (
     HEADER_PARAM_PHASE_PREFIX,
     HEADER_PARAM_AMP_PREFIX,
     HEADER_PARAM_FREQ_PREFIX,
+    FIT_CACHE_DIR_NAME,
+    FIT_SWEEP_FN_SUFFIX,
+    HEADER_FIT_MIN_AMP_RATIO,
+    HEADER_FIT_MAX_FREQ,
+    HEADER_FIT_FORCE_SYM,
+    HEADER_FIT_CHISQ,
+    HEADER_TEMP,
 )
 from amro.data import (
     OscillationKey,
@@ -22,6 +32,7 @@ from amro.data import (
 )
 from amro.features.fourier import Fourier
 from amro.models.fitter import AMROFitter
+from amro.utils import build_sine_design_matrix
 
 
 # =============================================================================
@@ -350,6 +361,486 @@ class TestFitActExperiment:
         assert "No Fourier" in captured.out
 
 
+class TestFitExperiments:
+    @pytest.fixture
+    def two_experiment_project(self, sample_project_data_with_fourier):
+        exp = Experiment(
+            experiment_label=HEADER_EXPERIMENT_PREFIX + "12",
+            geometry="para",
+            wire_sep=1.0,
+            cross_section=0.5,
+        )
+        for t in [2.0, 5.0]:
+            key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "12", t, 9.0)
+            angles = np.linspace(0, 360, 361)
+            res = 1e-5 * (1 + 0.02 * t * np.cos(2 * np.deg2rad(angles) + 0.3))
+            exp.add_oscillation(AMROscillation(key, ExperimentalData(key, angles, res)))
+        sample_project_data_with_fourier.add_experiment(exp)
+        Fourier(amro_data=sample_project_data_with_fourier).fourier_transform_experiments()
+        return sample_project_data_with_fourier
+
+    def test_fits_all_experiments_by_default(self, two_experiment_project):
+        fitter = AMROFitter(amro_data=two_experiment_project, min_amp_ratio=0.01)
+        fitter.fit_experiments()
+
+        stats = two_experiment_project.get_summary_statistics()
+        assert stats["n_fits_completed"] == 4
+
+    def test_invalid_label_skipped(self, two_experiment_project, capsys):
+        fitter = AMROFitter(amro_data=two_experiment_project, min_amp_ratio=0.01)
+        fitter.fit_experiments(["not_an_experiment", HEADER_EXPERIMENT_PREFIX + "12"])
+
+        captured = capsys.readouterr()
+        assert "not a valid experiment label" in captured.out
+        stats = two_experiment_project.get_summary_statistics()
+        assert stats["n_fits_completed"] == 2
+
+    def test_partial_load_fits_unloaded_experiment(
+        self, two_experiment_project, capsys
+    ):
+        two_experiment_project.save_project()
+        loaded = ProjectData.load_project(
+            "test_fitter", experiments=[HEADER_EXPERIMENT_PREFIX + "11"]
+        )
+        act_label = HEADER_EXPERIMENT_PREFIX + "12"
+
+        assert len(loaded.filter_oscillations(experiments=act_label)) == 2
+
+        fitter = AMROFitter(amro_data=loaded, min_amp_ratio=0.01)
+        fitter.fit_experiments([act_label])
+
+        captured = capsys.readouterr()
+        assert "not a valid experiment label" not in captured.out
+        oscs = loaded.filter_oscillations(experiments=act_label)
+        assert all(osc.fit_result is not None for osc in oscs)
+
+    def test_fit_results_reload_from_csv(self, two_experiment_project):
+        fitter = AMROFitter(amro_data=two_experiment_project, min_amp_ratio=0.01)
+        fitter.fit_experiments()
+        fits = {
+            osc.key: osc.fit_result
+            for osc in two_experiment_project.filter_oscillations()
+        }
+        for osc in two_experiment_project.filter_oscillations():
+            osc.clear_fit_result()
+
+        two_experiment_project.load_fit_results_from_csv()
+
+        for osc in two_experiment_project.filter_oscillations():
+            fit, loaded = fits[osc.key], osc.fit_result
+            assert loaded.required_refit == fit.required_refit
+            assert loaded.chi_squared == pytest.approx(fit.chi_squared)
+            assert loaded.fitted_params_dict.keys() == fit.fitted_params_dict.keys()
+            for loaded_vals, vals in zip(
+                loaded.get_fitted_params_with_errs(), fit.get_fitted_params_with_errs()
+            ):
+                np.testing.assert_allclose(loaded_vals, vals)
+            np.testing.assert_allclose(loaded.model_res_ohms, fit.model_res_ohms)
+            np.testing.assert_allclose(
+                loaded.model_residuals_ohms, fit.model_residuals_ohms, atol=1e-12
+            )
+
+    def test_parallel_matches_serial(self, two_experiment_project):
+        serial = AMROFitter(amro_data=two_experiment_project, min_amp_ratio=0.01)
+        serial.fit_experiments()
+        serial_params = {
+            osc.key: osc.fit_result.get_fitted_params()
+            for osc in two_experiment_project.filter_oscillations()
+        }
+
+        parallel = AMROFitter(
+            amro_data=two_experiment_project,
+            min_amp_ratio=0.01,
+            if_save_file_exists_overwrite=True,
+            n_jobs=2,
+        )
+        parallel.fit_experiments()
+
+        for osc in two_experiment_project.filter_oscillations():
+            for serial_vals, parallel_vals in zip(
+                serial_params[osc.key], osc.fit_result.get_fitted_params()
+            ):
+                np.testing.assert_allclose(parallel_vals, serial_vals)
+
+
+class TestLeastSquaresSolver:
+    def test_invalid_solver_raises(self, sample_project_data_with_fourier):
+        with pytest.raises(ValueError):
+            AMROFitter(amro_data=sample_project_data_with_fourier, solver="unknown")
+
+    def test_matches_lmfit(self, sample_project_data_with_fourier):
+        lmfit_fitter = AMROFitter(
+            amro_data=sample_project_data_with_fourier, min_amp_ratio=0.01
+        )
+        fast_fitter = AMROFitter(
+            amro_data=sample_project_data_with_fourier,
+            min_amp_ratio=0.01,
+            solver="least_squares",
+        )
+        for osc in sample_project_data_with_fourier.filter_oscillations():
+            lmfit_result, lmfit_refitted = lmfit_fitter._fit_oscillation(osc)
+            fast_result, fast_refitted = fast_fitter._fit_oscillation(osc)
+
+            assert fast_result.success
+            assert fast_refitted == lmfit_refitted
+            assert fast_result.chisqr == pytest.approx(lmfit_result.chisqr, abs=1e-12)
+            for name, param in lmfit_result.params.items():
+                fast_param = fast_result.params[name]
+                if name.startswith(HEADER_PARAM_PHASE_PREFIX):
+                    amp_name = name.replace(
+                        HEADER_PARAM_PHASE_PREFIX, HEADER_PARAM_AMP_PREFIX
+                    )
+                    if lmfit_result.params[amp_name].value < 1e-6:
+                        continue  # Phase of a vanishing component is arbitrary
+                    # Phases only matter modulo 2*pi
+                    diff = np.angle(np.exp(1j * (fast_param.value - param.value)))
+                    assert diff == pytest.approx(0, abs=1e-4)
+                else:
+                    assert fast_param.value == pytest.approx(
+                        param.value, rel=1e-4, abs=1e-8
+                    )
+
+    def test_estimates_covariance_for_noisy_data(self, fitter_instance):
+        key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "11", 2.0, 3.0)
+        angles = np.linspace(0, 360, 361)
+        noise = np.random.default_rng(0).normal(0, 1e-8, len(angles))
+        res = 1e-5 * (1 + 0.1 * np.sin(4 * np.deg2rad(angles) + 0.5)) + noise
+        osc = AMROscillation(key, ExperimentalData(key, angles, res))
+        osc.add_fourier_result(xf=np.array([2, 4]), yf=np.array([0.01, 0.1j]))
+
+        fitter_instance.solver = "least_squares"
+        result, refitted = fitter_instance._fit_oscillation(osc)
+
+        assert refitted is False
+        assert result.covar is not None
+        assert result.params[HEADER_PARAM_AMP_PREFIX + "4"].stderr > 0
+        assert result.params[HEADER_PARAM_AMP_PREFIX + "4"].value == pytest.approx(
+            0.1, rel=1e-3
+        )
+
+    def test_params_within_bounds(self, fitter_instance):
+        fitter_instance.solver = "least_squares"
+        osc = fitter_instance.project_data.filter_oscillations()[0]
+
+        result, _ = fitter_instance._fit_oscillation(osc)
+
+        for param in result.params.values():
+            assert param.min <= param.value <= param.max
+
+    def test_fit_result_built_from_least_squares(
+        self, sample_project_data_with_fourier
+    ):
+        fitter = AMROFitter(
+            amro_data=sample_project_data_with_fourier,
+            min_amp_ratio=0.01,
+            solver="least_squares",
+        )
+        fitter.fit_experiments()
+
+        for osc in sample_project_data_with_fourier.filter_oscillations():
+            assert osc.fit_result.fit_succeeded
+            np.testing.assert_allclose(
+                osc.fit_result.model_res_ohms, osc.osc_data.res_ohms, rtol=1e-6
+            )
+
+
+class TestLinearSolver:
+    @staticmethod
+    def _make_noisy_oscillation(mean=1e-5):
+        key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "11", 2.0, 3.0)
+        angles = np.linspace(0, 360, 361)
+        noise = np.random.default_rng(0).normal(0, 1e-3 * abs(mean), len(angles))
+        rads = np.deg2rad(angles)
+        res = mean * (1 + 0.1 * np.sin(4 * rads + 0.5) + 0.02 * np.sin(2 * rads - 1))
+        osc = AMROscillation(key, ExperimentalData(key, angles, res + noise))
+        osc.add_fourier_result(xf=np.array([2, 4]), yf=np.array([0.02, 0.1j]))
+        return osc
+
+    def test_matches_least_squares(self, fitter_instance):
+        osc = self._make_noisy_oscillation()
+
+        fitter_instance.solver = "least_squares"
+        ls_result, ls_refitted = fitter_instance._fit_oscillation(osc)
+        fitter_instance.solver = "linear"
+        lin_result, lin_refitted = fitter_instance._fit_oscillation(osc)
+
+        assert lin_result.method == "linear"
+        assert lin_refitted is ls_refitted is False
+        assert lin_result.chisqr == pytest.approx(ls_result.chisqr, rel=1e-8)
+        for name, param in ls_result.params.items():
+            lin_param = lin_result.params[name]
+            if name.startswith(HEADER_PARAM_PHASE_PREFIX):
+                diff = np.angle(np.exp(1j * (lin_param.value - param.value)))
+                assert diff == pytest.approx(0, abs=1e-6)
+            else:
+                assert lin_param.value == pytest.approx(param.value, rel=1e-6)
+            if param.vary:
+                assert lin_param.stderr == pytest.approx(param.stderr, rel=1e-3)
+
+    def test_fits_sample_data(self, sample_project_data_with_fourier):
+        fitter = AMROFitter(
+            amro_data=sample_project_data_with_fourier,
+            min_amp_ratio=0.01,
+            solver="linear",
+        )
+        fitter.fit_experiments()
+
+        for osc in sample_project_data_with_fourier.filter_oscillations():
+            assert osc.fit_result.fit_succeeded
+            np.testing.assert_allclose(
+                osc.fit_result.model_res_ohms, osc.osc_data.res_ohms, rtol=1e-6
+            )
+
+    def test_falls_back_when_mean_bound_active(self, fitter_instance):
+        osc = self._make_noisy_oscillation()
+        params, f_list = fitter_instance._initialize_parameters_from_fourier(
+            osc.fourier_result, osc.osc_data.mean_res_ohms
+        )
+        fitter_instance.current_f_list = f_list
+        x = osc.osc_data.angles_rads
+        # A negative signal puts the unconstrained mean below its lower bound of 0
+        y = -osc.osc_data.res_ohms / np.max(np.abs(osc.osc_data.res_ohms))
+
+        assert fitter_instance._minimize_linear(params, x, y) is None
+
+        fitter_instance.solver = "linear"
+        result = fitter_instance._minimize(params, x, y)
+        assert result.method != "linear"
+        assert result.params[HEADER_PARAM_MEAN_PREFIX].value >= 0
+
+    def test_returns_none_when_rank_deficient(self, fitter_instance):
+        fitter_instance.current_f_list = [2, 4]
+        x = np.zeros(10)
+        y = np.ones(10)
+        params = lm.Parameters()
+        params.add(HEADER_PARAM_MEAN_PREFIX, value=1.0, min=0)
+
+        assert fitter_instance._minimize_linear(params, x, y) is None
+
+
+class TestBatchedLinearFit:
+    @staticmethod
+    def _make_oscillations(n, mean=1e-5, angles=None):
+        angles = np.linspace(0, 360, 361) if angles is None else angles
+        rads = np.deg2rad(angles)
+        rng = np.random.default_rng(1)
+        oscillations = []
+        for i in range(n):
+            key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "11", float(i), 3.0)
+            res = mean * (1 + 0.1 * np.sin(4 * rads + i) + 0.02 * np.sin(2 * rads))
+            res = res + rng.normal(0, 1e-3 * abs(mean), len(angles))
+            osc = AMROscillation(key, ExperimentalData(key, angles, res))
+            osc.add_fourier_result(xf=np.array([2, 4]), yf=np.array([0.02, 0.1j]))
+            oscillations.append(osc)
+        return oscillations
+
+    def test_matches_individual_fits(self, fitter_instance):
+        fitter_instance.solver = "linear"
+        oscillations = self._make_oscillations(5)
+
+        batched = fitter_instance._fit_oscillations(oscillations)
+        individual = fitter_instance._fit_oscillations_individually(oscillations)
+
+        for (b_result, b_refitted), (i_result, i_refitted) in zip(batched, individual):
+            assert b_refitted == i_refitted
+            assert b_result.chisqr == pytest.approx(i_result.chisqr, rel=1e-9)
+            for name, param in i_result.params.items():
+                assert b_result.params[name].value == pytest.approx(
+                    param.value, rel=1e-9
+                )
+                if param.vary:
+                    assert b_result.params[name].stderr == pytest.approx(
+                        param.stderr, rel=1e-7
+                    )
+
+    def test_design_matrix_built_once_per_group(self, fitter_instance):
+        fitter_instance.solver = "linear"
+        oscillations = self._make_oscillations(4) + self._make_oscillations(
+            3, angles=np.linspace(0, 360, 181)
+        )
+
+        with patch(
+            "amro.models.fitter.u.build_sine_design_matrix",
+            wraps=build_sine_design_matrix,
+        ) as mock_design:
+            results = fitter_instance._fit_oscillations(oscillations)
+
+        assert mock_design.call_count == 2
+        assert len(results) == 7
+        assert all(result.method == "linear" for result, _ in results)
+
+    def test_out_of_bounds_oscillation_fitted_individually(self, fitter_instance):
+        fitter_instance.solver = "linear"
+        oscillations = self._make_oscillations(2) + self._make_oscillations(
+            1, mean=2e-5
+        )
+        initialize = fitter_instance._initialize_parameters_from_fourier
+
+        def initialize_with_tight_mean(fourier_result, mean_res):
+            params, f_list = initialize(fourier_result, mean_res)
+            if mean_res > 1.5e-5:
+                # Normalized mean is ~0.9, so this bound is active
+                params[HEADER_PARAM_MEAN_PREFIX].set(max=0.5)
+            return params, f_list
+
+        with patch.object(
+            fitter_instance,
+            "_initialize_parameters_from_fourier",
+            side_effect=initialize_with_tight_mean,
+        ):
+            results = fitter_instance._fit_oscillations(oscillations)
+
+        assert [result.method for result, _ in results[:2]] == ["linear", "linear"]
+        assert results[2][0].method != "linear"
+        max_res = np.abs(oscillations[2].osc_data.res_ohms).max()
+        assert results[2][0].params[HEADER_PARAM_MEAN_PREFIX].value <= 0.5 * max_res
+
+
+# =============================================================================
+# Warm Start Tests
+# =============================================================================
+
+
+class TestWarmStart:
+    @pytest.fixture
+    def temperature_sweep_project(self):
+        """Project with two field sweeps whose phases drift slowly with temperature."""
+        project = ProjectData(project_name="test_fitter")
+        exp = Experiment(
+            experiment_label=HEADER_EXPERIMENT_PREFIX + "11",
+            geometry="perp",
+            wire_sep=1.0,
+            cross_section=0.5,
+        )
+        angles = np.linspace(0, 360, 361)
+        rads = np.deg2rad(angles)
+        rng = np.random.default_rng(0)
+        for h, phase in [(3.0, 2.5), (9.0, -1.0)]:
+            for t in [2.0, 5.0, 10.0, 15.0, 20.0, 30.0]:
+                key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "11", t, h)
+                res = 1e-5 * (
+                    1
+                    + 0.1 * (1 - t / 60) * np.sin(4 * rads + phase + 0.02 * t)
+                    + 0.04 * np.sin(2 * rads - phase)
+                    + rng.normal(0, 1e-3, angles.size)
+                )
+                exp.add_oscillation(AMROscillation(key, ExperimentalData(key, angles, res)))
+        project.add_experiment(exp)
+        Fourier(amro_data=project, verbose=False).fourier_transform_experiments()
+        return project
+
+    def _oscillations(self, project):
+        exp = project.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        return list(exp.oscillations_dict.values())
+
+    def test_invalid_warm_start_raises(self, sample_project_data_with_fourier):
+        with pytest.raises(ValueError):
+            AMROFitter(amro_data=sample_project_data_with_fourier, warm_start="angle")
+
+    def test_matches_cold_start(self, temperature_sweep_project):
+        oscillations = self._oscillations(temperature_sweep_project)[::-1]
+        results = {}
+        for warm_start in [None, "temperature"]:
+            fitter = AMROFitter(
+                amro_data=temperature_sweep_project,
+                min_amp_ratio=0.01,
+                max_freq=10,
+                solver="least_squares",
+                warm_start=warm_start,
+            )
+            results[warm_start] = fitter._fit_oscillations(oscillations)
+
+        for (cold, _), (warm, _) in zip(results[None], results["temperature"]):
+            assert warm.params.keys() == cold.params.keys()
+            assert warm.chisqr == pytest.approx(cold.chisqr, rel=1e-6, abs=1e-12)
+            for name in cold.params:
+                if name.startswith(HEADER_PARAM_PHASE_PREFIX):
+                    diff = warm.params[name].value - cold.params[name].value
+                    assert np.angle(np.exp(1j * diff)) == pytest.approx(0, abs=1e-3)
+                else:
+                    assert warm.params[name].value == pytest.approx(
+                        cold.params[name].value, rel=1e-3, abs=1e-6
+                    )
+
+    def test_reduces_function_evaluations(self, temperature_sweep_project):
+        oscillations = self._oscillations(temperature_sweep_project)
+        nfev = {}
+        for warm_start in [None, "temperature"]:
+            fitter = AMROFitter(
+                amro_data=temperature_sweep_project,
+                min_amp_ratio=0.01,
+                max_freq=10,
+                solver="least_squares",
+                warm_start=warm_start,
+            )
+            nfev[warm_start] = sum(
+                result.nfev for result, _ in fitter._fit_oscillations(oscillations)
+            )
+
+        assert nfev["temperature"] < nfev[None]
+
+    def test_seeds_from_previous_fit_in_sweep(self, temperature_sweep_project):
+        fitter = AMROFitter(
+            amro_data=temperature_sweep_project,
+            min_amp_ratio=0.01,
+            max_freq=10,
+            warm_start="temperature",
+        )
+        oscillations = self._oscillations(temperature_sweep_project)
+
+        with patch.object(
+            AMROFitter,
+            "_fit_oscillation",
+            autospec=True,
+            side_effect=AMROFitter._fit_oscillation,
+        ) as mock_fit:
+            fitter._fit_oscillations(oscillations)
+
+        seeded = {call.args[1].key: call.args[2] for call in mock_fit.call_args_list}
+        for h in [3.0, 9.0]:
+            sweep = sorted(
+                (osc for osc in oscillations if osc.key.magnetic_field == h),
+                key=lambda osc: osc.key.temperature,
+            )
+            assert seeded[sweep[0].key] is None
+            assert all(seeded[osc.key] is not None for osc in sweep[1:])
+
+    def test_seed_phases_wrapped_inside_bounds(
+        self, fitter_instance, sample_fourier_result
+    ):
+        params, f_list = fitter_instance._initialize_parameters_from_fourier(
+            sample_fourier_result, 1e-5
+        )
+        fitter_instance.current_f_list = f_list
+        seed_params = params.copy()
+        phase_name = HEADER_PARAM_PHASE_PREFIX + str(f_list[0])
+        seed_params[phase_name].set(value=2 * np.pi - 0.1, min=-np.inf, max=np.inf)
+
+        fitter_instance._seed_parameters(params, seed_params, 0.9)
+
+        assert params[phase_name].value == pytest.approx(-0.1)
+        assert params[HEADER_PARAM_MEAN_PREFIX].value == pytest.approx(0.9)
+
+    def test_parallel_matches_serial(self, temperature_sweep_project):
+        oscillations = self._oscillations(temperature_sweep_project)
+        results = {}
+        for n_jobs in [1, 2]:
+            fitter = AMROFitter(
+                amro_data=temperature_sweep_project,
+                min_amp_ratio=0.01,
+                max_freq=10,
+                n_jobs=n_jobs,
+                warm_start="temperature",
+            )
+            results[n_jobs] = fitter._fit_oscillations(oscillations)
+
+        for (serial, _), (parallel, _) in zip(results[1], results[2]):
+            for name in serial.params:
+                assert parallel.params[name].value == pytest.approx(
+                    serial.params[name].value
+                )
+
+
 # =============================================================================
 # Failed Fits Tracking Tests
 # =============================================================================
@@ -369,6 +860,206 @@ class TestFailedFitsTracking:
         assert isinstance(fitter_instance.failed_fits, list)
 
 
+# =============================================================================
+# Fit Cache Tests
+# =============================================================================
+
+
+class TestFitCache:
+    def _fit_all(self, project, **kwargs):
+        fitter = AMROFitter(
+            amro_data=project,
+            min_amp_ratio=kwargs.pop("min_amp_ratio", 0.01),
+            max_freq=10,
+            fit_cache=True,
+            **kwargs,
+        )
+        oscillations = project.filter_oscillations()
+        return fitter, fitter._fit_oscillations(oscillations)
+
+    def test_disabled_by_default(self, fitter_instance, tmp_path):
+        fitter_instance.fit_experiments()
+        assert fitter_instance.fit_cache_dir is None
+        assert not (tmp_path / FIT_CACHE_DIR_NAME).exists()
+
+    def test_cache_written_under_final_data_path(
+        self, sample_project_data_with_fourier, tmp_path
+    ):
+        fitter, _ = self._fit_all(sample_project_data_with_fourier)
+        assert fitter.fit_cache_dir == tmp_path / FIT_CACHE_DIR_NAME
+        # Both oscillations hold the same data, so they share one entry
+        assert len(list(fitter.fit_cache_dir.glob("*.npz"))) == 1
+
+    def test_cached_fit_matches_original(self, sample_project_data_with_fourier):
+        _, fits = self._fit_all(sample_project_data_with_fourier)
+
+        with patch.object(AMROFitter, "_minimize") as mock_minimize:
+            _, cached_fits = self._fit_all(sample_project_data_with_fourier)
+
+        mock_minimize.assert_not_called()
+        for (fit, refitted), (cached, cached_refitted) in zip(fits, cached_fits):
+            assert cached_refitted == refitted
+            assert cached.success == fit.success
+            assert cached.chisqr == fit.chisqr
+            assert cached.nfev == fit.nfev
+            np.testing.assert_array_equal(cached.residual, fit.residual)
+            np.testing.assert_array_equal(cached.covar, fit.covar)
+            for name, param in fit.params.items():
+                assert cached.params[name].value == param.value
+                assert cached.params[name].stderr == param.stderr
+                assert cached.params[name].vary == param.vary
+
+    def test_unchanged_frequency_set_reuses_fit(
+        self, sample_project_data_with_fourier
+    ):
+        self._fit_all(sample_project_data_with_fourier, min_amp_ratio=0.02)
+
+        with patch.object(AMROFitter, "_minimize") as mock_minimize:
+            self._fit_all(sample_project_data_with_fourier, min_amp_ratio=0.3)
+
+        mock_minimize.assert_not_called()
+
+    def test_changed_configuration_refits(self, sample_project_data_with_fourier):
+        fitter, _ = self._fit_all(sample_project_data_with_fourier)
+
+        # Drops the small leakage peak at f=5 from the frequency set
+        self._fit_all(sample_project_data_with_fourier, min_amp_ratio=0.02)
+        self._fit_all(sample_project_data_with_fourier, solver="least_squares")
+
+        assert len(list(fitter.fit_cache_dir.glob("*.npz"))) == 3
+
+    def test_fit_experiments_with_cached_fits(self, sample_project_data_with_fourier):
+        fitter = AMROFitter(
+            amro_data=sample_project_data_with_fourier,
+            min_amp_ratio=0.01,
+            max_freq=10,
+            if_save_file_exists_overwrite=True,
+            fit_cache=True,
+        )
+        fitter.fit_experiments()
+        fits = {
+            osc.key: osc.fit_result.get_fitted_params_with_errs()
+            for osc in sample_project_data_with_fourier.filter_oscillations()
+        }
+
+        fitter.fit_experiments()
+
+        for osc in sample_project_data_with_fourier.filter_oscillations():
+            for cached_vals, vals in zip(
+                osc.fit_result.get_fitted_params_with_errs(), fits[osc.key]
+            ):
+                np.testing.assert_array_equal(cached_vals, vals)
+
+    def test_unreadable_entry_refitted(self, sample_project_data_with_fourier, capsys):
+        fitter, _ = self._fit_all(sample_project_data_with_fourier)
+        for fp in fitter.fit_cache_dir.glob("*.npz"):
+            fp.write_bytes(b"not an npz file")
+
+        _, fits = self._fit_all(sample_project_data_with_fourier)
+
+        assert "Could not read cached fit" in capsys.readouterr().out
+        assert all(fit.success for fit, _ in fits)
+
+    def test_clear_fit_cache(self, sample_project_data_with_fourier):
+        fitter, _ = self._fit_all(sample_project_data_with_fourier)
+        fitter.clear_fit_cache()
+        assert not fitter.fit_cache_dir.exists()
+
+
+# =============================================================================
+# Filter Sweep Tests
+# =============================================================================
+
+
+class TestFilterSweep:
+    # min_amp_ratio=0.01 keeps a small leakage peak at f=5 that 0.02 and 0.3 drop
+    FILTER_GRID = [(0.02, 10, False), (0.3, 10, False), (0.01, 10, False)]
+
+    @pytest.fixture
+    def sweep_fitter(self, sample_project_data_with_fourier):
+        return AMROFitter(amro_data=sample_project_data_with_fourier)
+
+    def test_identical_frequency_sets_fitted_once(self, sweep_fitter):
+        with patch.object(
+            AMROFitter,
+            "_fit_oscillation",
+            autospec=True,
+            side_effect=AMROFitter._fit_oscillation,
+        ) as mock_fit:
+            sweep_fitter.fit_filter_sweep(self.FILTER_GRID, save=False)
+
+        # Two oscillations, two distinct frequency sets
+        assert mock_fit.call_count == 4
+
+    def test_one_row_per_setting_and_oscillation(self, sweep_fitter):
+        df = sweep_fitter.fit_filter_sweep(self.FILTER_GRID, save=False)
+
+        assert len(df) == len(self.FILTER_GRID) * 2
+        assert list(df.columns[:3]) == [
+            HEADER_FIT_MIN_AMP_RATIO,
+            HEADER_FIT_MAX_FREQ,
+            HEADER_FIT_FORCE_SYM,
+        ]
+        assert sorted(set(df[HEADER_FIT_MIN_AMP_RATIO])) == [0.01, 0.02, 0.3]
+        shared = df[df[HEADER_FIT_MIN_AMP_RATIO] == 0.02].reset_index(drop=True)
+        reused = df[df[HEADER_FIT_MIN_AMP_RATIO] == 0.3].reset_index(drop=True)
+        pd.testing.assert_frame_equal(shared.iloc[:, 3:], reused.iloc[:, 3:])
+
+    def test_matches_fit_experiments(self, sample_project_data_with_fourier):
+        sweep_fitter = AMROFitter(amro_data=sample_project_data_with_fourier)
+        df = sweep_fitter.fit_filter_sweep([(0.01, 10, True)], save=False)
+
+        fitter = AMROFitter(
+            amro_data=sample_project_data_with_fourier,
+            min_amp_ratio=0.01,
+            max_freq=10,
+            force_four_and_two_sym=True,
+        )
+        fitter.fit_experiments()
+
+        for osc in sample_project_data_with_fourier.filter_oscillations():
+            row = df[df[HEADER_TEMP] == osc.key.temperature].iloc[0]
+            assert row[HEADER_FIT_CHISQ] == pytest.approx(osc.fit_result.chi_squared)
+
+    @pytest.mark.parametrize("warm_start", [None, "temperature"])
+    def test_parallel_matches_serial_in_one_pool(
+        self, sample_project_data_with_fourier, warm_start
+    ):
+        serial = AMROFitter(
+            amro_data=sample_project_data_with_fourier, warm_start=warm_start
+        )
+        serial_df = serial.fit_filter_sweep(self.FILTER_GRID, save=False)
+
+        parallel = AMROFitter(
+            amro_data=sample_project_data_with_fourier,
+            warm_start=warm_start,
+            n_jobs=2,
+        )
+        with patch(
+            "amro.models.fitter.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as mock_pool:
+            parallel_df = parallel.fit_filter_sweep(self.FILTER_GRID, save=False)
+
+        assert mock_pool.call_count == 1
+        pd.testing.assert_frame_equal(parallel_df, serial_df)
+
+    def test_leaves_project_fits_unchanged(self, sweep_fitter, tmp_path):
+        df = sweep_fitter.fit_filter_sweep(self.FILTER_GRID)
+
+        for osc in sweep_fitter.project_data.filter_oscillations():
+            assert osc.fit_result is None
+        saved = pd.read_csv(tmp_path / ("test_fitter" + FIT_SWEEP_FN_SUFFIX))
+        assert len(saved) == len(df)
+
+    def test_invalid_label_skipped(self, sweep_fitter, capsys):
+        df = sweep_fitter.fit_filter_sweep(
+            self.FILTER_GRID, act_labels=["not_an_experiment"], save=False
+        )
+
+        assert "not a valid experiment label" in capsys.readouterr().out
+        assert df.empty
+
+
 # =============================================================================
 # Refit Tests
 # =============================================================================
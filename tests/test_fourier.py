@@ -168,6 +168,96 @@ class TestFourierTransformExperiments:
         stats_after = sample_project_data_with_oscillations.get_summary_statistics()
         assert stats_after["n_fourier_completed"] == stats_after["n_oscillations"]
 
+    def test_batched_matches_unbatched(self, sample_project_data_with_oscillations):
+        exp = sample_project_data_with_oscillations.get_experiment(
+            HEADER_EXPERIMENT_PREFIX + "11"
+        )
+        # Add an oscillation with a different number of angle points
+        key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "11", 9.0, 3.0)
+        angles = np.linspace(0, 360, 181)
+        res = 1e-5 * (1 + 0.1 * np.cos(2 * np.deg2rad(angles)))
+        exp.add_oscillation(AMROscillation(key, ExperimentalData(key, angles, res)))
+
+        batched = Fourier(sample_project_data_with_oscillations, batched=True)
+        batched.fourier_transform_experiments()
+        batched_results = {
+            key: osc.fourier_result for key, osc in exp.oscillations_dict.items()
+        }
+
+        unbatched = Fourier(
+            sample_project_data_with_oscillations,
+            overwrite_result=True,
+            batched=False,
+        )
+        unbatched.fourier_transform_experiments()
+
+        for key, osc in exp.oscillations_dict.items():
+            np.testing.assert_array_equal(osc.fourier_result.xf, batched_results[key].xf)
+            np.testing.assert_array_equal(osc.fourier_result.yf, batched_results[key].yf)
+        assert len(exp.get_oscillation(9.0, 3.0).fourier_result.xf) == 90
+
+
+# =============================================================================
+# Non-uniform DFT Tests
+# =============================================================================
+
+
+class TestNonUniformDFT:
+    def _make_uneven_data(self, t=2.0):
+        """Oscillation with uneven angle steps and dropped angles."""
+        key = OscillationKey(HEADER_EXPERIMENT_PREFIX + "11", t, 3.0)
+        steps = np.tile([8.19, 8.2, 8.14, 8.27], 11)
+        angles = np.concatenate(([0.0], np.cumsum(steps)))
+        angles = np.delete(angles[angles < 360], [7, 8, 30])
+        rads = np.deg2rad(angles)
+        res = 1e-5 * (1 + 0.1 * np.sin(4 * rads + 0.3) + 0.05 * np.sin(2 * rads + 1.0))
+        return ExperimentalData(key, angles, res)
+
+    def test_invalid_method(self, sample_project_data_with_oscillations):
+        with pytest.raises(ValueError):
+            Fourier(sample_project_data_with_oscillations, method="dft")
+
+    def test_recovers_amplitudes_and_phases_on_uneven_grid(
+        self, sample_project_data_with_oscillations
+    ):
+        fourier = Fourier(sample_project_data_with_oscillations, method="nudft")
+        data = self._make_uneven_data()
+
+        xf, yf = fourier._perform_nudft(data)
+        result = FourierResult(data.experiment_key, xf, yf)
+
+        np.testing.assert_allclose(result.get_fit_guess(2)[0], 0.5)
+        # exp(-i f theta) gives sin(f theta + phase) a phase of phase - pi/2
+        np.testing.assert_allclose(np.angle(yf[[1, 3]]), np.array([1.0, 0.3]) - np.pi / 2)
+        assert len(xf) == len(data.angles_degs) // 2
+
+    def test_batched_matches_unbatched(self, sample_project_data_with_oscillations):
+        exp = sample_project_data_with_oscillations.get_experiment(
+            HEADER_EXPERIMENT_PREFIX + "11"
+        )
+        data = self._make_uneven_data(t=9.0)
+        exp.add_oscillation(AMROscillation(data.experiment_key, data))
+
+        Fourier(sample_project_data_with_oscillations, method="nudft").fourier_transform_experiments()
+        batched_results = {
+            key: osc.fourier_result for key, osc in exp.oscillations_dict.items()
+        }
+        Fourier(
+            sample_project_data_with_oscillations,
+            overwrite_result=True,
+            batched=False,
+            method="nudft",
+        ).fourier_transform_experiments()
+
+        for key, osc in exp.oscillations_dict.items():
+            np.testing.assert_array_equal(osc.fourier_result.xf, batched_results[key].xf)
+            np.testing.assert_allclose(
+                osc.fourier_result.yf, batched_results[key].yf, atol=1e-15
+            )
+        assert exp.get_oscillation(2.0, 3.0).fourier_result.xf[
+            np.argmax(exp.get_oscillation(2.0, 3.0).fourier_result.amplitudes)
+        ] == 4
+
 
 # =============================================================================
 # Get N Strongest Results Tests
@@ -1,6 +1,8 @@
 """Tests for amro.data.loader module."""
 
 import pytest
+import pickle
+import shutil
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -19,9 +21,11 @@ from amro.config import (
     HEADER_MAGNET_RAW_OE_ABS,
     HEADER_CROSS_SECTION,
     CLEANER_SAVE_FN_SUFFIX,
+    PROJECT_STORE_DIR_SUFFIX,
 )
 from amro.data.loader import AMROLoader
 from amro.data.data_structures import ProjectData
+from amro.features.fourier import Fourier
 
 
 # =============================================================================
@@ -54,6 +58,35 @@ def sample_csv_data():
     )
 
 
+def write_processed_file(folder, label, temperatures=(2.0, 5.0), res_scale=1.0):
+    """Write a cleaned AMRO file, as saved by the cleaner, for one experiment."""
+    n_points = 37
+    angles = np.linspace(0, 360, n_points)
+    dfs = []
+    for t in temperatures:
+        res = 1e-5 * (1 + 0.1 * np.sin(4 * np.deg2rad(angles)))
+        if t == temperatures[-1]:
+            res = res * res_scale
+        dfs.append(
+            pd.DataFrame(
+                {
+                    HEADER_TEMP: t,
+                    HEADER_MAGNET: 3.0,
+                    HEADER_ANGLE_DEG: angles,
+                    HEADER_TEMP_RAW: t,
+                    HEADER_RES_OHM: res,
+                    HEADER_EXP_LABEL: label,
+                    HEADER_GEO: "perp",
+                    HEADER_CROSS_SECTION: 0.5,
+                    HEADER_WIRE_SEP: 0.1,
+                }
+            )
+        )
+    fp = folder / (label + CLEANER_SAVE_FN_SUFFIX)
+    pd.concat(dfs).to_csv(fp, index=False)
+    return fp
+
+
 # =============================================================================
 # AMROLoader Initialization Tests
 # =============================================================================
@@ -146,15 +179,31 @@ class TestGetAmroData:
 
 
 class TestLoadAmroIntegration:
+    @patch.object(ProjectData, "check_for_project_store", return_value=False)
     @patch.object(Path, "is_file")
     @patch.object(ProjectData, "load_project_from_pickle")
-    def test_load_from_pickle_when_exists(self, mock_load, mock_is_file, loader):
+    def test_load_from_pickle_when_exists(
+        self, mock_load, mock_is_file, mock_store, loader
+    ):
         """Test that existing pickle file is loaded."""
         mock_is_file.return_value = True
 
         loader.load_amro()
 
         mock_load.assert_called_once()
+        mock_load.return_value.save_project.assert_called_once()
+
+    @patch.object(ProjectData, "check_for_project_store", return_value=True)
+    @patch.object(ProjectData, "load_project_from_pickle")
+    @patch.object(ProjectData, "load_project")
+    def test_load_from_store_before_pickle(
+        self, mock_load, mock_load_pickle, mock_store, loader
+    ):
+        """Test that an existing project store is preferred over a pickle file."""
+        loader.load_amro(update=False)
+
+        mock_load.assert_called_once_with(loader.project_name)
+        mock_load_pickle.assert_not_called()
 
     @patch.object(Path, "is_file")
     @patch.object(AMROLoader, "_run_amro_etl")
@@ -180,3 +229,166 @@ class TestDataStructureCreation:
         stats = loader.project_data.get_summary_statistics()
         assert stats["n_experiments"] == 0
         assert stats["n_oscillations"] == 0
+
+
+# =============================================================================
+# Incremental ETL Tests
+# =============================================================================
+
+
+class TestIncrementalETL:
+    def _load_with_fourier(self):
+        """Load the project and give every oscillation a Fourier result."""
+        project = AMROLoader(project_name="test_project").load_amro()
+        Fourier(project).fourier_transform_experiments()
+        return project
+
+    def test_etl_records_source_files(self, tmp_path):
+        write_processed_file(tmp_path, HEADER_EXPERIMENT_PREFIX + "11")
+        project = AMROLoader(project_name="test_project").load_amro()
+
+        entry = project.source_files[HEADER_EXPERIMENT_PREFIX + "11" + CLEANER_SAVE_FN_SUFFIX]
+        assert entry["experiment_label"] == HEADER_EXPERIMENT_PREFIX + "11"
+        assert "sha256" in entry
+
+    def test_new_file_merged_into_cache(self, tmp_path):
+        write_processed_file(tmp_path, HEADER_EXPERIMENT_PREFIX + "11")
+        self._load_with_fourier()
+
+        write_processed_file(tmp_path, HEADER_EXPERIMENT_PREFIX + "12")
+        project = AMROLoader(project_name="test_project").load_amro()
+
+        assert project.get_summary_statistics()["n_experiments"] == 2
+        old_exp = project.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        new_exp = project.get_experiment(HEADER_EXPERIMENT_PREFIX + "12")
+        assert all(o.fourier_result is not None for o in old_exp.oscillations_dict.values())
+        assert all(o.fourier_result is None for o in new_exp.oscillations_dict.values())
+
+    def test_changed_file_keeps_unchanged_oscillations(self, tmp_path):
+        label = HEADER_EXPERIMENT_PREFIX + "11"
+        write_processed_file(tmp_path, label)
+        self._load_with_fourier()
+
+        # Only the 5 K oscillation changes
+        write_processed_file(tmp_path, label, res_scale=1.1)
+        project = AMROLoader(project_name="test_project").load_amro()
+
+        exp = project.get_experiment(label)
+        assert exp.get_oscillation(t=2.0, h=3.0).fourier_result is not None
+        assert exp.get_oscillation(t=5.0, h=3.0).fourier_result is None
+        np.testing.assert_allclose(
+            exp.get_oscillation(t=5.0, h=3.0).osc_data.mean_res_ohms, 1.1e-5
+        )
+
+    def test_changed_file_drops_missing_oscillations(self, tmp_path):
+        label = HEADER_EXPERIMENT_PREFIX + "11"
+        write_processed_file(tmp_path, label)
+        AMROLoader(project_name="test_project").load_amro()
+
+        write_processed_file(tmp_path, label, temperatures=(2.0,))
+        project = AMROLoader(project_name="test_project").load_amro()
+
+        assert project.get_summary_statistics()["n_oscillations"] == 1
+
+    def test_removed_file_drops_experiment(self, tmp_path):
+        write_processed_file(tmp_path, HEADER_EXPERIMENT_PREFIX + "11")
+        fp = write_processed_file(tmp_path, HEADER_EXPERIMENT_PREFIX + "12")
+        AMROLoader(project_name="test_project").load_amro()
+
+        fp.unlink()
+        project = AMROLoader(project_name="test_project").load_amro()
+
+        assert project.get_experiment_labels() == [HEADER_EXPERIMENT_PREFIX + "11"]
+        assert fp.name not in project.source_files
+
+    def test_unchanged_files_not_reread(self, tmp_path):
+        write_processed_file(tmp_path, HEADER_EXPERIMENT_PREFIX + "11")
+        AMROLoader(project_name="test_project").load_amro()
+
+        with patch.object(AMROLoader, "_read_experiment_file") as mock_read:
+            AMROLoader(project_name="test_project").load_amro()
+
+        mock_read.assert_not_called()
+
+    def test_load_from_combined_csv_without_store(self, tmp_path):
+        write_processed_file(tmp_path, HEADER_EXPERIMENT_PREFIX + "11")
+        AMROLoader(project_name="test_project").load_amro()
+        shutil.rmtree(tmp_path / ("test_project" + PROJECT_STORE_DIR_SUFFIX))
+
+        with patch.object(AMROLoader, "_run_amro_etl") as mock_etl:
+            project = AMROLoader(project_name="test_project").load_amro(update=False)
+
+        mock_etl.assert_not_called()
+        exp = project.get_experiment(HEADER_EXPERIMENT_PREFIX + "11")
+        assert exp.wire_sep == 0.1 and exp.cross_section == 0.5
+        assert project.get_summary_statistics()["n_oscillations"] == 2
+        assert project.check_for_project_store()
+
+    def test_combined_csv_restore_does_not_reread_files(self, tmp_path):
+        label = HEADER_EXPERIMENT_PREFIX + "11"
+        write_processed_file(tmp_path, label)
+        AMROLoader(project_name="test_project").load_amro()
+        shutil.rmtree(tmp_path / ("test_project" + PROJECT_STORE_DIR_SUFFIX))
+
+        with patch.object(AMROLoader, "_read_experiment_file") as mock_read, patch.object(
+            ProjectData, "save_project", autospec=True
+        ) as mock_save:
+            project = AMROLoader(project_name="test_project").load_amro()
+
+        mock_read.assert_not_called()
+        mock_save.assert_called_once()
+        assert label + CLEANER_SAVE_FN_SUFFIX in project.source_files
+
+    def test_combined_csv_restore_merges_changed_file(self, tmp_path):
+        label = HEADER_EXPERIMENT_PREFIX + "11"
+        write_processed_file(tmp_path, label)
+        AMROLoader(project_name="test_project").load_amro()
+        shutil.rmtree(tmp_path / ("test_project" + PROJECT_STORE_DIR_SUFFIX))
+
+        write_processed_file(tmp_path, label, res_scale=1.1)
+        with patch.object(ProjectData, "save_project", autospec=True) as mock_save:
+            project = AMROLoader(project_name="test_project").load_amro()
+
+        mock_save.assert_called_once()
+        np.testing.assert_allclose(
+            project.get_experiment(label).get_oscillation(t=5.0, h=3.0).osc_data.mean_res_ohms,
+            1.1e-5,
+        )
+
+    def test_combined_csv_without_sources_skips_update(self, tmp_path, capsys):
+        write_processed_file(tmp_path, HEADER_EXPERIMENT_PREFIX + "11")
+        AMROLoader(project_name="test_project").load_amro()
+        shutil.rmtree(tmp_path / ("test_project" + PROJECT_STORE_DIR_SUFFIX))
+        (tmp_path / "test_project_amro_combined_sources.json").unlink()
+
+        with patch.object(AMROLoader, "_read_experiment_file") as mock_read:
+            project = AMROLoader(project_name="test_project").load_amro()
+
+        mock_read.assert_not_called()
+        assert "No source files recorded" in capsys.readouterr().out
+        assert project.get_summary_statistics()["n_oscillations"] == 2
+
+    def test_import_old_pickle_without_update(self, tmp_path):
+        label = HEADER_EXPERIMENT_PREFIX + "11"
+        write_processed_file(tmp_path, label)
+        project = AMROLoader(project_name="test_project").load_amro()
+        shutil.rmtree(tmp_path / ("test_project" + PROJECT_STORE_DIR_SUFFIX))
+        # Pickles written before source files were recorded lack the attribute
+        del project.source_files
+        with open(project.pickle_fp, "wb") as f:
+            pickle.dump(project, f)
+
+        project = AMROLoader(project_name="test_project").load_amro(update=False)
+
+        assert project.source_files == {}
+        assert project.get_summary_statistics()["n_oscillations"] == 2
+        assert project.check_for_project_store()
+
+    def test_update_disabled(self, tmp_path):
+        write_processed_file(tmp_path, HEADER_EXPERIMENT_PREFIX + "11")
+        AMROLoader(project_name="test_project").load_amro()
+
+        write_processed_file(tmp_path, HEADER_EXPERIMENT_PREFIX + "12")
+        project = AMROLoader(project_name="test_project").load_amro(update=False)
+
+        assert project.get_summary_statistics()["n_experiments"] == 1
@@ -14,14 +14,24 @@ from amro.config import (
     HEADER_EXP_LABEL,
     HEADER_TEMP,
     HEADER_MAGNET,
+    SINE_BASIS_CACHE_SIZE,
 )
+from amro.utils import utils as u
 from amro.utils import (
     sine_builder,
+    sine_builder_jacobian,
+    build_sine_design_matrix,
+    get_sine_basis,
+    get_periodic_quadrature_weights,
+    build_nudft_matrix,
     query_dataframe,
     build_query_string,
+    build_query_mask,
     convert_params_to_ndarrays,
     calculate_model_resistivities,
     format_oscillation_key,
+    get_file_signature,
+    get_arrays_hash,
 )
 
 
@@ -108,6 +118,148 @@ class TestSineBuilder:
         # All points should have same value for 4-fold symmetry
         np.testing.assert_array_almost_equal(result, np.full(4, mean))
 
+    def test_matches_direct_evaluation(self):
+        x = np.linspace(0, 2 * np.pi, 361)
+        amps = np.array([0.1, 0.05, 0.01])
+        freqs = np.array([2, 4, 6])
+        phases = np.array([0.4, -1.2, 2.5])
+
+        expected = 1.3 * (1 + np.sum(amps[:, None] * np.sin(freqs[:, None] * x + phases[:, None]), axis=0))
+        np.testing.assert_allclose(sine_builder(x, amps, freqs, phases, 1.3), expected)
+
+
+# =============================================================================
+# get_sine_basis Tests
+# =============================================================================
+
+
+class TestGetSineBasis:
+    def test_values(self):
+        x = np.linspace(0, 2 * np.pi, 50)
+        sines, cosines = get_sine_basis(x, np.array([2, 4]))
+
+        np.testing.assert_allclose(sines, np.sin(np.outer([2, 4], x)))
+        np.testing.assert_allclose(cosines, np.cos(np.outer([2, 4], x)))
+
+    def test_shared_grid_reuses_tables(self):
+        u._get_cached_sine_basis.cache_clear()
+        x = np.linspace(0, 2 * np.pi, 50)
+
+        first = get_sine_basis(x, np.array([2, 4]))
+        second = get_sine_basis(x.copy(), [2.0, 4.0])
+
+        assert first[0] is second[0]
+        assert u._get_cached_sine_basis.cache_info().hits == 1
+
+    def test_tables_are_read_only(self):
+        sines, _ = get_sine_basis(np.linspace(0, 2 * np.pi, 50), np.array([2]))
+        with pytest.raises(ValueError):
+            sines[0, 0] = 1.0
+
+    def test_cache_size(self):
+        assert u._get_cached_sine_basis.cache_info().maxsize == SINE_BASIS_CACHE_SIZE
+
+
+# =============================================================================
+# sine_builder_jacobian Tests
+# =============================================================================
+
+
+class TestSineBuilderJacobian:
+    def test_output_shape(self):
+        x = np.linspace(0, 2 * np.pi, 361)
+        jac = sine_builder_jacobian(
+            x, np.array([0.1, 0.05]), np.array([4, 2]), np.array([0.3, 1.0]), 1.5
+        )
+        assert jac.shape == (361, 5)
+
+    def test_matches_finite_differences(self):
+        x = np.linspace(0, 2 * np.pi, 50)
+        freqs = np.array([2.0, 4.0, 6.0])
+        p = np.array([1.3, 0.1, 0.05, 0.02, 0.4, -1.2, 2.5])
+
+        def model(p):
+            return sine_builder(x, p[1:4], freqs, p[4:], p[0])
+
+        jac = sine_builder_jacobian(x, p[1:4], freqs, p[4:], p[0])
+
+        step = 1e-7
+        for i in range(len(p)):
+            dp = np.zeros_like(p)
+            dp[i] = step
+            numeric = (model(p + dp) - model(p - dp)) / (2 * step)
+            np.testing.assert_allclose(jac[:, i], numeric, atol=1e-7)
+
+
+# =============================================================================
+# build_sine_design_matrix Tests
+# =============================================================================
+
+
+class TestBuildSineDesignMatrix:
+    def test_output_shape(self):
+        x = np.linspace(0, 2 * np.pi, 361)
+        design = build_sine_design_matrix(x, np.array([2, 4, 6]))
+        assert design.shape == (361, 7)
+
+    def test_reproduces_sine_builder(self):
+        x = np.linspace(0, 2 * np.pi, 100)
+        freqs = np.array([2.0, 4.0])
+        amps = np.array([0.1, 0.05])
+        phases = np.array([0.4, -1.2])
+        mean = 1.3
+        coefs = np.concatenate(
+            ([mean], mean * amps * np.cos(phases), mean * amps * np.sin(phases))
+        )
+
+        np.testing.assert_allclose(
+            build_sine_design_matrix(x, freqs) @ coefs,
+            sine_builder(x, amps, freqs, phases, mean),
+        )
+
+
+# =============================================================================
+# Non-uniform DFT Tests
+# =============================================================================
+
+
+class TestNonUniformDFT:
+    def test_quadrature_weights_sum_to_rotation(self):
+        rads = np.sort(np.random.default_rng(0).uniform(0, 2 * np.pi, 50))
+        np.testing.assert_allclose(get_periodic_quadrature_weights(rads).sum(), 2 * np.pi)
+
+    def test_quadrature_weights_halve_duplicated_endpoint(self):
+        rads = np.linspace(0, 2 * np.pi, 5)
+        np.testing.assert_allclose(
+            get_periodic_quadrature_weights(rads), np.pi / 4 * np.array([1, 2, 2, 2, 1])
+        )
+
+    def test_quadrature_weights_keep_input_order(self):
+        rads = np.array([0.0, 1.0, 3.0, 2.0])
+        weights = get_periodic_quadrature_weights(rads)
+        np.testing.assert_allclose(weights[[0, 1, 3, 2]], get_periodic_quadrature_weights(np.sort(rads)))
+
+    def test_exact_degree_integrates_harmonics(self):
+        rads = np.sort(np.random.default_rng(2).uniform(0, 2 * np.pi, 40))
+        weights = get_periodic_quadrature_weights(rads, exact_degree=6)
+
+        for k in range(1, 7):
+            np.testing.assert_allclose(weights @ np.cos(k * rads), 0, atol=1e-12)
+            np.testing.assert_allclose(weights @ np.sin(k * rads), 0, atol=1e-12)
+        np.testing.assert_allclose(weights.sum(), 2 * np.pi)
+
+    def test_matches_rfft_on_uniform_grid(self):
+        from scipy.fft import rfft
+
+        n_points = 64
+        rads = 2 * np.pi * np.arange(n_points) / n_points
+        y = np.random.default_rng(1).normal(size=n_points)
+        freqs = np.arange(1, n_points // 2 + 1)
+
+        np.testing.assert_allclose(
+            y @ build_nudft_matrix(rads, freqs), rfft(y, norm="ortho")[1:], atol=1e-12
+        )
+
 
 # =============================================================================
 # query_dataframe Tests
@@ -161,6 +313,27 @@ class TestQueryDataframe:
         result = query_dataframe(sample_df, t=999.0)
         assert len(result) == 0
 
+    def test_query_by_lists(self, sample_df):
+        result = query_dataframe(
+            sample_df, act=[HEADER_EXPERIMENT_PREFIX + "12"], t=[2.0, 5.0], h=[7.0]
+        )
+        assert list(result["value"]) == [3, 4]
+
+    def test_query_matches_floats_exactly(self, sample_df):
+        sample_df[HEADER_TEMP] = [0.1 + 0.2, 5.0, 2.0, 5.0]
+        result = query_dataframe(sample_df, t=0.1 + 0.2)
+        assert list(result["value"]) == [1]
+        assert len(query_dataframe(sample_df, t=0.3)) == 0
+
+
+class TestBuildQueryMask:
+    def test_no_filter_selects_all(self, sample_df):
+        assert build_query_mask(sample_df).all()
+
+    def test_combined_mask(self, sample_df):
+        mask = build_query_mask(sample_df, act=HEADER_EXPERIMENT_PREFIX + "11", h=3.0)
+        np.testing.assert_array_equal(mask, [True, True, False, False])
+
 
 class TestBuildQueryString:
     def test_act_only(self):
@@ -298,3 +471,55 @@ class TestFormatOscillationKey:
         result = format_oscillation_key(HEADER_EXPERIMENT_PREFIX + "11", 2.0, 3.0)
         # Should contain H or T (Tesla) marker for field
         assert "H" in result or "T" in result
+
+
+# =============================================================================
+# get_file_signature Tests
+# =============================================================================
+
+
+class TestGetFileSignature:
+    def test_signature_keys(self, tmp_path):
+        fp = tmp_path / "data.csv"
+        fp.write_text("a,b\n1,2\n")
+        signature = get_file_signature(fp)
+        assert signature["size"] == fp.stat().st_size
+        assert signature["mtime"] == fp.stat().st_mtime
+        assert len(signature["sha256"]) == 64
+
+    def test_same_content_same_hash(self, tmp_path):
+        fp_a = tmp_path / "a.csv"
+        fp_b = tmp_path / "b.csv"
+        fp_a.write_text("a,b\n1,2\n")
+        fp_b.write_text("a,b\n1,2\n")
+        assert get_file_signature(fp_a)["sha256"] == get_file_signature(fp_b)["sha256"]
+
+    def test_reuses_hash_when_unchanged(self, tmp_path):
+        fp = tmp_path / "data.csv"
+        fp.write_text("a,b\n1,2\n")
+        previous = {**get_file_signature(fp), "sha256": "cached"}
+        assert get_file_signature(fp, previous)["sha256"] == "cached"
+
+    def test_rehashes_when_size_changes(self, tmp_path):
+        fp = tmp_path / "data.csv"
+        fp.write_text("a,b\n1,2\n")
+        previous = {**get_file_signature(fp), "sha256": "cached"}
+        fp.write_text("a,b\n1,2\n3,4\n")
+        assert get_file_signature(fp, previous)["sha256"] != "cached"
+
+
+class TestGetArraysHash:
+    def test_same_arrays_same_hash(self):
+        arrays = {"a": np.arange(5.0), "b": np.array([1, 2])}
+        same = {"b": np.array([1, 2]), "a": np.arange(5.0)}
+        assert get_arrays_hash(arrays) == get_arrays_hash(same)
+
+    def test_changed_values_change_hash(self):
+        arrays = {"a": np.arange(5.0)}
+        changed = {"a": np.arange(5.0) + 1e-12}
+        assert get_arrays_hash(arrays) != get_arrays_hash(changed)
+
+    def test_changed_dtype_changes_hash(self):
+        assert get_arrays_hash({"a": np.zeros(2, int)}) != get_arrays_hash(
+            {"a": np.zeros(2, float)}
+        )